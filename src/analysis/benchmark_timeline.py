@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_timeline.py
+machine_learning.py 의 timeline 변환 속도 비교 (합성 데이터, 티어 1개 크기)
+
+- 기존: iterrows → (경기, 컬럼)마다 dict → groupby().first() → 시간 필터 → groupby().mean()
+- 현재: timeline_to_timebins (컬럼 파싱 1회 + ndarray reshape + time_bin 평균)
+
+기존 구현은 (경기 × 컬럼)개의 dict를 만들어서 티어 전체 크기에서는 메모리가 부족함
+→ 앞쪽 --legacy-matches 경기만 측정하고 경기 수에 비례해 전체 시간 추정.
+
+실행: python -m src.analysis.benchmark_timeline --matches 3000
+"""
+
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.machine_learning import FEATURES, timeline_to_timebins
+
+METRIC_GROUPS = [
+    "gold", "kill", "totalKill", "dragon", "elder", "herald", "baron", "atakhan", "grub",
+    "outerTower", "innerTower", "baseTower", "nexusTower", "inhibitor",
+]
+
+
+# ===============================
+# 합성 timeline (wide)
+# ===============================
+def make_timeline(n_matches, max_minutes=45, seed=0):
+    rng = np.random.default_rng(seed)
+
+    max_minute = rng.integers(15, max_minutes + 1, n_matches)
+    minutes = np.arange(max_minutes + 1)
+    alive = minutes[None, :] <= max_minute[:, None]
+
+    columns = {
+        "matchId": [f"KR_{i}" for i in range(n_matches)],
+        "gameDuration": max_minute * 60 + rng.integers(0, 60, n_matches),
+        "maxMinute": max_minute,
+    }
+
+    for group in METRIC_GROUPS:
+        scale = 40000 if group == "gold" else 10
+        v100 = np.cumsum(rng.integers(0, scale // 10 + 1, (n_matches, len(minutes))), axis=1)
+        v200 = np.cumsum(rng.integers(0, scale // 10 + 1, (n_matches, len(minutes))), axis=1)
+
+        for side, values in (("100", v100), ("200", v200), ("Diff", v100 - v200)):
+            values = np.where(alive, values, np.nan)
+            for m in minutes:
+                columns[f"{group}{side}_{m}"] = values[:, m]
+
+    return pd.DataFrame(columns)
+
+
+# ===============================
+# 기존 구현 (비교 기준)
+# ===============================
+def legacy_wide_to_long(df):
+    rows = []
+
+    for _, row in df.iterrows():
+        match_id = row["matchId"]
+
+        for col in df.columns:
+            if "_" not in col:
+                continue
+
+            base, minute = col.rsplit("_", 1)
+            if not minute.isdigit():
+                continue
+
+            rows.append({
+                "matchId": match_id,
+                "time_min": int(minute),
+                base: row[col]
+            })
+
+    long_df = pd.DataFrame(rows)
+
+    return (
+        long_df
+        .groupby(["matchId", "time_min"], as_index=False)
+        .first()
+    )
+
+
+def legacy_timebins(df):
+    long_df = legacy_wide_to_long(df)
+    long_df = long_df[(long_df["time_min"] >= 10) & (long_df["time_min"] <= 35)].copy()
+    long_df["time_bin"] = (long_df["time_min"] // 5) * 5
+    return long_df.groupby(["matchId", "time_bin"], as_index=False)[FEATURES].mean()
+
+
+# ===============================
+# MAIN
+# ===============================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--matches", type=int, default=3000, help="합성 경기 수 (티어 1개 ≈ 3000)")
+    parser.add_argument("--legacy-matches", type=int, default=300, help="기존 구현 측정 경기 수 (0 = 생략)")
+    args = parser.parse_args()
+
+    df = make_timeline(args.matches)
+    print(f"합성 timeline: {df.shape[0]} 경기 × {df.shape[1]} 컬럼")
+
+    start = time.perf_counter()
+    fast = timeline_to_timebins(df, FEATURES)
+    fast_sec = time.perf_counter() - start
+    print(f"[현재] timeline_to_timebins : {fast_sec:.3f}s")
+
+    if args.legacy_matches:
+        sample = df.iloc[:args.legacy_matches]
+
+        start = time.perf_counter()
+        slow = legacy_timebins(sample)
+        slow_sec = time.perf_counter() - start
+
+        estimated = slow_sec * len(df) / len(sample)
+        print(f"[기존] iterrows + groupby    : {slow_sec:.3f}s ({len(sample)} 경기)"
+              f" → 전체 추정 {estimated:.1f}s")
+
+        pd.testing.assert_frame_equal(
+            timeline_to_timebins(sample, FEATURES).reset_index(drop=True),
+            slow.reset_index(drop=True),
+            check_dtype=False,
+        )
+        print(f"결과 동일 / 속도 약 {estimated / fast_sec:.0f}배")
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+incremental_training.py
+Objective Score 모델 out-of-core 학습 (StandardScaler.partial_fit + SGDClassifier(log_loss).partial_fit)
+
+machine_learning.py 는 전체 티어를 DataFrame 하나로 합쳐서 학습 → 데이터가 커지면 메모리 부족.
+여기서는 timeline CSV를 CHUNK_ROWS 경기씩 읽어서 (time_bin 평균 → X / y) 바로 학습에 사용.
+→ 메모리 = chunk 1개 + win 표 (경기당 matchId 해시 8byte + win 1byte) + 경기당 사용 여부 1byte
+
+- chunk 단위 : 파일마다 CHUNK_ROWS 행 시작 위치(byte offset)를 한 번 색인 → 아무 순서로나 읽기 가능
+               epoch마다 (파일, chunk) 순서를 섞고 chunk 안의 row도 섞음 (티어 순서 편향 없음)
+- 중복 경기 : 한 번 순회하는 동안 matchId당 한 번만 사용 (여러 파일 / chunk에 있어도)
+- 1차 순회 : scaler.partial_fit + 클래스 개수 (class_weight="balanced" 와 같은 가중치 계산용)
+- 2차 순회 : model.partial_fit (EPOCHS 번 반복)
+- 평가     : matchId 해시로 고정된 holdout 경기 (약 30%) → accuracy / log-loss 누적
+
+--update : 저장된 모델을 불러와서 아직 학습하지 않은 경기만 이어서 학습 (전체 재학습 없음)
+           학습한 경기는 matchId 해시(int64)로 모델 파일에 같이 저장
+           scaler는 고정 (기존 계수가 학습된 표준화 기준 유지)
+
+실행:
+    python -m src.analysis.incremental_training
+    python -m src.analysis.incremental_training --update
+"""
+
+import os
+import hashlib
+import argparse
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import log_loss
+
+from src.analysis.machine_learning import (
+    BASE_PATH, TIERS, FEATURES, MIN_MINUTE, MAX_MINUTE, BIN_SIZE, TOWER_DIFF_COLS,
+    tier_files, timeline_to_timebins,
+)
+from src.analysis.objective_score import MODEL_DIR, save_artifact
+
+MODEL_PATH = os.path.join(MODEL_DIR, "objective_sgd.joblib")
+
+CHUNK_ROWS = 20000      # timeline CSV 한 번에 읽는 경기 수
+EPOCHS = 5              # SGD 반복 횟수
+
+TEST_PERCENT = 30       # holdout 경기 비율 (matchId 해시 % 100)
+
+CLASSES = np.array([0, 1])
+
+RANDOM_STATE = 42
+
+
+# ===============================
+# 1. chunk 단위 (X, y)
+# ===============================
+def match_keys(match_ids):
+    """matchId → int64 해시 (holdout 분할 / 학습한 경기 기록용)"""
+    return np.array(
+        [
+            int.from_bytes(hashlib.blake2b(str(m).encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+            for m in match_ids
+        ],
+        dtype=np.int64,
+    )
+
+
+class WinTable:
+    """matchId 해시 (정렬) → team100 승리 여부, 경기당 9byte"""
+
+    def __init__(self, keys, wins):
+        self.keys = keys
+        self.wins = wins
+
+    def __len__(self):
+        return len(self.keys)
+
+    def lookup(self, keys):
+        """(위치, 있음 여부) — 위치는 used 배열 인덱스로도 사용"""
+        pos = np.searchsorted(self.keys, keys)
+        pos = np.minimum(pos, max(len(self.keys) - 1, 0))
+        found = self.keys[pos] == keys if len(self.keys) else np.zeros(len(keys), dtype=bool)
+        return pos, found
+
+
+def build_win_table(match_files):
+    """matches CSV → WinTable (경기별 첫 row = team100), 필요한 컬럼만 파일 하나씩 읽음"""
+    keys, wins = [], []
+    for path in match_files:
+        df = pd.read_csv(path, usecols=["matchId", "win"]).drop_duplicates("matchId")
+        keys.append(match_keys(df["matchId"]))
+        wins.append(df["win"].to_numpy(dtype=np.int8))
+
+    if not keys:
+        return WinTable(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int8))
+
+    keys, wins = np.concatenate(keys), np.concatenate(wins)
+    keys, first = np.unique(keys, return_index=True)
+    return WinTable(keys, wins[first])
+
+
+def chunk_units(timeline_files, chunk_rows=CHUNK_ROWS):
+    """파일마다 CHUNK_ROWS 행 단위 시작 위치 색인 → [(path, columns, offset, nrows)]"""
+    units = []
+    for path in timeline_files:
+        columns = pd.read_csv(path, nrows=0).columns.tolist()
+
+        with open(path, "rb") as f:
+            f.readline()    # 헤더
+            offset, rows = f.tell(), 0
+            for line in iter(f.readline, b""):
+                if rows == 0:
+                    start = offset
+                rows += 1
+                offset += len(line)
+                if rows == chunk_rows:
+                    units.append((path, columns, start, rows))
+                    rows = 0
+            if rows:
+                units.append((path, columns, start, rows))
+
+    return units
+
+
+def read_unit(unit):
+    path, columns, offset, nrows = unit
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return pd.read_csv(f, header=None, names=columns, nrows=nrows)
+
+
+def collect_inputs(base_path=BASE_PATH, tiers=TIERS, chunk_rows=CHUNK_ROWS):
+    """(chunk 단위 목록, WinTable) — 같은 파일이 여러 티어 glob에 걸려도 한 번만"""
+    timeline_files, match_files = set(), set()
+    for tier in tiers:
+        t_files, m_files = tier_files(base_path, tier)
+        if t_files and m_files:
+            timeline_files.update(t_files)
+            match_files.update(m_files)
+
+    return chunk_units(sorted(timeline_files), chunk_rows), build_win_table(sorted(match_files))
+
+
+def iter_chunks(units, win_table, split="train", skip=None, rng=None):
+    """
+    (keys, X, y) 반복자
+    split="train" / "test" : matchId 해시 기준 holdout 분할
+    skip : 건너뛸 경기 해시 (이미 학습한 경기)
+    rng  : 있으면 chunk 순서 / chunk 안 row 순서를 섞음
+    """
+    order = rng.permutation(len(units)) if rng is not None else range(len(units))
+    used = np.zeros(len(win_table), dtype=bool)     # 이번 순회에서 이미 사용한 경기
+
+    for i in order:
+        binned = timeline_to_timebins(read_unit(units[i]), FEATURES, MIN_MINUTE, MAX_MINUTE, BIN_SIZE)
+        if binned.empty:
+            continue
+
+        keys = match_keys(binned["matchId"])
+        pos, found = win_table.lookup(keys)
+
+        mask = found & ~used[pos]
+        mask &= (keys % 100 < TEST_PERCENT) == (split == "test")
+        if skip is not None and len(skip):
+            mask &= ~np.isin(keys, skip)
+        if not mask.any():
+            continue
+
+        used[pos[mask]] = True
+
+        binned = binned[mask].copy()
+        binned[TOWER_DIFF_COLS] = -binned[TOWER_DIFF_COLS]
+
+        X = binned[FEATURES].fillna(0).to_numpy(dtype=np.float64)
+        y = win_table.wins[pos[mask]]
+        keys = keys[mask]
+
+        if rng is not None:
+            perm = rng.permutation(len(y))
+            keys, X, y = keys[perm], X[perm], y[perm]
+
+        yield keys, X, y
+
+
+# ===============================
+# 2. 학습 / 평가
+# ===============================
+def new_state():
+    return {
+        "features": FEATURES,
+        "params": {"window": [MIN_MINUTE, MAX_MINUTE], "bin_size": BIN_SIZE, "flip": TOWER_DIFF_COLS},
+        "scaler": StandardScaler(),
+        "model": SGDClassifier(loss="log_loss", random_state=RANDOM_STATE),
+        "class_counts": np.zeros(len(CLASSES), dtype=np.int64),
+        "seen": np.empty(0, dtype=np.int64),
+        "n_rows": 0,
+    }
+
+
+def train(state, base_path=BASE_PATH, tiers=TIERS, chunk_rows=CHUNK_ROWS, epochs=EPOCHS):
+    """
+    state의 scaler / model을 아직 학습하지 않은 경기로 이어서 학습 (새 state면 처음부터)
+    이미 학습한 state (--update) → scaler 고정, 클래스 개수 / model만 갱신
+    """
+    scaler, model = state["scaler"], state["model"]
+    seen = state["seen"]
+    fit_scaler = state["n_rows"] == 0
+
+    units, win_table = collect_inputs(base_path, tiers, chunk_rows)
+
+    # -------------------------------
+    # 1차: scaler / 클래스 개수 / 새 경기
+    # -------------------------------
+    new_keys = []
+    n_rows = 0
+    for keys, X, y in iter_chunks(units, win_table, "train", seen):
+        if fit_scaler:
+            scaler.partial_fit(X)
+        state["class_counts"] += np.bincount(y, minlength=len(CLASSES))
+        new_keys.append(np.unique(keys))
+        n_rows += len(y)
+
+    if not n_rows:
+        print("[TRAIN] 새 경기 없음 → 건너뜀")
+        return state
+
+    print(f"[TRAIN] 새 row: {n_rows:,} / 새 경기: {sum(len(k) for k in new_keys):,}")
+
+    # class_weight="balanced" 와 같은 가중치 (지금까지 학습한 전체 기준)
+    counts = state["class_counts"]
+    weights = counts.sum() / (len(CLASSES) * np.maximum(counts, 1))
+
+    # -------------------------------
+    # 2차: SGD partial_fit (epoch마다 chunk / row 순서 섞기)
+    # -------------------------------
+    rng = np.random.default_rng(RANDOM_STATE + len(seen))
+    for epoch in range(epochs):
+        for _, X, y in iter_chunks(units, win_table, "train", seen, rng):
+            model.partial_fit(scaler.transform(X), y, classes=CLASSES, sample_weight=weights[y])
+        print(f"[TRAIN] epoch {epoch + 1}/{epochs}")
+
+    state["seen"] = np.union1d(seen, np.concatenate(new_keys))
+    state["n_rows"] += n_rows
+    return state
+
+
+def evaluate(state, base_path=BASE_PATH, tiers=TIERS, chunk_rows=CHUNK_ROWS):
+    """holdout 경기 accuracy / log-loss (chunk마다 누적)"""
+    scaler, model = state["scaler"], state["model"]
+    units, win_table = collect_inputs(base_path, tiers, chunk_rows)
+
+    n, correct, loss = 0, 0, 0.0
+    for _, X, y in iter_chunks(units, win_table, "test"):
+        proba = model.predict_proba(scaler.transform(X))
+        correct += int((proba.argmax(axis=1) == y).sum())
+        loss += log_loss(y, proba, labels=CLASSES, normalize=False)
+        n += len(y)
+
+    if not n:
+        return None
+    return {"rows": n, "accuracy": correct / n, "log_loss": loss / n}
+
+
+def save_state(state, path=MODEL_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    joblib.dump(state, tmp_path)
+    os.replace(tmp_path, path)
+    print(f"[SAVE] Model saved to: {path}")
+
+
+def load_state(path=MODEL_PATH):
+    state = joblib.load(path)
+    if state["features"] != FEATURES:
+        raise ValueError(f"FEATURES가 저장된 모델과 다릅니다: {path}")
+    return state
+
+
+# ===============================
+# MAIN
+# ===============================
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--update", action="store_true", help="저장된 모델에 새 경기만 이어서 학습")
+    parser.add_argument("--model", default=MODEL_PATH, help="모델 파일 경로")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="한 번에 읽는 경기 수")
+    parser.add_argument("--epochs", type=int, default=EPOCHS, help="SGD 반복 횟수")
+    parser.add_argument("--base-path", default=BASE_PATH, help="입력 CSV 디렉터리 (data/processed)")
+    args = parser.parse_args()
+
+    if args.update and os.path.exists(args.model):
+        state = load_state(args.model)
+        print(f"\n[LOAD] Model: {args.model} (학습한 경기 {len(state['seen']):,})")
+    else:
+        state = new_state()
+
+    state = train(state, args.base_path, chunk_rows=args.chunk_rows, epochs=args.epochs)
+    if not state["n_rows"]:
+        return
+
+    save_state(state, args.model)
+    save_artifact(
+        state["scaler"], state["model"], FEATURES, TOWER_DIFF_COLS,
+        path=os.path.splitext(args.model)[0] + ".json",
+        model_type="SGDClassifier",
+        trained_rows=int(state["n_rows"]),
+    )
+
+    result = evaluate(state, args.base_path, chunk_rows=args.chunk_rows)
+    if result:
+        print("\n=== Holdout ===")
+        print(f"rows    : {result['rows']:,}")
+        print(f"accuracy: {result['accuracy']:.4f}")
+        print(f"log-loss: {result['log_loss']:.4f}")
+
+    importance_df = pd.DataFrame({
+        "feature": FEATURES,
+        "coef": state["model"].coef_[0]
+    })
+    importance_df["abs_coef"] = importance_df["coef"].abs()
+    importance_df = importance_df.sort_values("abs_coef", ascending=False)
+
+    print("\n=== Feature Importance (team100 기준) ===")
+    print(importance_df)
+
+
+if __name__ == "__main__":
+    main()
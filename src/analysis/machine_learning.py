@@ -1,5 +1,8 @@
 import os
+import re
 import glob
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 
@@ -8,15 +11,18 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score, classification_report
 
+from src.utils.dataset import LONG_TIMELINE_SUFFIX
+from src.utils.feature_snapshot import load_or_build
+from src.analysis.objective_score import ROOT_DIR, save_artifact
+
 
 # ===============================
 # 0. 설정
 # ===============================
-BASE_PATH = r"C:\dev\LOL_Tier_Winrate_Analysis\data\processed"
+BASE_PATH = os.path.join(ROOT_DIR, "data", "processed")
 
-TEMP_DIR = r"C:\dev\LOL_Tier_Winrate_Analysis\data\temp"
-TEMP_DF_PATH = os.path.join(TEMP_DIR, "final_df_timebin_team100.csv")
-os.makedirs(TEMP_DIR, exist_ok=True)
+# {ROOT_DIR}/data/temp/snapshots/{fingerprint}/
+SNAPSHOT_DIR = os.path.join(ROOT_DIR, "data", "temp", "snapshots")
 
 TIERS = [
     "IRON", "BRONZE", "SILVER", "GOLD",
@@ -38,186 +44,312 @@ FEATURES = [
     "baseTowerDiff",
 ]
 
+MIN_MINUTE = 10
+MAX_MINUTE = 35
+BIN_SIZE = 5
+
+MAX_WORKERS = os.cpu_count() or 1      # 티어별 DF 생성 프로세스 수
+
+# tower diff 부호 반전 (수집 오류 보정)
+TOWER_DIFF_COLS = [
+    "outerTowerDiff",
+    "innerTowerDiff",
+    "baseTowerDiff",
+]
+
 
 # ===============================
-# 1. timeline wide → long
+# 1. timeline wide → long / time_bin
 # ===============================
-def timeline_wide_to_long(df: pd.DataFrame) -> pd.DataFrame:
-    rows = []
+MINUTE_COL = re.compile(r"^(.+)_(\d+)$")
 
-    for _, row in df.iterrows():
-        match_id = row["matchId"]
 
-        for col in df.columns:
-            if "_" not in col:
-                continue
+def parse_minute_columns(columns):
+    """컬럼 이름 한 번만 파싱 → {metric: {minute: column}}"""
+    by_metric = {}
+    for col in columns:
+        m = MINUTE_COL.match(col)
+        if m:
+            by_metric.setdefault(m.group(1), {})[int(m.group(2))] = col
+    return by_metric
 
-            base, minute = col.rsplit("_", 1)
-            if not minute.isdigit():
-                continue
 
-            rows.append({
-                "matchId": match_id,
-                "time_min": int(minute),
-                base: row[col]
-            })
+def _unique_matches(df: pd.DataFrame) -> pd.DataFrame:
+    # 같은 matchId가 여러 파일에 있으면 컬럼별 첫 non-null 값 (기존 groupby().first()와 동일)
+    if df["matchId"].duplicated().any():
+        return df.groupby("matchId", sort=True, as_index=False).first()
+    return df.sort_values("matchId", kind="stable").reset_index(drop=True)
 
-    long_df = pd.DataFrame(rows)
 
-    long_df = (
-        long_df
-        .groupby(["matchId", "time_min"], as_index=False)
-        .first()
-    )
+def timeline_wide_to_long(df: pd.DataFrame) -> pd.DataFrame:
+    """(matchId, time_min, metric...) long 형식, metric별 (경기 × 분) 배열을 한 번에 펼침"""
+    wide = _unique_matches(df)
+    by_metric = parse_minute_columns(wide.columns)
+    minutes = sorted({m for cols in by_metric.values() for m in cols})
+
+    long_df = pd.DataFrame({
+        "matchId": np.repeat(wide["matchId"].to_numpy(), len(minutes)),
+        "time_min": np.tile(minutes, len(wide)),
+    })
+
+    for metric, cols in by_metric.items():
+        values = wide.reindex(columns=[cols.get(m) for m in minutes]).to_numpy(dtype=float)
+        long_df[metric] = values.reshape(-1)
 
     return long_df
 
 
+def timeline_to_timebins(
+    df: pd.DataFrame, features, min_minute=10, max_minute=35, bin_size=5
+) -> pd.DataFrame:
+    """
+    wide timeline → (matchId, time_bin, feature 평균)
+    long 변환 / 시간 필터 / time_bin 평균을 ndarray 한 번으로 처리 (NaN 제외 평균)
+    """
+    wide = _unique_matches(df)
+    by_metric = parse_minute_columns(wide.columns)
+
+    minutes = sorted({
+        m for cols in by_metric.values() for m in cols if min_minute <= m <= max_minute
+    })
+    bins = (np.asarray(minutes, dtype=np.int64) // bin_size) * bin_size
+    time_bins, starts = np.unique(bins, return_index=True)
+
+    n_matches, n_bins = len(wide), len(time_bins)
+
+    result = pd.DataFrame({
+        "matchId": np.repeat(wide["matchId"].to_numpy(), n_bins),
+        "time_bin": np.tile(time_bins, n_matches),
+    })
+
+    for feature in features:
+        cols = by_metric.get(feature, {})
+        values = wide.reindex(columns=[cols.get(m) for m in minutes]).to_numpy(dtype=float)
+
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=1) if n_bins else values
+        counts = np.add.reduceat(valid, starts, axis=1) if n_bins else valid
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[feature] = (sums / counts).reshape(-1)
+
+    return result
+
+
 # ===============================
-# 2. DF 캐시 로딩 or 생성
+# 2. DF 생성 / 스냅샷 로딩
 # ===============================
-if os.path.exists(TEMP_DF_PATH):
-    print(f"\n[LOAD] Cached DF: {TEMP_DF_PATH}")
-    df = pd.read_csv(TEMP_DF_PATH)
+def tier_files(base_path, tier):
+    """(timeline 파일, match 파일), long 형식 timeline CSV는 제외"""
+    timeline_files = [
+        f for f in glob.glob(f"{base_path}/*{tier}*timeline*.csv")
+        if not f.endswith(LONG_TIMELINE_SUFFIX)
+    ]
+    match_files = glob.glob(f"{base_path}/*{tier}*matches*.csv")
+    return timeline_files, match_files
 
-else:
-    print("\n[BUILD] Creating DF from raw CSVs...")
-    dfs = []
 
-    for tier in TIERS:
-        timeline_files = glob.glob(f"{BASE_PATH}/*{tier}*timeline*.csv")
-        match_files    = glob.glob(f"{BASE_PATH}/*{tier}*matches*.csv")
+def build_tier_arrays(base_path, tier):
+    """
+    티어 1개: glob → CSV 읽기 → time_bin 평균 → win 조인 (프로세스 풀에서 실행)
+    DataFrame 대신 작은 ndarray dict 반환 (pickle 크기 / 속도)
+    """
+    timeline_files, match_files = tier_files(base_path, tier)
+    result = {"tier": tier, "timeline_files": timeline_files, "match_files": match_files}
 
-        print("\n==============================")
-        print("TIER:", tier)
-        print("timeline_files:", timeline_files)
-        print("match_files   :", match_files)
+    if not timeline_files or not match_files:
+        return result
 
-        if not timeline_files or not match_files:
-            print(">> SKIP")
-            continue
+    # timeline → (matchId, time_bin) 평균 (10~35분, 5분 단위)
+    timeline_df = pd.concat([pd.read_csv(f) for f in timeline_files])
+    binned = timeline_to_timebins(timeline_df, FEATURES, MIN_MINUTE, MAX_MINUTE, BIN_SIZE)
 
-        # timeline
-        timeline_df = pd.concat([pd.read_csv(f) for f in timeline_files])
-        long_df = timeline_wide_to_long(timeline_df)
+    # match result (team100 기준: 경기별 첫 row)
+    matches_df = pd.concat([pd.read_csv(f, usecols=["matchId", "win"]) for f in match_files])
+    win = matches_df.groupby("matchId", sort=False)["win"].first()
 
-        # match result (team100 기준)
-        matches_df = pd.concat([pd.read_csv(f) for f in match_files])
-        matches_df = matches_df[["matchId", "win"]].copy()
-        matches_df["tier"] = tier
+    binned = binned[binned["matchId"].isin(win.index)]
 
-        merged = long_df.merge(matches_df, on="matchId", how="inner")
-        dfs.append(merged)
+    result.update({
+        "match_id": binned["matchId"].to_numpy(dtype=str),
+        "time_bin": binned["time_bin"].to_numpy(dtype=np.int16),
+        "X": binned[FEATURES].to_numpy(dtype=np.float64),
+        "win": binned["matchId"].map(win).to_numpy(dtype=np.int8),
+    })
+    return result
 
-    raw_df = pd.concat(dfs, ignore_index=True)
 
-    # -------------------------------
-    # 시간 필터 + time_bin
-    # -------------------------------
-    raw_df = raw_df[(raw_df["time_min"] >= 10) & (raw_df["time_min"] <= 35)]
-    raw_df["time_bin"] = (raw_df["time_min"] // 5) * 5
+def build_timebin_df(base_path=BASE_PATH, tiers=TIERS, workers=None) -> pd.DataFrame:
+    """티어별 작업을 프로세스 풀에 나눠서 실행 → 배열 합치기 (workers=1 이면 순서대로)"""
+    print("\n[BUILD] Creating DF from raw CSVs...")
+    workers = min(workers or MAX_WORKERS, len(tiers))
 
-    # -------------------------------
-    # matchId + time_bin 기준 집계
-    # win은 절대 평균내지 않음
-    # -------------------------------
-    df_feat = (
-        raw_df
-        .groupby(["matchId", "time_bin", "tier"], as_index=False)[FEATURES]
-        .mean()
-    )
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(build_tier_arrays, [base_path] * len(tiers), tiers))
+    else:
+        results = [build_tier_arrays(base_path, tier) for tier in tiers]
 
-    df_win = (
-        raw_df
-        .groupby(["matchId", "time_bin", "tier"], as_index=False)["win"]
-        .first()   # team100 기준 승패
-    )
+    parts = []
+    for result in results:
+        print("\n==============================")
+        print("TIER:", result["tier"])
+        print("timeline_files:", result["timeline_files"])
+        print("match_files   :", result["match_files"])
 
-    df = df_feat.merge(df_win, on=["matchId", "time_bin", "tier"])
+        if "X" not in result:
+            print(">> SKIP")
+            continue
+        parts.append(result)
+
+    df = pd.DataFrame({
+        "matchId": np.concatenate([r["match_id"] for r in parts]).astype(object),
+        "time_bin": np.concatenate([r["time_bin"] for r in parts]).astype(np.int64),
+        "tier": np.repeat([r["tier"] for r in parts], [len(r["win"]) for r in parts]).astype(object),
+    })
+    features = pd.DataFrame(np.concatenate([r["X"] for r in parts]), columns=FEATURES)
+    df = pd.concat([df, features], axis=1)
+    df["win"] = np.concatenate([r["win"] for r in parts]).astype(np.int64)
+
+    df = (
+        df.sort_values(["matchId", "time_bin", "tier"], kind="stable")
+        .reset_index(drop=True)
+    )
 
     # -------------------------------
     # tower diff 부호 반전 (수집 오류 보정)
     # -------------------------------
-    TOWER_DIFF_COLS = [
-        "outerTowerDiff",
-        "innerTowerDiff",
-        "baseTowerDiff",
-    ]
-
     df[TOWER_DIFF_COLS] = -df[TOWER_DIFF_COLS]
 
     # NaN 안전 처리
     df[FEATURES] = df[FEATURES].fillna(0)
 
+    return df
 
-    # 캐시 저장
-    df.to_csv(TEMP_DF_PATH, index=False)
-    print(f"[SAVE] Cached DF saved to: {TEMP_DF_PATH}")
 
-print("\nFINAL DF SHAPE:", df.shape)
-print(df.head())
+def snapshot_params(tiers=TIERS):
+    """fingerprint에 들어가는 설정 (바뀌면 스냅샷 다시 생성)"""
+    return {
+        "tiers": list(tiers),
+        "features": FEATURES,
+        "window": [MIN_MINUTE, MAX_MINUTE],
+        "bin_size": BIN_SIZE,
+        "flip": TOWER_DIFF_COLS,
+    }
 
 
-# ===============================
-# 3. 머신러닝 (team100 승률 예측)
-# ===============================
-X = df[FEATURES]
-y = df["win"]    # team100 승리 여부 (0 / 1)
+def load_snapshot(base_path=BASE_PATH, tiers=TIERS, root=SNAPSHOT_DIR):
+    """입력 CSV / 설정 fingerprint가 같으면 memmap 스냅샷, 다르면 build_timebin_df → 저장"""
+    paths = set()
+    for tier in tiers:
+        timeline_files, match_files = tier_files(base_path, tier)
+        paths.update(timeline_files)
+        paths.update(match_files)
 
-X_train, X_test, y_train, y_test = train_test_split(
-    X,
-    y,
-    test_size=0.3,
-    random_state=42,
-    stratify=y
-)
+    def build():
+        df = build_timebin_df(base_path, tiers)
+        tier_codes = {tier: i for i, tier in enumerate(tiers)}
 
-scaler = StandardScaler()
-X_train_z = scaler.fit_transform(X_train)
-X_test_z  = scaler.transform(X_test)
+        arrays = {
+            "X": df[FEATURES].to_numpy(dtype=np.float64),
+            "y": df["win"].to_numpy(dtype=np.int8),
+            "time_bin": df["time_bin"].to_numpy(dtype=np.int16),
+            "tier": df["tier"].map(tier_codes).to_numpy(dtype=np.int8),
+            "match_id": df["matchId"].to_numpy(dtype=str),
+        }
+        return arrays, {"features": FEATURES, "tiers": list(tiers)}
 
-model = LogisticRegression(
-    max_iter=1000,
-    class_weight="balanced"
-)
+    return load_or_build(root, sorted(paths), snapshot_params(tiers), build)
 
-model.fit(X_train_z, y_train)
 
-y_pred = model.predict(X_test_z)
+def load_timebin_df() -> pd.DataFrame:
+    return load_snapshot().to_frame()
 
-print("\n=== Accuracy ===")
-print(accuracy_score(y_test, y_pred))
 
-print("\n=== Classification Report ===")
-print(classification_report(y_test, y_pred))
+def main():
+    snapshot = load_snapshot()
 
+    print("\nFINAL DF SHAPE:", (len(snapshot), len(FEATURES) + 4))
+    print(snapshot.to_frame().head())
 
-# ===============================
-# 4. Feature Importance (해설 핵심)
-# ===============================
-importance_df = pd.DataFrame({
-    "feature": FEATURES,
-    "coef": model.coef_[0]
-})
+    # ===============================
+    # 3. 머신러닝 (team100 승률 예측)
+    # ===============================
+    X = np.asarray(snapshot.X)
+    y = np.asarray(snapshot.y)    # team100 승리 여부 (0 / 1)
 
-importance_df["abs_coef"] = importance_df["coef"].abs()
-importance_df = importance_df.sort_values("abs_coef", ascending=False)
+    train_idx, test_idx = train_test_split(
+        np.arange(len(y)),
+        test_size=0.3,
+        random_state=42,
+        stratify=y
+    )
+    X_train, X_test = X[train_idx], X[test_idx]
+    y_train, y_test = y[train_idx], y[test_idx]
 
-print("\n=== Feature Importance (team100 기준) ===")
-print(importance_df)
+    scaler = StandardScaler()
+    X_train_z = scaler.fit_transform(X_train)
+    X_test_z  = scaler.transform(X_test)
 
+    model = LogisticRegression(
+        max_iter=1000,
+        class_weight="balanced"
+    )
 
-# ===============================
-# 5. objective score & 예측 승률
-# ===============================
-test_df = df.loc[X_test.index].copy()
+    model.fit(X_train_z, y_train)
+
+    y_pred = model.predict(X_test_z)
+
+    print("\n=== Accuracy ===")
+    print(accuracy_score(y_test, y_pred))
+
+    print("\n=== Classification Report ===")
+    print(classification_report(y_test, y_pred))
+
+
+    # ===============================
+    # 4. Feature Importance (해설 핵심)
+    # ===============================
+    importance_df = pd.DataFrame({
+        "feature": FEATURES,
+        "coef": model.coef_[0]
+    })
+
+    importance_df["abs_coef"] = importance_df["coef"].abs()
+    importance_df = importance_df.sort_values("abs_coef", ascending=False)
+
+    print("\n=== Feature Importance (team100 기준) ===")
+    print(importance_df)
+
+    # 모델 파일 (scaler 평균 / 표준편차 + 계수) → objective_score.ObjectiveScorer
+    save_artifact(
+        scaler, model, FEATURES, TOWER_DIFF_COLS,
+        model_type="LogisticRegression",
+        trained_rows=int(len(y_train)),
+        accuracy=float(accuracy_score(y_test, y_pred)),
+        snapshot=snapshot.fingerprint,
+    )
+
+
+    # ===============================
+    # 5. objective score & 예측 승률
+    # ===============================
+    test_df = pd.DataFrame({
+        "matchId": snapshot.match_id[test_idx],
+        "time_bin": snapshot.time_bin[test_idx],
+        "tier": snapshot.tier_names()[test_idx],
+    })
+
+    test_df["objective_score"] = model.decision_function(X_test_z)
+    test_df["predicted_winrate"] = model.predict_proba(X_test_z)[:, 1]
+
+    print("\nSample result:")
+    print(
+        test_df[
+            ["matchId", "time_bin", "tier", "objective_score", "predicted_winrate"]
+        ].head()
+    )
 
-test_df["objective_score"] = model.decision_function(X_test_z)
-test_df["predicted_winrate"] = model.predict_proba(X_test_z)[:, 1]
 
-print("\nSample result:")
-print(
-    test_df[
-        ["matchId", "time_bin", "tier", "objective_score", "predicted_winrate"]
-    ].head()
-)
+if __name__ == "__main__":
+    main()
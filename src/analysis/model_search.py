@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+model_search.py
+Objective Score 모델 비교 (모델 × time_bin × 티어 × fold) → 리더보드
+
+- 입력: machine_learning.load_snapshot() 스냅샷 (X / y / time_bin / tier memmap)
+- 표준화한 X_z.npy / fold_{FOLDS}.npy 를 스냅샷 디렉터리(search/)에 한 번만 저장
+  → worker 프로세스는 memmap으로 열어서 사용 (큰 배열 pickle 없음)
+  · X_z 는 전체 row 기준 StandardScaler (fold별 재학습 없음, 평균 / 분산만 공유)
+- fold = matchId 해시 % FOLDS → 같은 경기의 time_bin row는 항상 같은 fold
+- 구간: time_bin (all + 5분 단위) × 티어 (all + 티어별)
+- 모델: logreg (기존 LogisticRegression 설정) / sgd / hgb (HistGradientBoosting)
+- worker 안의 BLAS / OpenMP 스레드는 1개로 제한 (병렬은 프로세스 단위로만, cpu_count² 스레드 방지)
+
+결과 (data/analysis/model_search/):
+- fold_results.csv : 작업 1개 = 1행 (accuracy / log-loss / fit 시간)
+- leaderboard.csv  : (모델, time_bin, 티어)별 fold 평균, 구간마다 log-loss 오름차순
+
+실행: python -m src.analysis.model_search --models logreg hgb --folds 5
+"""
+
+import os
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.metrics import accuracy_score, log_loss
+
+from src.analysis.machine_learning import ROOT_DIR, BASE_PATH, load_snapshot
+
+OUTPUT_DIR = os.path.join(ROOT_DIR, "data", "analysis", "model_search")
+
+FOLDS = 5
+MAX_WORKERS = os.cpu_count() or 1
+
+ALL = "all"
+
+MODELS = {
+    "logreg": lambda: LogisticRegression(max_iter=1000, class_weight="balanced"),
+    "sgd": lambda: SGDClassifier(loss="log_loss", class_weight="balanced", random_state=42),
+    "hgb": lambda: HistGradientBoostingClassifier(class_weight="balanced", random_state=42),
+}
+
+
+# ===============================
+# 1. 표준화 배열 / fold 캐시
+# ===============================
+def fold_ids(match_ids, n_folds):
+    """matchId 해시 → fold 번호 (경기 단위 고정)"""
+    return np.array(
+        [
+            int.from_bytes(hashlib.blake2b(str(m).encode("utf-8"), digest_size=8).digest(), "little")
+            % n_folds
+            for m in match_ids
+        ],
+        dtype=np.int8,
+    )
+
+
+def prepare_search_arrays(snapshot, n_folds=FOLDS):
+    """스냅샷 디렉터리/search/ 에 X_z.npy, fold_{n}.npy 저장 (이미 있으면 재사용)"""
+    search_dir = os.path.join(snapshot.path, "search")
+    os.makedirs(search_dir, exist_ok=True)
+
+    xz_path = os.path.join(search_dir, "X_z.npy")
+    if not os.path.exists(xz_path):
+        X_z = StandardScaler().fit_transform(np.asarray(snapshot.X))
+        np.save(xz_path + ".tmp.npy", X_z)
+        os.replace(xz_path + ".tmp.npy", xz_path)
+
+    fold_path = os.path.join(search_dir, f"fold_{n_folds}.npy")
+    if not os.path.exists(fold_path):
+        unique_ids, inverse = np.unique(np.asarray(snapshot.match_id), return_inverse=True)
+        np.save(fold_path + ".tmp.npy", fold_ids(unique_ids, n_folds)[inverse])
+        os.replace(fold_path + ".tmp.npy", fold_path)
+
+    return search_dir
+
+
+# ===============================
+# 2. worker (프로세스마다 memmap 1번만 열기)
+# ===============================
+_ARRAYS = {}
+_THREAD_LIMITS = None
+
+
+def _init_worker(snapshot_path, search_dir, n_folds):
+    global _THREAD_LIMITS
+    # HistGradientBoosting (OpenMP) / BLAS 가 worker마다 cpu_count개 스레드를 쓰지 않도록
+    _THREAD_LIMITS = threadpool_limits(limits=1)
+
+    _ARRAYS["X_z"] = np.load(os.path.join(search_dir, "X_z.npy"), mmap_mode="r")
+    _ARRAYS["fold"] = np.load(os.path.join(search_dir, f"fold_{n_folds}.npy"), mmap_mode="r")
+    for name in ["y", "time_bin", "tier"]:
+        _ARRAYS[name] = np.load(os.path.join(snapshot_path, f"{name}.npy"), mmap_mode="r")
+
+
+def run_job(job):
+    """(모델, time_bin, 티어 코드, fold) 1개 학습 / 평가 → 결과 dict (학습 불가 구간은 None)"""
+    model_name, time_bin, tier_code, fold = job
+
+    segment = np.ones(len(_ARRAYS["y"]), dtype=bool)
+    if time_bin != ALL:
+        segment &= _ARRAYS["time_bin"] == time_bin
+    if tier_code != ALL:
+        segment &= _ARRAYS["tier"] == tier_code
+
+    is_test = _ARRAYS["fold"] == fold
+    train_idx = np.flatnonzero(segment & ~is_test)
+    test_idx = np.flatnonzero(segment & is_test)
+
+    y_train = np.asarray(_ARRAYS["y"][train_idx])
+    y_test = np.asarray(_ARRAYS["y"][test_idx])
+    if len(test_idx) == 0 or len(np.unique(y_train)) < 2:
+        return None
+
+    model = MODELS[model_name]()
+
+    start = time.perf_counter()
+    model.fit(_ARRAYS["X_z"][train_idx], y_train)
+    fit_time = time.perf_counter() - start
+
+    proba = model.predict_proba(_ARRAYS["X_z"][test_idx])[:, 1]
+
+    return {
+        "model": model_name,
+        "time_bin": time_bin,
+        "tier": tier_code,
+        "fold": fold,
+        "n_train": len(train_idx),
+        "n_test": len(test_idx),
+        "accuracy": accuracy_score(y_test, proba >= 0.5),
+        "log_loss": log_loss(y_test, proba, labels=[0, 1]),
+        "fit_time": fit_time,
+    }
+
+
+# ===============================
+# 3. 작업 분배 / 리더보드
+# ===============================
+def make_jobs(models, time_bins, tier_codes, n_folds):
+    return [
+        (model_name, time_bin, tier_code, fold)
+        for time_bin in [ALL, *time_bins]
+        for tier_code in [ALL, *tier_codes]
+        for model_name in models
+        for fold in range(n_folds)
+    ]
+
+
+def make_leaderboard(results: pd.DataFrame) -> pd.DataFrame:
+    keys = ["time_bin", "tier", "model"]
+    board = (
+        results.groupby(keys, sort=False)
+        .agg(
+            folds=("fold", "count"),
+            n_rows=("n_test", "sum"),
+            accuracy=("accuracy", "mean"),
+            accuracy_std=("accuracy", "std"),
+            log_loss=("log_loss", "mean"),
+            fit_time=("fit_time", "mean"),
+        )
+        .reset_index()
+    )
+    segment = board.groupby(["time_bin", "tier"], sort=False)
+    board["rank"] = segment["log_loss"].rank(method="first").astype(int)
+
+    # 구간 순서 (results 순서) 유지, 구간 안에서는 log-loss 오름차순
+    board["segment"] = segment.ngroup()
+    return board.sort_values(["segment", "rank"]).drop(columns="segment").reset_index(drop=True)
+
+
+def search(models=tuple(MODELS), n_folds=FOLDS, workers=None, output_dir=OUTPUT_DIR, base_path=BASE_PATH):
+    snapshot = load_snapshot(base_path)
+    search_dir = prepare_search_arrays(snapshot, n_folds)
+
+    time_bins = sorted(int(b) for b in np.unique(snapshot.time_bin))
+    tier_codes = sorted(int(t) for t in np.unique(snapshot.tier))
+    jobs = make_jobs(models, time_bins, tier_codes, n_folds)
+
+    workers = min(workers or MAX_WORKERS, len(jobs))
+    print(f"\n[SEARCH] 작업 {len(jobs):,}개 / worker {workers}개")
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(snapshot.path, search_dir, n_folds),
+    ) as pool:
+        futures = {pool.submit(run_job, job): job for job in jobs}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  [ERROR] {futures[future]}: {e!r}")
+                continue
+            if result is not None:
+                results.append(result)
+            if done % 100 == 0 or done == len(jobs):
+                print(f"  {done:,}/{len(jobs):,} ({time.perf_counter() - start:.1f}s)")
+
+    if not results:
+        print("[SEARCH] 결과 없음 (모든 작업이 실패했거나 학습 가능한 구간 없음)")
+        return None
+
+    # all 구간 먼저 → time_bin / 티어 순서 (티어 이름은 정렬 후 변환)
+    results = pd.DataFrame(results)
+    results = results.sort_values(
+        ["time_bin", "tier", "model", "fold"],
+        key=lambda col: col.map(lambda v: -1 if v == ALL else v) if col.name != "model" else col,
+    ).reset_index(drop=True)
+    results["tier"] = results["tier"].map(
+        lambda code: code if code == ALL else snapshot.tiers[code]
+    )
+
+    board = make_leaderboard(results)
+
+    os.makedirs(output_dir, exist_ok=True)
+    results.to_csv(os.path.join(output_dir, "fold_results.csv"), index=False)
+    board.to_csv(os.path.join(output_dir, "leaderboard.csv"), index=False)
+    print(f"[SAVE] {output_dir}/leaderboard.csv")
+
+    return board
+
+
+# ===============================
+# MAIN
+# ===============================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", nargs="+", choices=list(MODELS), default=list(MODELS), help="비교할 모델")
+    parser.add_argument("--folds", type=int, default=FOLDS, help="fold 수")
+    parser.add_argument("--workers", type=int, default=None, help="worker 프로세스 수")
+    parser.add_argument("--base-path", default=BASE_PATH, help="입력 CSV 디렉터리 (data/processed)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="결과 저장 디렉터리")
+    args = parser.parse_args()
+
+    board = search(args.models, args.folds, args.workers, args.output_dir, args.base_path)
+    if board is None:
+        raise SystemExit(1)
+
+    print("\n=== Leaderboard (전체 구간) ===")
+    print(board[(board["time_bin"] == ALL) & (board["tier"] == ALL)].to_string(index=False))
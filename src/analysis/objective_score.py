@@ -0,0 +1,146 @@
+"""
+objective_score.py
+학습된 Objective Score 모델 저장 / 점수 계산 (numpy만 사용)
+
+모델 파일 (data/models/objective_score.json):
+- features   : feature 순서
+- mean/scale : StandardScaler 평균 / 표준편차
+- coef       : 표준화된 feature 기준 계수, intercept
+- flip       : 학습 때 부호를 뒤집은 tower diff 컬럼 (수집 오류 보정)
+
+점수 (machine_learning.py 의 decision_function / predict_proba 와 같은 값):
+    objective_score   = ((X - mean) / scale) @ coef + intercept = X @ w + b
+    predicted_winrate = sigmoid(objective_score)
+→ 불러올 때 w = coef / scale, b = intercept - Σ coef * mean / scale 로 미리 합쳐 둠.
+  배치는 행렬-벡터 곱 1번, 1행은 파이썬 float 합 (numpy 호출 없음).
+
+사용:
+    scorer = ObjectiveScorer.load()
+    df["objective_score"] = scorer.score(df)            # DataFrame / (n × feature) ndarray
+    scorer.winrate_one({"goldDiff": 1500, ...})          # 실시간 1행
+raw=True → 수집 원본 timeline 값 (tower diff 부호 보정 전) 그대로 입력
+"""
+
+import os
+import json
+import math
+
+import numpy as np
+
+# 저장소 루트 (실행 위치 / OS와 무관)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODEL_DIR = os.path.join(ROOT_DIR, "data", "models")
+ARTIFACT_PATH = os.path.join(MODEL_DIR, "objective_score.json")
+
+ARTIFACT_VERSION = 1
+
+
+# ===============================
+# 1. 저장 / 불러오기
+# ===============================
+def save_artifact(scaler, model, features, flip=(), path=ARTIFACT_PATH, **info):
+    """학습된 StandardScaler + 선형 모델 (coef_ / intercept_) → JSON"""
+    artifact = {
+        "version": ARTIFACT_VERSION,
+        "features": list(features),
+        "mean": scaler.mean_.tolist(),
+        "scale": scaler.scale_.tolist(),
+        "coef": np.ravel(model.coef_).tolist(),
+        "intercept": float(np.ravel(model.intercept_)[0]),
+        "flip": list(flip),
+        **info,
+    }
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(artifact, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+    print(f"[SAVE] Model artifact saved to: {path}")
+    return path
+
+
+def load_artifact(path=ARTIFACT_PATH):
+    with open(path, encoding="utf-8") as f:
+        artifact = json.load(f)
+
+    if artifact.get("version") != ARTIFACT_VERSION:
+        raise ValueError(f"지원하지 않는 모델 파일 버전: {artifact.get('version')} ({path})")
+    return artifact
+
+
+# ===============================
+# 2. 점수 계산
+# ===============================
+class ObjectiveScorer:
+    def __init__(self, artifact, raw=False):
+        self.features = artifact["features"]
+        self.flip = artifact.get("flip", [])
+
+        coef = np.asarray(artifact["coef"], dtype=np.float64)
+        mean = np.asarray(artifact["mean"], dtype=np.float64)
+        scale = np.asarray(artifact["scale"], dtype=np.float64)
+
+        # 표준화 + 계수 → 원본 feature 기준 가중치 하나로
+        self.weights = coef / scale
+        self.bias = float(artifact["intercept"] - np.dot(coef, mean / scale))
+
+        # 원본 값 입력: 학습 때 뒤집은 컬럼은 가중치 부호를 반대로
+        if raw:
+            for name in self.flip:
+                self.weights[self.features.index(name)] *= -1
+
+        # 1행 fast path용 파이썬 float
+        self._pairs = list(zip(self.features, self.weights.tolist()))
+        self._weights = self.weights.tolist()
+
+    @classmethod
+    def load(cls, path=ARTIFACT_PATH, raw=False):
+        return cls(load_artifact(path), raw=raw)
+
+    def _matrix(self, X):
+        # DataFrame → feature 순서대로, NaN은 학습 때와 같이 0 (ndarray 입력도 동일)
+        if hasattr(X, "columns"):
+            X = X[self.features].to_numpy(dtype=np.float64)
+        return np.nan_to_num(np.asarray(X, dtype=np.float64))
+
+    def score(self, X):
+        """(n × feature) → objective_score (n,), 행렬-벡터 곱 1번"""
+        return self._matrix(X) @ self.weights + self.bias
+
+    def winrate(self, X):
+        """(n × feature) → predicted_winrate (n,)"""
+        return _sigmoid(self.score(X))
+
+    def score_one(self, values):
+        """1행: feature dict 또는 feature 순서 sequence → float (없는 값 / NaN은 0)"""
+        total = self.bias
+        if isinstance(values, dict):
+            for name, w in self._pairs:
+                v = values.get(name)
+                if v is not None and v == v:    # NaN != NaN
+                    total += w * v
+        else:
+            for v, w in zip(values, self._weights):
+                if v is not None and v == v:
+                    total += w * v
+        return total
+
+    def winrate_one(self, values):
+        s = self.score_one(values)
+        if s >= 0:
+            return 1.0 / (1.0 + math.exp(-s))
+        e = math.exp(s)
+        return e / (1.0 + e)
+
+
+def _sigmoid(s):
+    # 큰 |s| 에서 overflow 없이
+    out = np.empty_like(s)
+    pos = s >= 0
+    out[pos] = 1.0 / (1.0 + np.exp(-s[pos]))
+    e = np.exp(s[~pos])
+    out[~pos] = e / (1.0 + e)
+    return out
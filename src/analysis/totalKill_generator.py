@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import pandas as pd
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.utils.dataset import split_tier_name, write_tier_dataset
 
 PROCESSED_DIR = "data/processed"
 
+CHUNK_ROWS = 5000                       # 한 번에 읽는 경기 수
+MAX_WORKERS = os.cpu_count() or 1       # 티어 파일 병렬 처리 프로세스 수
+
 TIER_MAP = {
     "C": "CHALLENGER",
     "GM": "GRANDMASTER",
@@ -42,79 +52,88 @@ def build_filename(tier: str, division: str | None):
 
 
 ########################################
-#       ★ totalKill 생성 함수 그대로 ★
+#       ★ totalKill 생성 (누적합 1회) ★
 ########################################
-def add_total_kills(input_path: str, output_path: str):
-    import pandas as pd
-    import re
+MINUTE_COL = re.compile(r"_(\d+)$")
 
-    df = pd.read_csv(input_path)
 
-    drop_cols = [c for c in df.columns if c.startswith("totalKill")]
-    if drop_cols:
-        df = df.drop(columns=drop_cols)
+def plan_columns(columns):
+    """
+    헤더 1회 파싱 → (읽을 컬럼, kill 분 목록, 최종 컬럼 순서)
+    최종 순서: static 컬럼 → 분마다 [..., kill100, totalKill100, kill200, totalKill200, killDiff, totalKillDiff, ...]
+    """
+    columns = [c for c in columns if not c.startswith("totalKill")]
 
-    kill_times = sorted([
-        int(re.search(r"_(\d+)$", c).group(1))
-        for c in df.columns if c.startswith("kill100_")
-    ])
+    static = []
+    grouped = {}
+    for col in columns:
+        m = MINUTE_COL.search(col)
+        if m:
+            grouped.setdefault(int(m.group(1)), []).append(col)
+        else:
+            static.append(col)
 
-    max_minute = df["maxMinute"]
+    kill_times = sorted(
+        int(MINUTE_COL.search(c).group(1)) for c in columns if c.startswith("kill100_")
+    )
 
-    total_values = {}
+    final_columns = static[:]
     for t in kill_times:
-        k100_list = [f"kill100_{x}" for x in kill_times if x <= t]
-        k200_list = [f"kill200_{x}" for x in kill_times if x <= t]
+        for col in grouped[t]:
+            final_columns.append(col)
 
-        total100 = df[k100_list].sum(axis=1)
-        total200 = df[k200_list].sum(axis=1)
-        diff = total100 - total200
+            if col == f"kill100_{t}":
+                final_columns.append(f"totalKill100_{t}")
+            if col == f"kill200_{t}":
+                final_columns.append(f"totalKill200_{t}")
+            if col == f"killDiff_{t}":
+                final_columns.append(f"totalKillDiff_{t}")
 
-        mask = (max_minute < t)
-        total100 = total100.where(~mask, pd.NA)
-        total200 = total200.where(~mask, pd.NA)
-        diff = diff.where(~mask, pd.NA)
+    return columns, kill_times, final_columns
 
-        total_values[f"totalKill100_{t}"] = total100
-        total_values[f"totalKill200_{t}"] = total200
-        total_values[f"totalKillDiff_{t}"] = diff
 
-    df_total = pd.DataFrame(total_values)
+def total_kill_columns(df: pd.DataFrame, kill_times):
+    """분별 kill → 누적 kill (cumsum 1회), maxMinute 이후는 NA"""
+    k100 = df[[f"kill100_{t}" for t in kill_times]].to_numpy(dtype=float)
+    k200 = df[[f"kill200_{t}" for t in kill_times]].to_numpy(dtype=float)
 
-    # 그룹화
-    import re
-    grouped = {}
-    for col in df.columns:
-        m = re.search(r"_(\d+)$", col)
-        if m:
-            t = int(m.group(1))
-            grouped.setdefault(t, []).append(col)
-        else:
-            grouped.setdefault("static", []).append(col)
+    total100 = np.nancumsum(k100, axis=1)
+    total200 = np.nancumsum(k200, axis=1)
 
-    final_columns = grouped["static"][:]
+    over = df["maxMinute"].to_numpy()[:, None] < np.asarray(kill_times)[None, :]
+    total100[over] = np.nan
+    total200[over] = np.nan
+    diff = total100 - total200
 
-    for t in kill_times:
-        block = grouped[t][:]
-        new_block = []
-        for col in block:
-            new_block.append(col)
+    values = {}
+    for i, t in enumerate(kill_times):
+        values[f"totalKill100_{t}"] = pd.array(total100[:, i], dtype="Int64")
+        values[f"totalKill200_{t}"] = pd.array(total200[:, i], dtype="Int64")
+        values[f"totalKillDiff_{t}"] = pd.array(diff[:, i], dtype="Int64")
 
-            if col == f"kill100_{t}":
-                new_block.append(f"totalKill100_{t}")
-            if col == f"kill200_{t}":
-                new_block.append(f"totalKill200_{t}")
-            if col == f"killDiff_{t}":
-                new_block.append(f"totalKillDiff_{t}")
+    return pd.DataFrame(values, index=df.index)
+
+
+def add_total_kills(input_path: str, output_path: str, chunk_rows=CHUNK_ROWS):
+    """CHUNK_ROWS 행씩 읽어서 totalKill 추가 → 임시 파일 → os.replace (input == output 가능)"""
+    header = pd.read_csv(input_path, nrows=0).columns.tolist()
+    columns, kill_times, final_columns = plan_columns(header)
+
+    tmp_path = output_path + ".tmp"
+    first = True
 
-        final_columns.extend(new_block)
+    for chunk in pd.read_csv(input_path, usecols=columns, chunksize=chunk_rows):
+        out = pd.concat([chunk, total_kill_columns(chunk, kill_times)], axis=1)
+        out[final_columns].to_csv(
+            tmp_path, mode="w" if first else "a", header=first, index=False
+        )
+        first = False
 
-    df_final = df.copy()
-    for col in df_total.columns:
-        df_final[col] = df_total[col]
+    # 경기 없는 파일 → 헤더만
+    if first:
+        pd.DataFrame(columns=final_columns).to_csv(tmp_path, index=False)
 
-    df_final = df_final[final_columns]
-    df_final.to_csv(output_path, index=False)
+    os.replace(tmp_path, output_path)
 
 
 ########################################
@@ -167,6 +186,23 @@ def get_target_files(user_input: str):
     raise ValueError("입력 형식 오류. 예: G / G II / C / (공백) 전체 처리")
 
 
+def process_file(filename):
+    """파일 1개: totalKill 추가 + Parquet 파티션 갱신 (프로세스 풀에서 실행)"""
+    input_path = os.path.join(PROCESSED_DIR, filename)
+
+    if not os.path.exists(input_path):
+        return filename, "경고: 파일 없음"
+
+    add_total_kills(input_path, input_path)
+
+    # totalKill 컬럼 포함해서 Parquet 파티션도 갱신
+    tier, division = split_tier_name(filename[:-len("_timeline.csv")])
+    matches_path = input_path.replace("_timeline.csv", "_matches.csv")
+    write_tier_dataset(tier, division, matches_path, input_path)
+
+    return filename, "완료"
+
+
 ########################################
 #                MAIN
 ########################################
@@ -182,14 +218,12 @@ if __name__ == "__main__":
     for f in targets:
         print(" -", f)
 
-    for filename in targets:
-        input_path = os.path.join(PROCESSED_DIR, filename)
-
-        if not os.path.exists(input_path):
-            print(f"[경고] 파일 없음: {input_path}")
-            continue
+    start = time.perf_counter()
 
-        print(f"[처리중] {filename}")
-        add_total_kills(input_path, input_path)
+    # 티어 파일별 독립 작업 → 프로세스 풀에서 동시에 처리
+    with ProcessPoolExecutor(max_workers=min(MAX_WORKERS, len(targets))) as pool:
+        for filename, status in pool.map(process_file, targets):
+            print(f"[{status}] {filename}")
 
+    print(f"\n처리 시간: {time.perf_counter() - start:.1f}s")
     print("\n=== 완료되었습니다 ===")
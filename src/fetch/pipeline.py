@@ -0,0 +1,395 @@
+"""
+pipeline.py
+티어 하나를 수집하는 스트리밍 파이프라인 (collector / all_collector 공용)
+
+PUUID 탐색 → matchlist → match info + timeline → 추출 → 기록
+각 단계는 크기 제한 asyncio.Queue로 연결 (backpressure)
+→ 첫 matchlist가 도착하는 즉시 match 다운로드 시작, 배치 사이에 API가 쉬지 않음
+"""
+
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from src.utils.riot_api import (
+    fetch_players_by_tier,
+    fetch_match_ids,
+    fetch_match_info,
+    fetch_match_timeline,
+    extract_match_rows,
+    extract_timeline_features,
+    extract_timeline_long,
+    extract_event_rows,
+    extract_participant_frames,
+    decode_match,
+    decode_timeline,
+)
+from src.utils.checkpoint import CollectionCheckpoint
+from src.utils.catalog import CollectionCatalog
+from src.utils.dataset import LONG_TIMELINE_SUFFIX, write_tier_dataset
+
+HIGH_TIERS = ["MASTER", "GRANDMASTER", "CHALLENGER"]
+
+# =========================
+# 파이프라인 설정
+# =========================
+# 단계별 worker 수 (요청 속도는 riot_api의 RATE_LIMITER / SCHEDULER가 맞춤)
+# extract = 추출 프로세스 수 (CPU 작업 → event loop 밖 ProcessPoolExecutor)
+DEFAULT_WORKERS = {
+    "matchlist": 4,
+    "fetch": 8,
+    "extract": max(1, (os.cpu_count() or 2) - 1),
+}
+
+EXTRACT_BATCH = 8       # 프로세스에 한 번에 넘기는 경기 수 (pickle / IPC 왕복 줄이기)
+
+QUEUE_SIZE = 100        # 단계 사이 대기열 최대 크기
+COMMIT_EVERY = 20       # 체크포인트 기록 단위 (경기 수)
+
+# 티어 버킷 간 중복 경기 확인용 SQLite 카탈로그
+CATALOG = CollectionCatalog()
+
+_DONE = object()        # 단계 종료 신호
+
+
+# -----------------------------------------------------------
+# 추출 (프로세스 풀에서 실행)
+# -----------------------------------------------------------
+def _extract_worker(items, long_tier=None):
+    """
+    [(match_id, match_bytes, timeline_bytes)] → [(match_id, record)]
+    record = finish / timeline / events / frames (+ long_tier 지정 시 long 형식 timeline)
+
+    응답 bytes 그대로 받아서 프로세스 안에서 디코딩 (dict pickle 비용 없음)
+    """
+    results = []
+    for match_id, match_bytes, timeline_bytes in items:
+        match_json = decode_match(match_bytes)
+        timeline_json = decode_timeline(timeline_bytes)
+
+        record = {
+            "finish": extract_match_rows(match_json),
+            "timeline": extract_timeline_features(match_json, timeline_json),
+            "events": extract_event_rows(match_json, timeline_json),
+            "frames": extract_participant_frames(match_json, timeline_json),
+        }
+        if long_tier is not None:
+            record["long"] = extract_timeline_long(match_json, timeline_json, long_tier)
+
+        results.append((match_id, record))
+    return results
+
+
+# -----------------------------------------------------------
+# 단계 실행 헬퍼
+# -----------------------------------------------------------
+async def _run_stage(n_workers, handle, in_q, out_q=None, n_next=0):
+    """in_q에서 꺼내 handle(item) 실행, 모든 worker 종료 후 다음 단계에 종료 신호 전달"""
+
+    async def worker():
+        while True:
+            item = await in_q.get()
+            if item is _DONE:
+                return
+            await handle(item)
+
+    await asyncio.gather(*[worker() for _ in range(n_workers)])
+
+    for _ in range(n_next):
+        await out_q.put(_DONE)
+
+
+# -----------------------------------------------------------
+# 1) PUUID 탐색
+# -----------------------------------------------------------
+async def discover_puuids(session, tier, division, target_count, out_q, n_next, resume=False):
+    print(f"▶ PUUID 탐색 시작: {tier} {division or ''} / 목표 {target_count}명")
+
+    os.makedirs("data/raw", exist_ok=True)
+
+    filename = f"{tier}_{division}_puuids.txt" if division else f"{tier}_puuids.txt"
+    save_path = f"data/raw/{filename}"
+
+    # resume → 이전에 저장한 PUUID 목록 재사용
+    if resume and os.path.exists(save_path):
+        with open(save_path) as f:
+            puuids = [line.strip() for line in f if line.strip()]
+        print(f"✔ 이전 PUUID 목록 사용: {len(puuids)}명 ← {save_path}")
+
+        for puuid in puuids:
+            await out_q.put(puuid)
+
+    else:
+        puuids = []
+        seen = set()
+        page = 1
+
+        while len(puuids) < target_count:
+            players = await fetch_players_by_tier(session, tier, division, page)
+
+            if not players:
+                break
+
+            for p in players:
+                puuid = p.get("puuid")
+                if not puuid or puuid in seen or len(puuids) >= target_count:
+                    continue
+                seen.add(puuid)
+                puuids.append(puuid)
+
+                # 찾는 즉시 matchlist 단계로 전달
+                await out_q.put(puuid)
+
+            if tier in HIGH_TIERS:
+                break
+
+            page += 1
+
+        with open(save_path, "w") as f:
+            f.writelines(p + "\n" for p in puuids)
+
+        CATALOG.add_puuids(tier, division, puuids)
+
+    print(f"✔ PUUID 탐색 완료: 총 {len(puuids)}명 → {save_path}")
+
+    for _ in range(n_next):
+        await out_q.put(_DONE)
+
+
+# -----------------------------------------------------------
+# 2) 티어 수집 파이프라인
+# -----------------------------------------------------------
+async def collect_tier_pipeline(
+    session, tier, division, player_count, match_per_player,
+    resume=False, workers=None, long_format=False,
+):
+    """long_format=True → {tier}_timeline_long.csv (matchId, minute, metric..., win, tier) 추가 저장"""
+    workers = {**DEFAULT_WORKERS, **(workers or {})}
+
+    tier_name = f"{tier}_{division}" if division else tier
+
+    print("===================================================")
+    print(f"▶ 파이프라인 수집 시작: {tier_name}")
+    print(f"▶ worker: {workers}")
+    print("===================================================\n")
+
+    os.makedirs("data/processed", exist_ok=True)
+
+    # 체크포인트: 완료 matchId journal + 일정 개수마다 결과 기록
+    checkpoint = CollectionCheckpoint(tier_name)
+    if not resume:
+        checkpoint.reset()
+    done = checkpoint.load_done()
+
+    saved_match_ids = checkpoint.load_match_ids() if resume else None
+
+    puuid_q = asyncio.Queue(QUEUE_SIZE)
+    match_q = asyncio.Queue(QUEUE_SIZE)
+    extract_q = asyncio.Queue(QUEUE_SIZE)
+    write_q = asyncio.Queue(QUEUE_SIZE)
+
+    all_match_ids = []
+    queued = set(done)
+    elsewhere = set()       # 다른 티어 버킷에서 이미 추출한 경기
+    reused = set()          # 그중 카탈로그 record를 그대로 사용한 경기
+    stats = {"shared": 0, "failed": 0, "written": 0}
+
+    async def enqueue_matches(match_ids):
+        all_match_ids.extend(match_ids)
+        new_ids = [m for m in dict.fromkeys(match_ids) if m not in queued]
+        queued.update(new_ids)
+
+        # 다른 티어 버킷에서 이미 추출한 경기도 이 티어 결과에 포함 (handle_match에서 record 재사용)
+        elsewhere.update(CATALOG.extracted_elsewhere(tier_name, new_ids))
+
+        for match_id in new_ids:
+            await match_q.put(match_id)
+
+    # ---------------------------
+    # matchlist 단계
+    # ---------------------------
+    async def handle_puuid(puuid):
+        match_ids = await fetch_match_ids(session, puuid, match_per_player) or []
+        CATALOG.add_match_ids(tier_name, puuid, match_ids)
+        await enqueue_matches(match_ids)
+
+    async def matchlist_stage():
+        if saved_match_ids is not None:
+            # resume: matchlist 결과가 이미 있음 → PUUID / matchlist 단계 생략
+            print(f"✔ 저장된 matchId 사용: {len(saved_match_ids)}개")
+            await enqueue_matches(saved_match_ids)
+            for _ in range(workers["fetch"]):
+                await match_q.put(_DONE)
+            return
+
+        await asyncio.gather(
+            discover_puuids(
+                session, tier, division, player_count, puuid_q, workers["matchlist"], resume
+            ),
+            _run_stage(workers["matchlist"], handle_puuid, puuid_q, match_q, workers["fetch"]),
+        )
+
+        unique_ids = list(dict.fromkeys(all_match_ids))
+        checkpoint.save_match_ids(unique_ids)
+        print(f"✔ matchlist 완료: 고유 matchId {len(unique_ids)}개")
+
+    # ---------------------------
+    # match info + timeline 단계 (두 요청 동시 진행)
+    # ---------------------------
+    def catalog_record(match_id):
+        """다른 티어에서 추출한 record (long 형식이 필요한데 없으면 None → 다시 추출)"""
+        record = CATALOG.load_record(match_id)
+        if record is None:
+            return None
+
+        if long_format:
+            long = record.get("long")
+            if not long:
+                return None
+            long["tier"] = [tier] * len(long["tier"])
+        else:
+            record.pop("long", None)
+
+        return record
+
+    async def handle_match(match_id):
+        # 다른 티어에서 추출 완료 → 요청 / 추출 없이 저장된 record 기록
+        if match_id in elsewhere:
+            record = catalog_record(match_id)
+            if record is not None:
+                reused.add(match_id)
+                stats["shared"] += 1
+                await write_q.put((match_id, record))
+                return
+
+        # 디코딩은 추출 프로세스에서 → 여기서는 bytes만 전달
+        match_bytes, timeline_bytes = await asyncio.gather(
+            fetch_match_info(session, match_id, raw=True),
+            fetch_match_timeline(session, match_id, raw=True),
+        )
+
+        if not match_bytes or not timeline_bytes:
+            print(f"    · {match_id} → (오류 → 건너뜀)")
+            stats["failed"] += 1
+            CATALOG.mark_fetch_failed([match_id])
+            return
+
+        await extract_q.put((match_id, match_bytes, timeline_bytes))
+
+    # ---------------------------
+    # 추출 단계 (프로세스 풀, 대기 중인 경기를 묶어서 전달)
+    # ---------------------------
+    async def extract_stage():
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=workers["extract"]) as pool:
+
+            async def worker():
+                finished = False
+                while not finished:
+                    item = await extract_q.get()
+                    if item is _DONE:
+                        return
+
+                    # 이미 도착해 있는 경기만 추가로 묶음 (기다리지 않음)
+                    batch = [item]
+                    while len(batch) < EXTRACT_BATCH:
+                        try:
+                            item = extract_q.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        if item is _DONE:
+                            finished = True
+                            break
+                        batch.append(item)
+
+                    results = await loop.run_in_executor(
+                        pool, _extract_worker, batch, tier if long_format else None
+                    )
+                    for entry in results:
+                        await write_q.put(entry)
+
+            await asyncio.gather(*[worker() for _ in range(workers["extract"])])
+
+        await write_q.put(_DONE)
+
+    # ---------------------------
+    # 기록 단계 (단일 writer)
+    # ---------------------------
+    async def writer_stage():
+        pending = []
+
+        def flush():
+            checkpoint.commit(pending)
+            CATALOG.mark_extracted(
+                tier_name,
+                [match_id for match_id, _ in pending],
+                [(match_id, record) for match_id, record in pending if match_id not in reused],
+            )
+            stats["written"] += len(pending)
+            print(f"  → 기록 {stats['written']}개 완료")
+            pending.clear()
+
+        while True:
+            entry = await write_q.get()
+            if entry is _DONE:
+                break
+
+            pending.append(entry)
+            if len(pending) >= COMMIT_EVERY:
+                flush()
+
+        if pending:
+            flush()
+
+    stages = [
+        asyncio.create_task(matchlist_stage()),
+        asyncio.create_task(
+            _run_stage(workers["fetch"], handle_match, match_q, extract_q, workers["extract"])
+        ),
+        asyncio.create_task(extract_stage()),
+        asyncio.create_task(writer_stage()),
+    ]
+
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        # 한 단계가 실패하면 나머지 단계가 대기열에서 멈추지 않도록 모두 취소
+        for task in stages:
+            task.cancel()
+        raise
+
+    skipped_done = len(done.intersection(all_match_ids))
+    if skipped_done:
+        print(f"▶ resume: 완료된 {skipped_done}개 건너뜀")
+    if stats["shared"]:
+        print(f"▶ 카탈로그: 다른 티어에서 수집된 {stats['shared']}개 → 저장된 추출 결과로 기록 (요청 없음)")
+
+    # ---------------------------
+    # CSV 저장 (체크포인트 → CSV 스트리밍 변환)
+    # ---------------------------
+    finish_path = f"data/processed/{tier_name}_matches.csv"
+    timeline_path = f"data/processed/{tier_name}_timeline.csv"
+    events_path = f"data/processed/{tier_name}_events.npz"
+    frames_path = f"data/processed/{tier_name}_frames"
+    long_path = f"data/processed/{tier_name}{LONG_TIMELINE_SUFFIX}" if long_format else None
+
+    n_finish, n_timeline = checkpoint.finalize(
+        finish_path, timeline_path, events_path, frames_path, long_path
+    )
+
+    # 분석용 Parquet 파티션 (data/dataset/{matches,timeline}/tier=.../division=...)
+    write_tier_dataset(tier, division, finish_path, timeline_path, long_path)
+
+    print("\n===================================================")
+    print("✔ Match 정보 수집 완료")
+    print(f"✔ 실패: {stats['failed']}개")
+    print(f"✔ FINISH row 수: {n_finish}개 → {finish_path}")
+    print(f"✔ TIMELINE row 수: {n_timeline}개 → {timeline_path}")
+    print(f"✔ EVENT 테이블 → {events_path}")
+    print(f"✔ 참가자 FRAME 배열 → {frames_path}/")
+    if long_path:
+        print(f"✔ TIMELINE long → {long_path}")
+    print("===================================================\n")
+
+    return finish_path, timeline_path
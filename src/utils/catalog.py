@@ -0,0 +1,176 @@
+"""
+catalog.py
+SQLite 수집 카탈로그 (data/catalog.sqlite)
+
+- puuids        : 티어 / division별 수집한 PUUID
+- matches       : matchId별 fetch / extract 상태 + 결과가 저장된 티어 (owner_tier)
+- match_sources : 어떤 티어의 어떤 PUUID matchlist에서 나온 matchId인지
+- records       : 추출 결과 (gzip JSON, 체크포인트 rows.jsonl 한 줄과 같은 record)
+
+다른 티어 버킷에서 이미 추출한 경기도 각 티어 결과에는 그대로 기록한다.
+→ 요청 전에 카탈로그를 확인하고 저장된 record를 그대로 사용 (match / timeline 요청 없음)
+  MATCH_CACHE (LRU, 용량 제한) 에서 원본이 지워진 경기도 다시 다운로드하지 않음
+"""
+
+import os
+import gzip
+import json
+import sqlite3
+import time
+
+CATALOG_PATH = "data/catalog.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS puuids (
+    puuid       TEXT NOT NULL,
+    tier        TEXT NOT NULL,
+    division    TEXT NOT NULL DEFAULT '',
+    added_at    REAL NOT NULL,
+    PRIMARY KEY (puuid, tier, division)
+);
+CREATE INDEX IF NOT EXISTS idx_puuids_puuid ON puuids (puuid);
+
+CREATE TABLE IF NOT EXISTS matches (
+    match_id        TEXT PRIMARY KEY,
+    fetch_status    TEXT NOT NULL DEFAULT 'pending',   -- pending / done / failed
+    extract_status  TEXT NOT NULL DEFAULT 'pending',   -- pending / done
+    owner_tier      TEXT,
+    updated_at      REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_matches_owner ON matches (owner_tier);
+
+CREATE TABLE IF NOT EXISTS match_sources (
+    match_id    TEXT NOT NULL,
+    tier_name   TEXT NOT NULL,
+    puuid       TEXT NOT NULL,
+    PRIMARY KEY (match_id, tier_name, puuid)
+);
+CREATE INDEX IF NOT EXISTS idx_sources_puuid ON match_sources (puuid);
+CREATE INDEX IF NOT EXISTS idx_sources_tier ON match_sources (tier_name);
+
+CREATE TABLE IF NOT EXISTS records (
+    match_id    TEXT PRIMARY KEY,
+    record      BLOB NOT NULL       -- gzip(JSON)
+);
+"""
+
+# IN (...) 파라미터 개수 제한 대비
+QUERY_CHUNK = 500
+
+
+class CollectionCatalog:
+    def __init__(self, path=CATALOG_PATH):
+        self.path = path
+        self._db = None
+
+    @property
+    def db(self):
+        # 첫 사용 시 연결 (import 시점에 파일을 만들지 않음)
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # ---------------------------------------------------
+    # 기록
+    # ---------------------------------------------------
+    def add_puuids(self, tier, division, puuids):
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO puuids (puuid, tier, division, added_at) VALUES (?, ?, ?, ?)",
+                [(p, tier, division or "", now) for p in puuids],
+            )
+
+    def add_match_ids(self, tier_name, puuid, match_ids):
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO matches (match_id, updated_at) VALUES (?, ?)",
+                [(m, now) for m in match_ids],
+            )
+            self.db.executemany(
+                "INSERT OR IGNORE INTO match_sources (match_id, tier_name, puuid) VALUES (?, ?, ?)",
+                [(m, tier_name, puuid) for m in match_ids],
+            )
+
+    def mark_fetch_failed(self, match_ids):
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "UPDATE matches SET fetch_status = 'failed', updated_at = ? WHERE match_id = ?",
+                [(now, m) for m in match_ids],
+            )
+
+    def mark_extracted(self, tier_name, match_ids, records=()):
+        """추출 완료 기록 (records: [(match_id, record)] → 다른 티어에서 재사용)"""
+        now = time.time()
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO records (match_id, record) VALUES (?, ?)",
+                [
+                    (m, gzip.compress(json.dumps(r, ensure_ascii=False).encode(), compresslevel=6))
+                    for m, r in records
+                ],
+            )
+            self.db.executemany(
+                "INSERT INTO matches (match_id, fetch_status, extract_status, owner_tier, updated_at) "
+                "VALUES (?, 'done', 'done', ?, ?) "
+                "ON CONFLICT(match_id) DO UPDATE SET "
+                "fetch_status = 'done', extract_status = 'done', "
+                "owner_tier = COALESCE(matches.owner_tier, excluded.owner_tier), "
+                "updated_at = excluded.updated_at",
+                [(m, tier_name, now) for m in match_ids],
+            )
+
+    # ---------------------------------------------------
+    # 조회
+    # ---------------------------------------------------
+    def extracted_elsewhere(self, tier_name, match_ids):
+        """다른 티어 버킷에서 이미 추출 완료된 matchId 집합"""
+        match_ids = list(match_ids)
+        found = set()
+
+        for i in range(0, len(match_ids), QUERY_CHUNK):
+            chunk = match_ids[i:i + QUERY_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            rows = self.db.execute(
+                f"SELECT match_id FROM matches "
+                f"WHERE match_id IN ({marks}) AND extract_status = 'done' AND owner_tier != ?",
+                [*chunk, tier_name],
+            )
+            found.update(r[0] for r in rows)
+
+        return found
+
+    def load_record(self, match_id):
+        """저장된 추출 결과 (없으면 None)"""
+        row = self.db.execute("SELECT record FROM records WHERE match_id = ?", [match_id]).fetchone()
+        if row is None:
+            return None
+        return json.loads(gzip.decompress(row[0]))
+
+    def progress(self, tier_name=None):
+        """{fetch_status/extract_status: 개수} (tier_name 지정 시 해당 티어 출처만)"""
+        if tier_name is None:
+            rows = self.db.execute(
+                "SELECT fetch_status, extract_status, COUNT(*) FROM matches "
+                "GROUP BY fetch_status, extract_status"
+            )
+        else:
+            rows = self.db.execute(
+                "SELECT m.fetch_status, m.extract_status, COUNT(DISTINCT m.match_id) "
+                "FROM matches m JOIN match_sources s ON s.match_id = m.match_id "
+                "WHERE s.tier_name = ? GROUP BY m.fetch_status, m.extract_status",
+                [tier_name],
+            )
+
+        return {f"{fetch}/{extract}": count for fetch, extract, count in rows}
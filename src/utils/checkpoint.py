@@ -0,0 +1,191 @@
+"""
+checkpoint.py
+티어 수집 체크포인트 (중단 후 --resume 으로 이어서 수집)
+
+data/checkpoint/{tier_name}/
+- match_ids.txt : matchlist 단계 결과 (resume 시 matchlist 재수집 생략)
+- rows.jsonl    : 경기 1개 = 1줄 {"matchId", "finish": [...], "timeline": {...}, ...} (append-only)
+                  (events / frames / long 은 추출 결과가 있을 때만)
+- journal.txt   : 완료된 matchId (rows.jsonl 기록 + fsync 이후에만 추가)
+
+journal에 있는 matchId만 완료로 인정하므로,
+rows.jsonl에 쓰다가 죽은 경기는 resume 시 다시 수집된다.
+마지막에 rows.jsonl을 한 줄씩 읽어 CSV로 변환 → 메모리 사용량은 경기 수와 무관.
+"""
+
+import os
+import csv
+import json
+import shutil
+
+from src.utils.event_table import EventTable
+from src.utils.frame_store import write_frame_store
+
+CHECKPOINT_DIR = "data/checkpoint"
+
+
+class CollectionCheckpoint:
+    def __init__(self, tier_name, root=CHECKPOINT_DIR):
+        self.dir = os.path.join(root, tier_name)
+        self.match_ids_path = os.path.join(self.dir, "match_ids.txt")
+        self.rows_path = os.path.join(self.dir, "rows.jsonl")
+        self.journal_path = os.path.join(self.dir, "journal.txt")
+
+    # ---------------------------------------------------
+    # 초기화 / 상태
+    # ---------------------------------------------------
+    def reset(self):
+        """새 수집 시작 → 이전 체크포인트 삭제"""
+        shutil.rmtree(self.dir, ignore_errors=True)
+        os.makedirs(self.dir, exist_ok=True)
+
+    def load_done(self):
+        os.makedirs(self.dir, exist_ok=True)
+        if not os.path.exists(self.journal_path):
+            return set()
+
+        with open(self.journal_path) as f:
+            return {line.strip() for line in f if line.strip()}
+
+    def save_match_ids(self, match_ids):
+        tmp_path = self.match_ids_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(m + "\n" for m in match_ids)
+        os.replace(tmp_path, self.match_ids_path)
+
+    def load_match_ids(self):
+        if not os.path.exists(self.match_ids_path):
+            return None
+
+        with open(self.match_ids_path) as f:
+            return [line.strip() for line in f if line.strip()]
+
+    # ---------------------------------------------------
+    # 배치 기록
+    # ---------------------------------------------------
+    def commit(self, entries):
+        """
+        entries: [(match_id, record)] → rows 기록 후 journal 추가
+        record = {"finish": [...], "timeline": {...}, "events": ..., "frames": ..., "long": ...}
+        """
+        if not entries:
+            return
+
+        with open(self.rows_path, "a", encoding="utf-8") as f:
+            for match_id, record in entries:
+                f.write(json.dumps({"matchId": match_id, **record}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        with open(self.journal_path, "a") as f:
+            f.writelines(match_id + "\n" for match_id, _ in entries)
+            f.flush()
+            os.fsync(f.fileno())
+
+    # ---------------------------------------------------
+    # 최종 CSV 변환
+    # ---------------------------------------------------
+    def _iter_committed(self):
+        """journal에 있는 경기만, matchId당 한 번씩"""
+        if not os.path.exists(self.rows_path):
+            return
+
+        done = self.load_done()
+        seen = set()
+
+        with open(self.rows_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 도중 중단된 마지막 줄
+                    continue
+
+                match_id = entry["matchId"]
+                if match_id not in done or match_id in seen:
+                    continue
+
+                seen.add(match_id)
+                yield entry
+
+    def finalize(
+        self, finish_path, timeline_path, events_path=None, frames_path=None, long_path=None
+    ):
+        """
+        rows.jsonl → {tier}_matches.csv / {tier}_timeline.csv (스트리밍)
+                   + {tier}_events.npz / {tier}_frames/ / {tier}_timeline_long.csv (경로 지정 시)
+        """
+
+        # timeline 컬럼은 경기 길이에 따라 다름 → 가장 긴 경기의 컬럼이 전체 합집합
+        finish_columns = None
+        timeline_columns = None
+        longest = -1
+
+        for entry in self._iter_committed():
+            if finish_columns is None and entry["finish"]:
+                finish_columns = list(entry["finish"][0].keys())
+
+            timeline = entry["timeline"]
+            if timeline and timeline["maxMinute"] > longest:
+                longest = timeline["maxMinute"]
+                timeline_columns = list(timeline.keys())
+
+        n_finish = n_timeline = 0
+
+        with open(finish_path, "w", newline="", encoding="utf-8") as ff, \
+                open(timeline_path, "w", newline="", encoding="utf-8") as tf:
+
+            finish_writer = None
+            if finish_columns:
+                finish_writer = csv.DictWriter(ff, fieldnames=finish_columns)
+                finish_writer.writeheader()
+
+            timeline_writer = None
+            if timeline_columns:
+                timeline_writer = csv.DictWriter(tf, fieldnames=timeline_columns)
+                timeline_writer.writeheader()
+
+            for entry in self._iter_committed():
+                if finish_writer and entry["finish"]:
+                    finish_writer.writerows(entry["finish"])
+                    n_finish += len(entry["finish"])
+
+                if timeline_writer and entry["timeline"]:
+                    timeline_writer.writerow(entry["timeline"])
+                    n_timeline += 1
+
+        # 이벤트 테이블 (events 없는 이전 체크포인트 줄은 제외)
+        if events_path:
+            table = EventTable.build(
+                (entry["matchId"], entry.get("events")) for entry in self._iter_committed()
+            )
+            table.save(events_path)
+
+        # 참가자 프레임 배열 (frames 없는 이전 체크포인트 줄은 제외)
+        if frames_path:
+            write_frame_store(frames_path, lambda: (
+                (entry["matchId"], entry["finish"], entry.get("frames"))
+                for entry in self._iter_committed()
+            ))
+
+        # long 형식 timeline (long 없는 줄은 제외)
+        if long_path:
+            self._write_long(long_path)
+
+        return n_finish, n_timeline
+
+    def _write_long(self, long_path):
+        """경기별 long 컬럼 dict → (matchId, minute) 1행씩 CSV"""
+        with open(long_path, "w", newline="", encoding="utf-8") as f:
+            writer = None
+
+            for entry in self._iter_committed():
+                columns = entry.get("long")
+                if not columns:
+                    continue
+
+                if writer is None:
+                    writer = csv.writer(f)
+                    writer.writerow(columns.keys())
+
+                writer.writerows(zip(*columns.values()))
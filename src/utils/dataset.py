@@ -0,0 +1,245 @@
+"""
+dataset.py
+티어 / division 파티션 Parquet 데이터셋 (data/dataset/)
+
+data/dataset/
+- matches/tier=GOLD/division=I/part-0.parquet    : {tier}_matches.csv 와 같은 row (참가자 1명 = 1행)
+- timeline/tier=GOLD/division=I/part-0.parquet   : timeline long 형식 (경기 × 분 = 1행)
+  · matchId / minute / gameDuration / maxMinute / win(team100) + metric 컬럼 (goldDiff, dragon100 ...)
+  · 분 단위 wide 컬럼(goldDiff_17) 대신 minute 컬럼 → minute 조건으로 row group 건너뛰기 가능
+  · minute > maxMinute 인 (경기 종료 이후) row는 저장하지 않음
+
+division 없는 티어 (MASTER / GRANDMASTER / CHALLENGER)는 division=NONE.
+
+읽기:
+    read_timeline(columns=["matchId", "minute", "goldDiff"], tiers=["GOLD"], minutes=(10, 35))
+    → 필요한 컬럼만, 해당 티어 파티션 / minute 범위만 읽음
+
+pyarrow가 없으면 저장을 건너뛰고 CSV만 사용.
+"""
+
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+DATASET_DIR = "data/dataset"
+
+NO_DIVISION = "NONE"
+
+ROW_GROUP_SIZE = 64 * 1024
+
+# pipeline(--long)이 저장하는 long 형식 timeline CSV 이름 ({tier}_timeline_long.csv)
+# → wide timeline 파일을 glob으로 찾을 때는 제외해야 함
+LONG_TIMELINE_SUFFIX = "_timeline_long.csv"
+
+_MINUTE_COL = re.compile(r"^(.+)_(\d+)$")
+
+
+# ---------------------------------------------------
+# dtype (작게 저장)
+# ---------------------------------------------------
+def _metric_type(metric):
+    # 골드만 int32, 나머지 (킬 / 오브젝트 개수 / 차이)는 int16
+    if metric.startswith("gold"):
+        return pa.int32()
+    return pa.int16()
+
+
+def _matches_schema():
+    return pa.schema([
+        ("matchId", pa.string()),
+        ("gameDuration", pa.int32()),
+        ("playerPuuid", pa.string()),
+        ("teamId", pa.int16()),
+        ("win", pa.int8()),
+        ("lane", pa.dictionary(pa.int8(), pa.string())),
+        ("champion", pa.dictionary(pa.int16(), pa.string())),
+        ("enemyLaneChampion", pa.dictionary(pa.int16(), pa.string())),
+    ])
+
+
+def _timeline_schema(metrics):
+    return pa.schema([
+        ("matchId", pa.string()),
+        ("minute", pa.int16()),
+        ("gameDuration", pa.int32()),
+        ("maxMinute", pa.int16()),
+        ("win", pa.int8()),
+        *[(m, _metric_type(m)) for m in metrics],
+    ])
+
+
+def _partitioning():
+    return ds.partitioning(
+        pa.schema([("tier", pa.string()), ("division", pa.string())]), flavor="hive"
+    )
+
+
+def split_tier_name(tier_name):
+    """GOLD_I → (GOLD, I) / MASTER → (MASTER, None)"""
+    tier, _, division = tier_name.partition("_")
+    return tier, division or None
+
+
+# ---------------------------------------------------
+# wide → long
+# ---------------------------------------------------
+def timeline_wide_to_long(df: pd.DataFrame, keep_all_minutes=False) -> pd.DataFrame:
+    """
+    wide timeline (metric_minute 컬럼) → (matchId, minute, metric...) long 형식
+
+    metric별로 (경기 × 분) 배열을 만들어 한 번에 펼침 (row 반복 없음).
+    keep_all_minutes=False → minute > maxMinute 인 row 제거
+    """
+    by_metric = {}
+    minutes = set()
+    static = []
+
+    for col in df.columns:
+        m = _MINUTE_COL.match(col)
+        if m:
+            metric, minute = m.group(1), int(m.group(2))
+            by_metric.setdefault(metric, {})[minute] = col
+            minutes.add(minute)
+        else:
+            static.append(col)
+
+    minutes = sorted(minutes)
+    n_rows, n_minutes = len(df), len(minutes)
+
+    long_df = pd.DataFrame({
+        col: np.repeat(df[col].to_numpy(), n_minutes) for col in static
+    })
+    long_df.insert(1 if "matchId" in static else 0, "minute", np.tile(np.asarray(minutes, dtype=np.int64), n_rows))
+
+    for metric, cols in by_metric.items():
+        values = df.reindex(columns=[cols.get(minute) for minute in minutes]).to_numpy(dtype=float)
+        long_df[metric] = values.reshape(-1)
+
+    if not keep_all_minutes and "maxMinute" in long_df:
+        long_df = long_df[long_df["minute"] <= long_df["maxMinute"]].reset_index(drop=True)
+
+    return long_df
+
+
+# ---------------------------------------------------
+# 쓰기
+# ---------------------------------------------------
+def _partition_dir(name, tier, division, root):
+    return os.path.join(root, name, f"tier={tier}", f"division={division or NO_DIVISION}")
+
+
+def _write_partition(table, name, tier, division, root):
+    """파티션 하나를 통째로 교체 (임시 파일 → os.replace)"""
+    part_dir = _partition_dir(name, tier, division, root)
+    os.makedirs(part_dir, exist_ok=True)
+
+    tmp_path = os.path.join(part_dir, "part-0.parquet.tmp")
+    pq.write_table(table, tmp_path, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+
+    for f in os.listdir(part_dir):
+        if f.endswith(".parquet"):
+            os.remove(os.path.join(part_dir, f))
+    os.replace(tmp_path, os.path.join(part_dir, "part-0.parquet"))
+
+    return part_dir
+
+
+def write_matches_partition(matches_df, tier, division=None, root=DATASET_DIR):
+    schema = _matches_schema()
+    df = matches_df[schema.names]
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    return _write_partition(table, "matches", tier, division, root)
+
+
+def write_timeline_partition(long_df, tier, division=None, root=DATASET_DIR):
+    """long_df: timeline_wide_to_long 결과 + win 컬럼"""
+    base = {"matchId", "minute", "gameDuration", "maxMinute", "win", "tier", "division"}
+    metrics = [c for c in long_df.columns if c not in base]
+
+    schema = _timeline_schema(metrics)
+    df = long_df.reindex(columns=schema.names)
+
+    # 경기 종료 이후 NaN (totalKill 등) → 0, 정수 컬럼으로 저장
+    df[metrics] = df[metrics].fillna(0)
+    df["win"] = df["win"].fillna(0)
+
+    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+    return _write_partition(table, "timeline", tier, division, root)
+
+
+def team100_win(matches_df):
+    """matches row (경기당 10행, 첫 행 = team100) → matchId별 team100 승리 여부"""
+    return matches_df.groupby("matchId", sort=False)["win"].first()
+
+
+def write_tier_dataset(tier, division, finish_path, timeline_path, long_path=None, root=DATASET_DIR):
+    """
+    {tier}_matches.csv / {tier}_timeline.csv → Parquet 파티션 (matches / timeline)
+    long_path ({tier}_timeline_long.csv, win 포함) 가 있으면 wide 변환 없이 그대로 사용
+    """
+    if pa is None:
+        print("[dataset] pyarrow 없음 → Parquet 저장 건너뜀")
+        return None
+
+    if not os.path.exists(finish_path) or os.path.getsize(finish_path) == 0:
+        print(f"[dataset] 경기 없음 → 건너뜀: {finish_path}")
+        return None
+
+    matches_df = pd.read_csv(finish_path)
+    write_matches_partition(matches_df, tier, division, root)
+
+    if long_path and os.path.exists(long_path) and os.path.getsize(long_path) > 0:
+        long_df = pd.read_csv(long_path)
+        write_timeline_partition(long_df, tier, division, root)
+
+    elif os.path.exists(timeline_path) and os.path.getsize(timeline_path) > 0:
+        long_df = timeline_wide_to_long(pd.read_csv(timeline_path))
+        long_df["win"] = long_df["matchId"].map(team100_win(matches_df))
+        write_timeline_partition(long_df, tier, division, root)
+
+    print(f"[dataset] 저장 완료: tier={tier} division={division or NO_DIVISION} → {root}")
+    return root
+
+
+# ---------------------------------------------------
+# 읽기 (컬럼 projection + tier / division / minute 조건)
+# ---------------------------------------------------
+def _read(name, columns, tiers, divisions, extra_filter, root):
+    if pa is None:
+        raise ImportError("Parquet 데이터셋을 읽으려면 pyarrow가 필요합니다.")
+
+    dataset = ds.dataset(os.path.join(root, name), format="parquet", partitioning=_partitioning())
+
+    filt = extra_filter
+    if tiers is not None:
+        cond = ds.field("tier").isin(list(tiers))
+        filt = cond if filt is None else filt & cond
+    if divisions is not None:
+        cond = ds.field("division").isin([d or NO_DIVISION for d in divisions])
+        filt = cond if filt is None else filt & cond
+
+    return dataset.to_table(columns=columns, filter=filt).to_pandas()
+
+
+def read_matches(columns=None, tiers=None, divisions=None, root=DATASET_DIR):
+    return _read("matches", columns, tiers, divisions, None, root)
+
+
+def read_timeline(columns=None, tiers=None, divisions=None, minutes=None, root=DATASET_DIR):
+    """minutes=(최소, 최대) 포함 범위"""
+    filt = None
+    if minutes is not None:
+        lo, hi = minutes
+        filt = (ds.field("minute") >= lo) & (ds.field("minute") <= hi)
+
+    return _read("timeline", columns, tiers, divisions, filt, root)
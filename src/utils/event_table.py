@@ -0,0 +1,230 @@
+"""
+event_table.py
+이벤트 단위 컬럼 테이블 + 프레임 단위 팀 골드 (data/processed/{tier}_events.npz)
+
+collector가 extract_event_rows 결과를 모아 저장 → 분 단위로 합치기 전 시점으로 조회.
+
+- events : match / timestamp / code / team / subtype   ((match, timestamp) 순 정렬)
+- frames : match / timestamp / gold100 / gold200        ((match, timestamp) 순 정렬)
+
+조회 (여러 경기 한 번에, timestamp는 ms):
+- counts_at(metric, t) : timestamp <= t 까지 누적 개수 (100, 200)
+  → key = match * 2^32 + timestamp 정렬 배열에서 searchsorted + 팀별 prefix sum
+    경기 경계는 따로 둔 offsets 배열 기준 (음수 timestamp가 앞 경기 구간으로 넘어가지 않음)
+- diff_at(metric, t)   : 100 - 200 (metric="gold" → t 시점 직전 프레임의 골드 차이)
+- first_time(metric)   : 경기별 첫 발생 시점 (없으면 -1)
+
+예) 첫 바론 시점의 골드 차이
+    table = EventTable.load("data/processed/GOLD_I_events.npz")
+    t = table.first_time("baron")
+    has = t >= 0
+    table.diff_at("gold", t[has], table.match_ids[has])
+"""
+
+import numpy as np
+
+from src.utils.riot_api.extract_events import EVENT_CODES
+
+KEY_SHIFT = np.int64(1) << 32
+
+
+class EventTable:
+    def __init__(
+        self, match_ids, ev_match, ev_timestamp, ev_code, ev_team, ev_subtype, subtypes,
+        fr_match, fr_timestamp, fr_gold100, fr_gold200,
+    ):
+        self.match_ids = np.asarray(match_ids)
+        self.ev_match = ev_match
+        self.ev_timestamp = ev_timestamp
+        self.ev_code = ev_code
+        self.ev_team = ev_team
+        self.ev_subtype = ev_subtype        # subtypes 인덱스 (-1 = 없음)
+        self.subtypes = np.asarray(subtypes)
+
+        self.fr_match = fr_match
+        self.fr_timestamp = fr_timestamp
+        self.fr_gold100 = fr_gold100
+        self.fr_gold200 = fr_gold200
+
+        self._match_pos = {m: i for i, m in enumerate(self.match_ids.tolist())}
+        self._code_index = {}               # code → (keys, bounds, cum100, cum200)
+        self._frame_index = None            # (keys, bounds)
+
+    # ---------------------------------------------------
+    # 생성 / 저장
+    # ---------------------------------------------------
+    @classmethod
+    def build(cls, entries):
+        """entries: [(match_id, extract_event_rows 결과)] (None 결과는 제외)"""
+        match_ids = []
+        ev_cols = {"match": [], "timestamp": [], "code": [], "team": [], "subtype": []}
+        fr_cols = {"match": [], "timestamp": [], "gold100": [], "gold200": []}
+        subtype_pos = {}
+
+        for match_id, events in entries:
+            if not events:
+                continue
+
+            idx = len(match_ids)
+            match_ids.append(match_id)
+
+            n = len(events["timestamp"])
+            ev_cols["match"].extend([idx] * n)
+            ev_cols["timestamp"].extend(events["timestamp"])
+            ev_cols["code"].extend(events["code"])
+            ev_cols["team"].extend(events["team"])
+            ev_cols["subtype"].extend(
+                -1 if s is None else subtype_pos.setdefault(s, len(subtype_pos))
+                for s in events["subtype"]
+            )
+
+            frames = events["frames"]
+            fr_cols["match"].extend([idx] * len(frames["timestamp"]))
+            fr_cols["timestamp"].extend(frames["timestamp"])
+            fr_cols["gold100"].extend(frames["gold100"])
+            fr_cols["gold200"].extend(frames["gold200"])
+
+        ev_match = np.asarray(ev_cols["match"], dtype=np.int32)
+        ev_timestamp = np.asarray(ev_cols["timestamp"], dtype=np.int32)
+        ev_order = np.lexsort((ev_timestamp, ev_match))
+
+        fr_match = np.asarray(fr_cols["match"], dtype=np.int32)
+        fr_timestamp = np.asarray(fr_cols["timestamp"], dtype=np.int32)
+        fr_order = np.lexsort((fr_timestamp, fr_match))
+
+        return cls(
+            match_ids=np.asarray(match_ids, dtype=str),
+            ev_match=ev_match[ev_order],
+            ev_timestamp=ev_timestamp[ev_order],
+            ev_code=np.asarray(ev_cols["code"], dtype=np.int8)[ev_order],
+            ev_team=np.asarray(ev_cols["team"], dtype=np.int16)[ev_order],
+            ev_subtype=np.asarray(ev_cols["subtype"], dtype=np.int16)[ev_order],
+            subtypes=np.asarray(list(subtype_pos), dtype=str),
+            fr_match=fr_match[fr_order],
+            fr_timestamp=fr_timestamp[fr_order],
+            fr_gold100=np.asarray(fr_cols["gold100"], dtype=np.int32)[fr_order],
+            fr_gold200=np.asarray(fr_cols["gold200"], dtype=np.int32)[fr_order],
+        )
+
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            match_ids=self.match_ids,
+            ev_match=self.ev_match,
+            ev_timestamp=self.ev_timestamp,
+            ev_code=self.ev_code,
+            ev_team=self.ev_team,
+            ev_subtype=self.ev_subtype,
+            subtypes=self.subtypes,
+            fr_match=self.fr_match,
+            fr_timestamp=self.fr_timestamp,
+            fr_gold100=self.fr_gold100,
+            fr_gold200=self.fr_gold200,
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+    def __len__(self):
+        return len(self.match_ids)
+
+    # ---------------------------------------------------
+    # 인덱스
+    # ---------------------------------------------------
+    def _matches(self, match_ids):
+        """matchId 목록 → 내부 인덱스 (None = 전체 경기)"""
+        if match_ids is None:
+            return np.arange(len(self.match_ids), dtype=np.int64)
+        return np.asarray([self._match_pos[m] for m in match_ids], dtype=np.int64)
+
+    def _code(self, metric):
+        if metric not in EVENT_CODES:
+            raise ValueError(f"알 수 없는 metric: {metric} (gold / {', '.join(EVENT_CODES)})")
+        return EVENT_CODES.index(metric)
+
+    def _bounds(self, match_col):
+        """경기 i의 행 구간 = [bounds[i], bounds[i + 1]) (match 순 정렬 컬럼 기준)"""
+        return np.searchsorted(match_col, np.arange(len(self.match_ids) + 1), side="left")
+
+    def _event_index(self, code):
+        """code별 정렬 key + 경기 경계 + 팀별 prefix sum (처음 조회할 때 한 번 계산)"""
+        if code not in self._code_index:
+            sel = self.ev_code == code
+            match_col = self.ev_match[sel]
+            keys = match_col.astype(np.int64) * KEY_SHIFT + self.ev_timestamp[sel]
+            team = self.ev_team[sel]
+
+            cum100 = np.concatenate([[0], np.cumsum(team == 100)])
+            cum200 = np.concatenate([[0], np.cumsum(team == 200)])
+            self._code_index[code] = (keys, self._bounds(match_col), cum100, cum200)
+
+        return self._code_index[code]
+
+    # ---------------------------------------------------
+    # 조회
+    # ---------------------------------------------------
+    def counts_at(self, metric, timestamps, match_ids=None):
+        """timestamp(ms) 시점까지 누적 개수 → (team100, team200) 배열"""
+        matches = self._matches(match_ids)
+        t = np.broadcast_to(np.asarray(timestamps, dtype=np.int64), matches.shape)
+
+        keys, bounds, cum100, cum200 = self._event_index(self._code(metric))
+
+        start, stop = bounds[matches], bounds[matches + 1]
+        end = np.searchsorted(keys, matches * KEY_SHIFT + t, side="right")
+        end = np.clip(end, start, stop)     # 경기 구간 밖으로 넘어가지 않도록
+
+        return cum100[end] - cum100[start], cum200[end] - cum200[start]
+
+    def gold_at(self, timestamps, match_ids=None):
+        """timestamp(ms) 이전 마지막 프레임의 팀 골드 → (team100, team200) 배열 (프레임 없는 경기는 0)"""
+        matches = self._matches(match_ids)
+        t = np.broadcast_to(np.asarray(timestamps, dtype=np.int64), matches.shape)
+
+        if self._frame_index is None:
+            keys = self.fr_match.astype(np.int64) * KEY_SHIFT + self.fr_timestamp
+            self._frame_index = (keys, self._bounds(self.fr_match))
+        keys, bounds = self._frame_index
+
+        start, stop = bounds[matches], bounds[matches + 1]
+        pos = np.searchsorted(keys, matches * KEY_SHIFT + t, side="right") - 1
+        pos = np.clip(pos, start, stop - 1)     # 첫 프레임 이전 → 첫 프레임
+
+        has = stop > start
+        pos = np.where(has, pos, 0)
+        if not has.any():
+            zeros = np.zeros(matches.shape, dtype=self.fr_gold100.dtype)
+            return zeros, zeros.copy()
+
+        return (
+            np.where(has, self.fr_gold100[pos], 0),
+            np.where(has, self.fr_gold200[pos], 0),
+        )
+
+    def diff_at(self, metric, timestamps, match_ids=None):
+        """metric의 100 - 200 차이 (gold = 프레임 골드, 나머지 = 누적 개수)"""
+        if metric == "gold":
+            v100, v200 = self.gold_at(timestamps, match_ids)
+        else:
+            v100, v200 = self.counts_at(metric, timestamps, match_ids)
+        return v100.astype(np.int64) - v200
+
+    def first_time(self, metric, match_ids=None, team=None):
+        """경기별 첫 발생 timestamp(ms) (team 지정 시 해당 팀만, 없으면 -1)"""
+        matches = self._matches(match_ids)
+        keys, bounds, cum100, cum200 = self._event_index(self._code(metric))
+        start, end = bounds[matches], bounds[matches + 1]
+
+        if team is None:
+            first = start
+        else:
+            cum = cum100 if team == 100 else cum200
+            # prefix sum이 처음으로 늘어나는 위치 = 해당 팀 첫 이벤트
+            first = np.searchsorted(cum, cum[start] + 1, side="left") - 1
+
+        found = first < end
+        times = np.full(matches.shape, -1, dtype=np.int64)
+        times[found] = keys[first[found]] - matches[found] * KEY_SHIFT
+        return times
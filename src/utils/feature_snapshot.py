@@ -0,0 +1,169 @@
+"""
+feature_snapshot.py
+학습용 feature 행렬 스냅샷 (data/temp/snapshots/{fingerprint}/)
+
+- X.npy          : float64 (행 × feature)
+- y.npy          : int8 (행,) team100 승리 여부
+- time_bin.npy   : int16 (행,)
+- tier.npy       : int8 (행,) → manifest["tiers"] 인덱스
+- match_id.npy   : 고정 길이 문자열 (행,)
+- manifest.json  : fingerprint / 입력 파일 해시 / 설정 / feature 순서 / 행 수
+
+fingerprint = 입력 CSV 내용 해시 + 설정 (features / 시간 범위 / bin 크기 ...)
+→ 입력이나 설정이 바뀌면 다른 디렉터리가 되어 자동으로 다시 생성.
+파일 해시는 (크기, mtime)이 같으면 file_hashes.json 값을 재사용 → 반복 실행 시 CSV를 읽지 않음.
+
+.npy는 np.load(mmap_mode="r")로 열기 → 재실행 시 CSV 파싱 없이 바로 학습.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_VERSION = 1
+
+ARRAYS = ["X", "y", "time_bin", "tier", "match_id"]
+
+HASH_MEMO = "file_hashes.json"
+
+_HASH_BLOCK = 1 << 20
+
+
+# ---------------------------------------------------
+# fingerprint
+# ---------------------------------------------------
+def _load_memo(root):
+    path = os.path.join(root, HASH_MEMO)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_memo(root, memo):
+    os.makedirs(root, exist_ok=True)
+    tmp_path = os.path.join(root, HASH_MEMO + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(memo, f)
+    os.replace(tmp_path, os.path.join(root, HASH_MEMO))
+
+
+def file_hash(path, memo=None):
+    """파일 내용 blake2b, memo에 같은 (크기, mtime) 기록이 있으면 재사용"""
+    st = os.stat(path)
+    key = os.path.abspath(path)
+
+    if memo is not None:
+        cached = memo.get(key)
+        if cached and cached["size"] == st.st_size and cached["mtime_ns"] == st.st_mtime_ns:
+            return cached["hash"]
+
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            h.update(block)
+    digest = h.hexdigest()
+
+    if memo is not None:
+        memo[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest}
+    return digest
+
+
+def fingerprint(paths, params, root):
+    """(fingerprint, {파일 이름: 해시}) — 입력 파일 순서와 무관"""
+    memo = _load_memo(root)
+    before = dict(memo)
+
+    files = {os.path.basename(p): file_hash(p, memo) for p in sorted(paths)}
+
+    if memo != before:
+        _save_memo(root, memo)
+
+    payload = json.dumps(
+        {"version": SNAPSHOT_VERSION, "files": files, "params": params},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest(), files
+
+
+# ---------------------------------------------------
+# 저장 / 조회
+# ---------------------------------------------------
+def write_snapshot(path, arrays, manifest):
+    """arrays: ARRAYS 이름 → ndarray (임시 디렉터리 → os.replace)"""
+    tmp_path = path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    for name in ARRAYS:
+        np.save(os.path.join(tmp_path, f"{name}.npy"), arrays[name])
+
+    manifest = {**manifest, "rows": int(len(arrays["y"])), "arrays": ARRAYS}
+    with open(os.path.join(tmp_path, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+class FeatureSnapshot:
+    def __init__(self, path):
+        self.path = path
+
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+        self.fingerprint = self.manifest["fingerprint"]
+        self.features = self.manifest["features"]
+        self.tiers = self.manifest["tiers"]
+
+        for name in ARRAYS:
+            setattr(self, name, np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r"))
+
+    def __len__(self):
+        return len(self.y)
+
+    def tier_names(self):
+        return np.asarray(self.tiers, dtype=object)[self.tier]
+
+    def to_frame(self) -> pd.DataFrame:
+        """(matchId, time_bin, tier, features..., win) DataFrame"""
+        df = pd.DataFrame({
+            "matchId": np.asarray(self.match_id, dtype=object),
+            "time_bin": np.asarray(self.time_bin, dtype=np.int64),
+            "tier": self.tier_names(),
+        })
+        features = pd.DataFrame(np.asarray(self.X), columns=self.features)
+        df = pd.concat([df, features], axis=1)
+        df["win"] = np.asarray(self.y, dtype=np.int64)
+        return df
+
+
+def load_or_build(root, paths, params, build):
+    """
+    fingerprint가 같은 스냅샷이 있으면 mmap으로 열고, 없으면 build() → 저장
+    build() → (arrays, extra_manifest)
+    """
+    fp, files = fingerprint(paths, params, root)
+    path = os.path.join(root, fp)
+
+    if os.path.exists(os.path.join(path, "manifest.json")):
+        print(f"\n[LOAD] Snapshot: {path}")
+        return FeatureSnapshot(path)
+
+    arrays, extra = build()
+    manifest = {"fingerprint": fp, "files": files, "params": params, **extra}
+
+    os.makedirs(root, exist_ok=True)
+    write_snapshot(path, arrays, manifest)
+    print(f"[SAVE] Snapshot saved to: {path}")
+
+    return FeatureSnapshot(path)
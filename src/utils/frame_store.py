@@ -0,0 +1,169 @@
+"""
+frame_store.py
+참가자별 프레임 값 저장소 (data/processed/{tier}_frames/)
+
+- {stat}.npy         : int32 (경기 × 10 × 프레임), 경기 종료 이후 프레임은 0
+                       stat = totalGold / xp / minionsKilled / jungleMinionsKilled / level
+- n_frames.npy       : int32 (경기,) 경기별 프레임 수
+- lanes.npy          : int8 (경기 × 2 × 5) [팀(100, 200)][라인] → 참가자 slot (0~9)
+- participants.csv   : matchIndex / slot / participantId + extract_match_rows 컬럼 (lane, champion ...)
+- meta.json          : matchId 순서, stat 목록, frameInterval
+
+.npy는 np.load(mmap_mode="r")로 열기 → 티어 전체를 JSON 없이 바로 벡터 연산.
+
+예) 10분 라인별 골드 차이 (100 - 200)
+    store = FrameStore("data/processed/GOLD_I_frames")
+    diff = store.lane_diff("totalGold", 10)      # (경기 × 5), 열 순서 = LANE_ORDER
+"""
+
+import os
+import csv
+import json
+import shutil
+
+import numpy as np
+
+from src.utils.riot_api.extract_finish import LANE_ORDER
+from src.utils.riot_api.extract_frames import FRAME_STATS
+
+TEAMS = [100, 200]
+
+
+# ---------------------------------------------------
+# 저장 (체크포인트 → 디스크, 두 번 순회 / 경기 하나씩)
+# ---------------------------------------------------
+def write_frame_store(path, iter_entries):
+    """
+    iter_entries() → [(match_id, finish_rows, frames)] 반복자 (두 번 호출됨)
+    1차: 경기 수 / 최대 프레임 수 → 2차: open_memmap 배열에 채움
+    """
+
+    n_matches = 0
+    max_frames = 0
+    for _, finish, frames in iter_entries():
+        if frames and len(finish) == 10:
+            n_matches += 1
+            max_frames = max(max_frames, len(frames["stats"][FRAME_STATS[0]][0]))
+
+    tmp_path = path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    shape = (n_matches, 10, max_frames)
+    arrays = {
+        name: np.lib.format.open_memmap(
+            os.path.join(tmp_path, f"{name}.npy"), mode="w+", dtype=np.int32, shape=shape
+        )
+        for name in FRAME_STATS
+    }
+    n_frames = np.zeros(n_matches, dtype=np.int32)
+    lanes = np.zeros((n_matches, 2, len(LANE_ORDER)), dtype=np.int8)
+    match_ids = []
+    frame_intervals = []
+
+    with open(os.path.join(tmp_path, "participants.csv"), "w", newline="", encoding="utf-8") as f:
+        writer = None
+        idx = 0
+
+        for match_id, finish, frames in iter_entries():
+            if not frames or len(finish) != 10:
+                continue
+
+            for name in FRAME_STATS:
+                values = frames["stats"][name]
+                arrays[name][idx, :, :len(values[0])] = values
+            n_frames[idx] = len(frames["stats"][FRAME_STATS[0]][0])
+
+            # finish row 순서 = participants 순서 = slot
+            for slot, row in enumerate(finish):
+                lanes[idx, TEAMS.index(row["teamId"]), LANE_ORDER.index(row["lane"])] = slot
+
+                out = {"matchIndex": idx, "slot": slot, "participantId": frames["participantIds"][slot], **row}
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(out))
+                    writer.writeheader()
+                writer.writerow(out)
+
+            match_ids.append(match_id)
+            frame_intervals.append(frames["frameInterval"])
+            idx += 1
+
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    np.save(os.path.join(tmp_path, "n_frames.npy"), n_frames)
+    np.save(os.path.join(tmp_path, "lanes.npy"), lanes)
+
+    with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+        json.dump({
+            "match_ids": match_ids,
+            "stats": FRAME_STATS,
+            "lanes": LANE_ORDER,
+            "frame_interval": frame_intervals,
+        }, f)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+
+    return n_matches
+
+
+# ---------------------------------------------------
+# 조회
+# ---------------------------------------------------
+class FrameStore:
+    def __init__(self, path):
+        self.path = path
+
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+
+        self.match_ids = np.asarray(meta["match_ids"], dtype=str)
+        self.stats = meta["stats"]
+        self.lanes = meta["lanes"]
+        self.frame_interval = np.asarray(meta["frame_interval"], dtype=np.int32)
+
+        self.n_frames = np.load(os.path.join(path, "n_frames.npy"))
+        self.lane_slots = np.load(os.path.join(path, "lanes.npy"))
+
+        self._arrays = {}
+
+    def __len__(self):
+        return len(self.match_ids)
+
+    def stat(self, name):
+        """(경기 × 10 × 프레임) int32 memmap"""
+        if name not in self.stats:
+            raise ValueError(f"알 수 없는 stat: {name} ({', '.join(self.stats)})")
+        if name not in self._arrays:
+            self._arrays[name] = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+        return self._arrays[name]
+
+    def participants(self):
+        """participants.csv (matchIndex / slot 으로 배열과 조인)"""
+        import pandas as pd
+        return pd.read_csv(os.path.join(self.path, "participants.csv"))
+
+    def at_frame(self, name, frame):
+        """프레임 시점 값 (경기 × 10), 끝난 경기는 마지막 프레임 값"""
+        values = self.stat(name)
+        last = np.maximum(self.n_frames - 1, 0)
+        idx = np.minimum(np.asarray(frame), last)
+        return values[np.arange(len(self)), :, idx]
+
+    def lane_diff(self, name, frame):
+        """라인별 100 - 200 차이 (경기 × 5), 열 순서 = self.lanes"""
+        values = self.at_frame(name, frame).astype(np.int64)
+        blue = np.take_along_axis(values, self.lane_slots[:, 0, :].astype(np.intp), axis=1)
+        red = np.take_along_axis(values, self.lane_slots[:, 1, :].astype(np.intp), axis=1)
+        return blue - red
+
+    def lane_diff_series(self, name):
+        """모든 프레임의 라인별 차이 (경기 × 5 × 프레임) + 유효 프레임 mask (경기 × 프레임)"""
+        values = np.asarray(self.stat(name), dtype=np.int64)
+        blue = np.take_along_axis(values, self.lane_slots[:, 0, :, None].astype(np.intp), axis=1)
+        red = np.take_along_axis(values, self.lane_slots[:, 1, :, None].astype(np.intp), axis=1)
+
+        mask = np.arange(values.shape[2])[None, :] < self.n_frames[:, None]
+        return blue - red, mask
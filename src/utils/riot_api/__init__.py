@@ -2,7 +2,15 @@ from .players import fetch_players_by_tier
 from .matches import fetch_match_ids, fetch_match_info
 from .timeline import fetch_match_timeline
 from .extract_finish import extract_match_rows
-from .extract_timeline import extract_timeline_features
+from .extract_timeline import (
+    extract_timeline_features,
+    extract_timeline_long,
+    extract_timeline_batch,
+)
+from .extract_events import extract_event_rows
+from .extract_frames import extract_participant_frames
+from .session import create_session
+from .decode import decode_match, decode_timeline
 
 __all__ = [
     "fetch_players_by_tier",
@@ -11,4 +19,11 @@ __all__ = [
     "fetch_match_timeline",
     "extract_match_rows",
     "extract_timeline_features",
+    "extract_timeline_long",
+    "extract_timeline_batch",
+    "extract_event_rows",
+    "extract_participant_frames",
+    "create_session",
+    "decode_match",
+    "decode_timeline",
 ]
@@ -0,0 +1,181 @@
+"""
+cache.py
+원본 JSON 디스크 캐시
+
+- MATCH_CACHE : match / timeline JSON (경기 종료 후 바뀌지 않음 → 만료 없음)
+  · key = sha256("endpoint:matchId") → data/cache/matches/ab/abcd....json.gz
+  · gzip 압축 저장, 임시 파일 → os.replace 로 원자적 쓰기
+  · 전체 용량이 max_bytes 를 넘으면 가장 오래 안 쓴 파일부터 삭제 (LRU)
+  · 압축이 깨진 파일 (쓰다 중단 / 디스크 오류) 은 읽을 때 삭제하고 miss 처리
+- LEAGUE_CACHE : league entry 페이지 (시간에 따라 바뀜 → 짧은 TTL)
+"""
+
+import os
+import gzip
+import json
+import zlib
+import time
+import asyncio
+import hashlib
+import threading
+
+# 저장소 루트 기준 (실행 위치와 무관)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+CACHE_DIR = os.path.join(ROOT_DIR, "data", "cache")
+
+MATCH_CACHE_MAX_BYTES = 20 * 1024 ** 3     # 20GB
+LEAGUE_CACHE_TTL = 6 * 60 * 60             # 6시간
+
+# 용량 초과 시 이 비율까지 줄임
+EVICT_TARGET_RATIO = 0.9
+
+
+class BlobCache:
+    def __init__(self, root, max_bytes=None, ttl=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._total_bytes = None    # 첫 put 때 한 번만 계산
+
+    # ---------------------------------------------------
+    # 경로
+    # ---------------------------------------------------
+    def _path(self, namespace, key):
+        digest = hashlib.sha256(f"{namespace}:{key}".encode()).hexdigest()
+        return os.path.join(self.root, digest[:2], f"{digest}.json.gz")
+
+    # ---------------------------------------------------
+    # 읽기 / 쓰기 (bytes)
+    # ---------------------------------------------------
+    def get(self, namespace, key):
+        path = self._path(namespace, key)
+
+        try:
+            stat = os.stat(path)
+            if self.ttl is not None and time.time() - stat.st_mtime > self.ttl:
+                return None
+
+            with open(path, "rb") as f:
+                blob = f.read()
+        except OSError:
+            return None
+
+        try:
+            data = gzip.decompress(blob)
+        except (gzip.BadGzipFile, zlib.error, EOFError):
+            # 깨진 파일 → 삭제 후 miss (다음 요청에서 다시 받아서 저장)
+            self._discard(path, len(blob))
+            return None
+
+        # LRU: 사용 시각 갱신 (TTL 캐시는 저장 시각 유지)
+        if self.ttl is None:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        return data
+
+    def put(self, namespace, key, data):
+        path = self._path(namespace, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        blob = gzip.compress(data, compresslevel=6)
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(blob)
+
+        # 같은 key 덮어쓰기 (재수집 / TTL 갱신) → 기존 파일 크기만큼 빼기
+        try:
+            old_size = os.stat(path).st_size
+        except OSError:
+            old_size = 0
+        os.replace(tmp_path, path)
+
+        if self.max_bytes is not None:
+            with self._lock:
+                if self._total_bytes is None:
+                    self._total_bytes = self._scan_size()
+                else:
+                    self._total_bytes += len(blob) - old_size
+
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+
+    def _discard(self, path, size):
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        print(f"[cache] 손상된 파일 삭제: {path}")
+
+        if self.max_bytes is not None:
+            with self._lock:
+                if self._total_bytes is not None:
+                    self._total_bytes -= size
+
+    # ---------------------------------------------------
+    # LRU 정리
+    # ---------------------------------------------------
+    def _entries(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".json.gz"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def _scan_size(self):
+        return sum(size for _, _, size in self._entries())
+
+    def _evict(self):
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        entries = sorted(self._entries(), key=lambda e: e[1])
+
+        total = sum(size for _, _, size in entries)
+        removed = 0
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        self._total_bytes = total
+        print(f"[cache] 용량 초과 → {removed}개 삭제 ({self.root})")
+
+    # ---------------------------------------------------
+    # async 헬퍼 (파일 IO는 스레드에서)
+    # ---------------------------------------------------
+    async def get_bytes(self, namespace, key):
+        return await asyncio.to_thread(self.get, namespace, key)
+
+    async def put_bytes(self, namespace, key, data):
+        await asyncio.to_thread(self.put, namespace, key, data)
+
+    async def get_json(self, namespace, key):
+        data = await asyncio.to_thread(self.get, namespace, key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    async def put_json(self, namespace, key, obj):
+        data = json.dumps(obj, separators=(",", ":")).encode()
+        await asyncio.to_thread(self.put, namespace, key, data)
+
+
+MATCH_CACHE = BlobCache(os.path.join(CACHE_DIR, "matches"), max_bytes=MATCH_CACHE_MAX_BYTES)
+LEAGUE_CACHE = BlobCache(os.path.join(CACHE_DIR, "league"), ttl=LEAGUE_CACHE_TTL)
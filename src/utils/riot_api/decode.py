@@ -0,0 +1,114 @@
+"""
+decode.py
+match / timeline JSON 빠른 디코딩 (추출에 쓰는 필드만 생성)
+
+- msgspec 설치 시: TypedDict 스키마로 디코딩 → 스키마에 없는 필드는 dict로 만들지 않음
+  (participant 위치, damageStats, 아이템 이벤트 세부 필드 등 생략)
+- msgspec 없으면 orjson, 그것도 없으면 표준 json으로 전체 디코딩
+
+결과는 일반 dict / list 이므로 extract_* 함수는 그대로 사용.
+HTTP 응답 bytes와 캐시 blob(bytes) 모두 같은 함수로 디코딩.
+"""
+
+import json
+from typing import Any, TypedDict
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ---------------------------------------------------
+# Timeline 스키마 (extract_timeline_features / extract_event_rows / extract_participant_frames 사용 필드)
+# ---------------------------------------------------
+class TimelineEvent(TypedDict, total=False):
+    type: Any
+    timestamp: Any
+    killerId: Any
+    killerTeamId: Any
+    teamId: Any
+    monsterType: Any
+    monsterSubType: Any
+    killType: Any
+    predefinedTargetId: Any
+    buildingType: Any
+    towerType: Any
+    laneType: Any
+
+
+class ParticipantFrame(TypedDict, total=False):
+    totalGold: Any
+    xp: Any
+    minionsKilled: Any
+    jungleMinionsKilled: Any
+    level: Any
+
+
+class TimelineFrame(TypedDict, total=False):
+    timestamp: Any
+    participantFrames: dict[str, ParticipantFrame]
+    events: list[TimelineEvent]
+
+
+class TimelineInfo(TypedDict, total=False):
+    frameInterval: Any
+    frames: list[TimelineFrame]
+
+
+class TimelineDoc(TypedDict, total=False):
+    info: TimelineInfo
+
+
+# ---------------------------------------------------
+# Match 스키마 (extract_match_rows / extract_timeline_features 사용 필드)
+# ---------------------------------------------------
+class MatchParticipant(TypedDict, total=False):
+    participantId: Any
+    teamId: Any
+    puuid: Any
+    win: Any
+    championName: Any
+
+
+class MatchInfo(TypedDict, total=False):
+    gameDuration: Any
+    participants: list[MatchParticipant]
+
+
+class MatchMetadata(TypedDict, total=False):
+    matchId: Any
+
+
+class MatchDoc(TypedDict, total=False):
+    metadata: MatchMetadata
+    info: MatchInfo
+
+
+if msgspec is not None:
+    _TIMELINE_DECODER = msgspec.json.Decoder(TimelineDoc)
+    _MATCH_DECODER = msgspec.json.Decoder(MatchDoc)
+
+
+def decode_json(data):
+    """스키마 없이 전체 디코딩 (orjson 우선)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_timeline(data):
+    if msgspec is not None:
+        return _TIMELINE_DECODER.decode(data)
+    return decode_json(data)
+
+
+def decode_match(data):
+    if msgspec is not None:
+        return _MATCH_DECODER.decode(data)
+    return decode_json(data)
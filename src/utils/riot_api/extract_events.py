@@ -0,0 +1,83 @@
+"""
+extract_events.py
+경기 1개 → 이벤트 단위 컬럼 + 프레임 단위 팀 골드
+
+1분 단위로 합치기 전의 원본 시점을 남김 → 30초 단위 / "첫 바론 시점" 같은 분석을
+JSON 재수집 없이 src/utils/event_table.py 의 EventTable 로 조회.
+
+- events : timestamp / code / team / subtype (이벤트 1개 = 1칸)
+  · code    = EVENT_CODES 인덱스 (kill + 오브젝트 registry 순서)
+  · team    = 점수를 얻은 팀 (timeline 컬럼과 같은 기준, 100 이외는 200)
+  · subtype = monsterSubType / laneType (없으면 None)
+- frames : timestamp / gold100 / gold200 (모든 프레임)
+"""
+
+from .extract_timeline import OBJECTIVES, _classify_objective
+
+# kill = CHAMPION_KILL (killer 팀), 나머지 = 누적 오브젝트
+EVENT_CODES = ["kill", *OBJECTIVES]
+
+
+def extract_event_rows(match_json: dict, timeline_json: dict):
+
+    match_id = match_json["metadata"]["matchId"]
+
+    # timeline 컬럼과 같은 기준으로 깨진 경기 제외
+    if not timeline_json["info"].get("frameInterval", 60000):
+        print(f"[경고] frameInterval=0 → event 추출 불가: {match_id}")
+        return None
+
+    frames = timeline_json["info"]["frames"]
+
+    participants = match_json["info"]["participants"]
+    pid_to_team = {p["participantId"]: p["teamId"] for p in participants}
+
+    timestamps, codes, teams, subtypes = [], [], [], []
+    frame_ts, gold100, gold200 = [], [], []
+
+    for frame in frames:
+
+        # ----- 팀 골드 -----
+        g100 = g200 = 0
+        for pid_str, pdata in frame["participantFrames"].items():
+            if pid_to_team[int(pid_str)] == 100:
+                g100 += pdata["totalGold"]
+            else:
+                g200 += pdata["totalGold"]
+
+        frame_ts.append(frame.get("timestamp", 0))
+        gold100.append(g100)
+        gold200.append(g200)
+
+        # ----- 이벤트 -----
+        for ev in frame.get("events", []):
+            if ev.get("type") == "CHAMPION_KILL":
+                team = pid_to_team.get(ev.get("killerId", 0))
+                if team not in (100, 200):
+                    continue
+                code = 0
+                subtype = None
+            else:
+                slot, team = _classify_objective(ev)
+                if slot is None:
+                    continue
+                code = 1 + slot // 2
+                team = 100 if team == 100 else 200
+                subtype = ev.get("monsterSubType") or ev.get("laneType")
+
+            timestamps.append(ev.get("timestamp", 0))
+            codes.append(code)
+            teams.append(team)
+            subtypes.append(subtype)
+
+    return {
+        "timestamp": timestamps,
+        "code": codes,
+        "team": teams,
+        "subtype": subtypes,
+        "frames": {
+            "timestamp": frame_ts,
+            "gold100": gold100,
+            "gold200": gold200,
+        },
+    }
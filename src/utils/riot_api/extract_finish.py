@@ -1,3 +1,6 @@
+LANE_ORDER = ["TOP", "JUNGLE", "MID", "ADC", "SUPPORT"]
+
+
 def extract_match_rows(match_json):
     if match_json is None:
         return []
@@ -8,15 +11,13 @@ def extract_match_rows(match_json):
     game_duration = info["gameDuration"]
     participants = info["participants"]
 
-    lane_order = ["TOP", "JUNGLE", "MID", "ADC", "SUPPORT"]
-
     team_players = {100: [], 200: []}
     for p in participants:
         team_players[p["teamId"]].append(p)
 
     for tid in [100, 200]:
         for idx, p in enumerate(team_players[tid]):
-            p["_fixed_lane"] = lane_order[idx]
+            p["_fixed_lane"] = LANE_ORDER[idx]
 
     lane_map = {}
     for p in participants:
@@ -0,0 +1,40 @@
+"""
+extract_frames.py
+경기 1개 → 참가자별 프레임 값 (totalGold / xp / CS / 정글 CS / level)
+
+frame_gold_kills는 팀 골드만 남기므로, 라인별 분석용으로 참가자 단위 값을 따로 저장.
+참가자 순서 = info.participants 순서 (= extract_match_rows row 순서)
+→ src/utils/frame_store.py 에서 (경기 × 10 × 프레임) int32 배열로 저장.
+"""
+
+FRAME_STATS = ["totalGold", "xp", "minionsKilled", "jungleMinionsKilled", "level"]
+
+
+def extract_participant_frames(match_json: dict, timeline_json: dict):
+
+    match_id = match_json["metadata"]["matchId"]
+    participants = match_json["info"]["participants"]
+
+    # 라인 매칭은 5 vs 5 기준
+    if len(participants) != 10:
+        print(f"[경고] 참가자 {len(participants)}명 → frame 추출 불가: {match_id}")
+        return None
+
+    frames = timeline_json["info"]["frames"]
+    pids = [str(p["participantId"]) for p in participants]
+
+    # stats[stat][참가자][프레임]
+    stats = {name: [[] for _ in pids] for name in FRAME_STATS}
+
+    for frame in frames:
+        pf = frame["participantFrames"]
+        for i, pid in enumerate(pids):
+            pdata = pf.get(pid, {})
+            for name in FRAME_STATS:
+                stats[name][i].append(pdata.get(name, 0))
+
+    return {
+        "participantIds": [p["participantId"] for p in participants],
+        "frameInterval": timeline_json["info"].get("frameInterval", 60000),
+        "stats": stats,
+    }
@@ -9,9 +9,137 @@ extension_timeline.py
 - grubDiff (HORDE / VOID_GRUB / VOID_LARVA)
 - outerTowerDiff / innerTowerDiff / baseTowerDiff / nexusTowerDiff
 - inhibitorDiff
+
+extract_timeline_features : 경기 1개 → CSV row dict (goldDiff_17 ...)
+extract_timeline_long     : 경기 1개 → long 형식 컬럼 (분 1개 = 1행, win / tier 포함)
+extract_timeline_batch    : 경기 여러 개 → int32 배열 (경기 × 분 × metric)
 """
 
-def extract_timeline_features(match_json: dict, timeline_json: dict):
+from typing import NamedTuple
+
+import numpy as np
+
+# ---------------------------------------------------
+# 오브젝트 카운터 registry (timestamp <= minute 기준 누적)
+# ---------------------------------------------------
+class ObjectiveCounter(NamedTuple):
+    name: str                   # metric 이름 (dragon → dragon100 / dragon200 / dragonDiff)
+    event_type: str             # 이벤트 type
+    match: dict                 # 필드 → 값 (값 튜플 = 그중 하나, 필드 튜플 = 값이 있는 첫 필드)
+    team: tuple = ("killerTeamId",)     # 팀 필드 (값이 있는 첫 필드, 100 이외는 200으로 집계)
+    priority: int = 0           # 같은 type 안에서 먼저 확인 (높을수록 먼저)
+
+
+OBJECTIVE_COUNTERS = [
+    # ----- Monsters -----
+    ObjectiveCounter("dragon", "ELITE_MONSTER_KILL", {"monsterType": "DRAGON"}),
+    # Elder Dragon (중요: monsterSubType으로만 구분됨 → 일반 드래곤보다 먼저 확인)
+    ObjectiveCounter("elder", "ELITE_MONSTER_KILL", {"monsterSubType": "ELDER_DRAGON"}, priority=1),
+    ObjectiveCounter("herald", "ELITE_MONSTER_KILL", {"monsterType": "RIFTHERALD"}),
+    ObjectiveCounter("baron", "ELITE_MONSTER_KILL", {"monsterType": "BARON_NASHOR"}),
+    ObjectiveCounter("atakhan", "ELITE_MONSTER_KILL", {"monsterType": "ATAKHAN"}),
+    # Grub / Horde (신규 패치)
+    ObjectiveCounter("grub", "ELITE_MONSTER_KILL", {"monsterType": "HORDE"}),
+    # Legacy Grub (VOID_GRUB / VOID_LARVA)
+    ObjectiveCounter(
+        "grub", "KILL_PREDEFINED_TARGET",
+        {("killType", "predefinedTargetId"): ("VOID_GRUB", "VOID_LARVA")},
+        team=("killerTeamId", "teamId"),
+    ),
+
+    # ----- Buildings (teamId = 건물을 잃은 팀) -----
+    ObjectiveCounter("outerTower", "BUILDING_KILL",
+                     {"buildingType": "TOWER_BUILDING", "towerType": "OUTER_TURRET"}, team=("teamId",)),
+    ObjectiveCounter("innerTower", "BUILDING_KILL",
+                     {"buildingType": "TOWER_BUILDING", "towerType": "INNER_TURRET"}, team=("teamId",)),
+    ObjectiveCounter("baseTower", "BUILDING_KILL",
+                     {"buildingType": "TOWER_BUILDING", "towerType": "BASE_TURRET"}, team=("teamId",)),
+    ObjectiveCounter("nexusTower", "BUILDING_KILL",
+                     {"buildingType": "TOWER_BUILDING", "towerType": "NEXUS_TURRET"}, team=("teamId",)),
+    ObjectiveCounter("inhibitor", "BUILDING_KILL",
+                     {"buildingType": "INHIBITOR_BUILDING"}, team=("teamId",)),
+]
+
+# 출력 순서 = registry 선언 순서 (같은 이름은 한 번)
+OBJECTIVES = list(dict.fromkeys(c.name for c in OBJECTIVE_COUNTERS))
+
+# metric 그룹 순서 = CSV 컬럼 순서 (각 그룹은 100 / 200 / Diff)
+METRIC_GROUPS = ["gold", "kill", *OBJECTIVES]
+TIMELINE_METRICS = [f"{group}{side}" for group in METRIC_GROUPS for side in ("100", "200", "Diff")]
+
+
+def _event_field(ev, field):
+    """필드 튜플 → 값이 있는 첫 필드 (a or b 와 동일)"""
+    if isinstance(field, tuple):
+        value = None
+        for f in field:
+            value = ev.get(f)
+            if value:
+                return value
+        return value
+    return ev.get(field)
+
+
+def _compile_counters(counters):
+    """
+    registry → {event type: [(필드 튜플, {값 튜플: (slot, team 필드)})]}
+
+    이벤트 1개 = type 조회 1번 (대부분의 이벤트는 여기서 끝)
+    + 같은 필드 조합끼리 묶은 dict 조회 (priority 순)
+    """
+    slot_of = {name: i * 2 for i, name in enumerate(dict.fromkeys(c.name for c in counters))}
+
+    groups = {}    # (event_type, fields) → [priority, 선언 순서, table]
+    for order, c in enumerate(counters):
+        fields = tuple(c.match)
+        group = groups.setdefault((c.event_type, fields), [c.priority, order, {}])
+        group[0] = max(group[0], c.priority)
+
+        # 값 튜플 조합 전개 → 정확히 일치하는 key
+        keys = [()]
+        for field in fields:
+            allowed = c.match[field]
+            if not isinstance(allowed, tuple):
+                allowed = (allowed,)
+            keys = [k + (v,) for k in keys for v in allowed]
+
+        for key in keys:
+            group[2].setdefault(key, (slot_of[c.name], c.team))
+
+    dispatch = {}
+    for (event_type, fields), (priority, order, table) in sorted(
+        groups.items(), key=lambda g: (-g[1][0], g[1][1])
+    ):
+        dispatch.setdefault(event_type, []).append((fields, table))
+
+    return dispatch
+
+
+OBJECTIVE_DISPATCH = _compile_counters(OBJECTIVE_COUNTERS)
+
+
+def _classify_objective(ev):
+    """이벤트 → (slot, team) / 해당 없음 → (None, None)"""
+    probes = OBJECTIVE_DISPATCH.get(ev.get("type"))
+    if probes is None:
+        return None, None
+
+    for fields, table in probes:
+        hit = table.get(tuple(_event_field(ev, f) for f in fields))
+        if hit is not None:
+            slot, team_fields = hit
+            return slot, _event_field(ev, team_fields)
+
+    return None, None
+
+
+def _minute_counts(match_json: dict, timeline_json: dict):
+    """
+    경기 1개 → (match_id, game_duration, total_minutes, rows)
+    rows[minute] = [gold100, gold200, kill100, kill200, dragon100, dragon200, ...]
+                   (METRIC_GROUPS 순서, 팀별 값만 / Diff 없음)
+    frameInterval=0 → None
+    """
 
     info = match_json["info"]
     match_id = match_json["metadata"]["matchId"]
@@ -61,7 +189,7 @@ def extract_timeline_features(match_json: dict, timeline_json: dict):
             team = pid_to_team[pid]
             gold = pdata["totalGold"]
 
-            if team == 100: 
+            if team == 100:
                 t100_gold += gold
             else:
                 t200_gold += gold
@@ -78,134 +206,57 @@ def extract_timeline_features(match_json: dict, timeline_json: dict):
         return t100_gold, t200_gold, t100_kill, t200_kill
 
     # ---------------------------------------------------
-    # Monsters: Dragon / Elder / Herald / Baron / Atakhan / Grub
+    # Monsters / Buildings: 이벤트 1회 순회 (OBJECTIVE_DISPATCH) → 분별 증가량 → 누적
     # ---------------------------------------------------
-    def scan_monsters(minute):
-        target_ms = minute * 60 * 1000
-
-        d100 = d200 = 0
-        e100 = e200 = 0
-        h100 = h200 = 0
-        b100 = b200 = 0
-        a100 = a200 = 0
-        g100 = g200 = 0  # Grub / Larva / Horde
-
-        for frame in frames:
-            for ev in frame.get("events", []):
-                ts = ev.get("timestamp", 0)
-                if ts > target_ms:
-                    continue
-
-                etype = ev.get("type")
-
-                if etype == "ELITE_MONSTER_KILL":
-                    team = ev.get("killerTeamId")
-                    mtype = ev.get("monsterType")
-                    msub = ev.get("monsterSubType")
-
-                    # ----- Elder Dragon (중요: monsterSubType으로만 구분됨) -----
-                    if msub == "ELDER_DRAGON":
-                        if team == 100: 
-                            e100 += 1
-                        else: 
-                            e200 += 1
-
-                    # ----- Normal Dragons -----
-                    elif mtype == "DRAGON":
-                        if team == 100: 
-                            d100 += 1
-                        else: 
-                            d200 += 1
-
-                    # Herald
-                    elif mtype == "RIFTHERALD":
-                        if team == 100:
-                            h100 += 1
-                        else:
-                            h200 += 1
-
-                    # Baron
-                    elif mtype == "BARON_NASHOR":
-                        if team == 100:
-                            b100 += 1
-                        else:
-                            b200 += 1
-
-                    # Atakhan
-                    elif mtype == "ATAKHAN":
-                        if team == 100:
-                            a100 += 1
-                        else:
-                            a200 += 1
-
-                    # Grub / Horde (신규 패치)
-                    elif mtype == "HORDE":
-                        if team == 100:
-                            g100 += 1
-                        else:
-                            g200 += 1
-
-                # Legacy Grub (VOID_GRUB / VOID_LARVA)
-                elif etype == "KILL_PREDEFINED_TARGET":
-                    kill_type = ev.get("killType") or ev.get("predefinedTargetId")
-                    if kill_type in ("VOID_GRUB", "VOID_LARVA"):
-                        team = ev.get("killerTeamId") or ev.get("teamId")
-                        if team == 100:
-                            g100 += 1
-                        else:
-                            g200 += 1
-
-        return d100, d200, e100, e200, h100, h200, b100, b200, a100, a200, g100, g200
+    # minute 값 = timestamp <= minute * 60000 인 이벤트 누적 개수
+    # → 이벤트는 ceil(timestamp / 60000) 분부터 포함됨
+    # deltas[minute][slot] : 해당 분에 새로 포함되는 개수 (slot = objective*2 + 팀)
+    n_slots = len(OBJECTIVES) * 2
+    deltas = [[0] * n_slots for _ in range(total_minutes + 1)]
+
+    for frame in frames:
+        for ev in frame.get("events", []):
+            slot, team = _classify_objective(ev)
+            if slot is None:
+                continue
+
+            ts = ev.get("timestamp", 0)
+            minute = int(max(0, -(-ts // 60000)))    # ceil
+            if minute > total_minutes:
+                continue
+
+            # team 100 이외 (200 / 300 / 없음)는 200으로 집계
+            deltas[minute][slot + (0 if team == 100 else 1)] += 1
 
     # ---------------------------------------------------
-    # Buildings
+    # 분별 값
     # ---------------------------------------------------
-    def scan_buildings(minute):
-        target_ms = minute * 60 * 1000
+    rows = []
+    counts = [0] * n_slots
 
-        out100 = out200 = 0
-        inn100 = inn200 = 0
-        base100 = base200 = 0
-        nex100 = nex200 = 0
-        inh100 = inh200 = 0
-
-        for frame in frames:
-            for ev in frame.get("events", []):
-                ts = ev.get("timestamp", 0)
-                if ts > target_ms:
-                    continue
+    for minute in range(total_minutes + 1):
 
-                if ev.get("type") != "BUILDING_KILL":
-                    continue
+        # gold, kill
+        g100, g200, k100, k200 = frame_gold_kills(safe_frame(minute))
 
-                team = ev.get("teamId")
-                btype = ev.get("buildingType")
-                ttype = ev.get("towerType")
+        # monsters / buildings (누적)
+        for i, d in enumerate(deltas[minute]):
+            counts[i] += d
 
-                if btype == "TOWER_BUILDING":
-                    if ttype == "OUTER_TURRET":
-                        if team == 100: out100 += 1
-                        else: out200 += 1
+        rows.append([g100, g200, k100, k200, *counts])
 
-                    elif ttype == "INNER_TURRET":
-                        if team == 100: inn100 += 1
-                        else: inn200 += 1
+    return match_id, game_duration, total_minutes, rows
 
-                    elif ttype == "BASE_TURRET":
-                        if team == 100: base100 += 1
-                        else: base200 += 1
 
-                    elif ttype == "NEXUS_TURRET":
-                        if team == 100: nex100 += 1
-                        else: nex200 += 1
+def extract_timeline_features(match_json: dict, timeline_json: dict):
 
-                elif btype == "INHIBITOR_BUILDING":
-                    if team == 100: inh100 += 1
-                    else: inh200 += 1
+    counted = _minute_counts(match_json, timeline_json)
+    if counted is None:
+        return None
 
-        return out100, out200, inn100, inn200, base100, base200, nex100, nex200, inh100, inh200
+    match_id, game_duration, total_minutes, rows = counted
 
-        # ---------------------------------------------------
+    # ---------------------------------------------------
     # Build CSV Row
     # ---------------------------------------------------
     result = {
@@ -214,76 +265,106 @@ def extract_timeline_features(match_json: dict, timeline_json: dict):
         "maxMinute": total_minutes
     }
 
-    for minute in range(total_minutes + 1):
+    for minute, row in enumerate(rows):
+        # Gold / Kills / Monsters / Buildings (team별 + diff)
+        for i, group in enumerate(METRIC_GROUPS):
+            v100 = row[i * 2]
+            v200 = row[i * 2 + 1]
 
-        # gold, kill
-        g100, g200, k100, k200 = frame_gold_kills(safe_frame(minute))
+            result[f"{group}100_{minute}"] = v100
+            result[f"{group}200_{minute}"] = v200
+            result[f"{group}Diff_{minute}"] = v100 - v200
 
-        # monsters
-        d100, d200, e100, e200, h100, h200, b100, b200, a100, a200, gr100, gr200 = scan_monsters(minute)
-
-        # buildings
-        out100, out200, inn100, inn200, base100, base200, nex100, nex200, inh100, inh200 = scan_buildings(minute)
-
-        # --------------------------
-        # Gold / Kills (team별 + diff)
-        # --------------------------
-        result[f"gold100_{minute}"] = g100
-        result[f"gold200_{minute}"] = g200
-        result[f"goldDiff_{minute}"] = g100 - g200
-
-        result[f"kill100_{minute}"] = k100
-        result[f"kill200_{minute}"] = k200
-        result[f"killDiff_{minute}"] = k100 - k200
-
-        # --------------------------
-        # Monsters (team별 + diff)
-        # --------------------------
-        result[f"dragon100_{minute}"] = d100
-        result[f"dragon200_{minute}"] = d200
-        result[f"dragonDiff_{minute}"] = d100 - d200
-
-        result[f"elder100_{minute}"] = e100
-        result[f"elder200_{minute}"] = e200
-        result[f"elderDiff_{minute}"] = e100 - e200
-
-        result[f"herald100_{minute}"] = h100
-        result[f"herald200_{minute}"] = h200
-        result[f"heraldDiff_{minute}"] = h100 - h200
-
-        result[f"baron100_{minute}"] = b100
-        result[f"baron200_{minute}"] = b200
-        result[f"baronDiff_{minute}"] = b100 - b200
-
-        result[f"atakhan100_{minute}"] = a100
-        result[f"atakhan200_{minute}"] = a200
-        result[f"atakhanDiff_{minute}"] = a100 - a200
-
-        result[f"grub100_{minute}"] = gr100
-        result[f"grub200_{minute}"] = gr200
-        result[f"grubDiff_{minute}"] = gr100 - gr200
-
-        # --------------------------
-        # Buildings (team별 + diff)
-        # --------------------------
-        result[f"outerTower100_{minute}"] = out100
-        result[f"outerTower200_{minute}"] = out200
-        result[f"outerTowerDiff_{minute}"] = out100 - out200
-
-        result[f"innerTower100_{minute}"] = inn100
-        result[f"innerTower200_{minute}"] = inn200
-        result[f"innerTowerDiff_{minute}"] = inn100 - inn200
-
-        result[f"baseTower100_{minute}"] = base100
-        result[f"baseTower200_{minute}"] = base200
-        result[f"baseTowerDiff_{minute}"] = base100 - base200
-
-        result[f"nexusTower100_{minute}"] = nex100
-        result[f"nexusTower200_{minute}"] = nex200
-        result[f"nexusTowerDiff_{minute}"] = nex100 - nex200
-
-        result[f"inhibitor100_{minute}"] = inh100
-        result[f"inhibitor200_{minute}"] = inh200
-        result[f"inhibitorDiff_{minute}"] = inh100 - inh200
+    return result
+
+
+def extract_timeline_long(match_json: dict, timeline_json: dict, tier=None):
+    """
+    wide 컬럼 (goldDiff_17) 대신 (matchId, minute, metric...) long 형식 컬럼 dict
+    win = team100 승리 여부, tier = 수집 티어
+    """
+
+    counted = _minute_counts(match_json, timeline_json)
+    if counted is None:
+        return None
+
+    match_id, game_duration, total_minutes, rows = counted
+    n = len(rows)
+
+    win = next(
+        (int(p["win"]) for p in match_json["info"]["participants"] if p["teamId"] == 100), None
+    )
+
+    result = {
+        "matchId": [match_id] * n,
+        "tier": [tier] * n,
+        "minute": list(range(n)),
+        "gameDuration": [game_duration] * n,
+        "maxMinute": [total_minutes] * n,
+        "win": [win] * n,
+    }
+
+    for i, group in enumerate(METRIC_GROUPS):
+        v100 = [row[i * 2] for row in rows]
+        v200 = [row[i * 2 + 1] for row in rows]
+
+        result[f"{group}100"] = v100
+        result[f"{group}200"] = v200
+        result[f"{group}Diff"] = [a - b for a, b in zip(v100, v200)]
 
     return result
+
+
+# ---------------------------------------------------
+# Batch (NumPy)
+# ---------------------------------------------------
+class TimelineBatch(NamedTuple):
+    match_ids: list          # 경기 순서 (frameInterval=0 경기는 제외됨)
+    game_duration: np.ndarray    # (경기,) int32
+    max_minute: np.ndarray       # (경기,) int32
+    values: np.ndarray           # (경기 × 분 × metric) int32, maxMinute 이후는 0
+    mask: np.ndarray             # (경기 × 분) bool, minute <= maxMinute
+    metrics: list                # metric 이름 (values 마지막 축 순서)
+    metric_index: dict           # metric 이름 → 인덱스
+
+
+def extract_timeline_batch(pairs, n_minutes=None):
+    """
+    [(match_json, timeline_json)] → TimelineBatch
+
+    f-string 컬럼 dict 대신 미리 할당한 배열 하나에 채움.
+    n_minutes 지정 시 분 축 길이 고정 (더 긴 경기는 잘림), 없으면 가장 긴 경기 기준.
+    """
+
+    counted = [c for c in (_minute_counts(m, t) for m, t in pairs) if c is not None]
+
+    if n_minutes is None:
+        n_minutes = max((c[2] + 1 for c in counted), default=0)
+
+    n_metrics = len(TIMELINE_METRICS)
+    values = np.zeros((len(counted), n_minutes, n_metrics), dtype=np.int32)
+    game_duration = np.zeros(len(counted), dtype=np.int32)
+    max_minute = np.zeros(len(counted), dtype=np.int32)
+
+    for i, (_, duration, total_minutes, rows) in enumerate(counted):
+        game_duration[i] = duration
+        max_minute[i] = total_minutes
+
+        team = np.asarray(rows[:n_minutes], dtype=np.int32)     # (분 × 팀별 값)
+        n = len(team)
+
+        values[i, :n, 0::3] = team[:, 0::2]
+        values[i, :n, 1::3] = team[:, 1::2]
+        values[i, :n, 2::3] = team[:, 0::2] - team[:, 1::2]
+
+    mask = np.arange(n_minutes)[None, :] <= max_minute[:, None]
+
+    return TimelineBatch(
+        match_ids=[c[0] for c in counted],
+        game_duration=game_duration,
+        max_minute=max_minute,
+        values=values,
+        mask=mask,
+        metrics=list(TIMELINE_METRICS),
+        metric_index={name: i for i, name in enumerate(TIMELINE_METRICS)},
+    )
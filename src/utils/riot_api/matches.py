@@ -1,4 +1,6 @@
 from .riot_async import safe_get_json, API_KEY
+from .cache import MATCH_CACHE
+from .decode import decode_match
 
 REGION_ROUTING = "asia"
 
@@ -12,10 +14,25 @@ async def fetch_match_ids(session, puuid, count=20):
         "type": "ranked"
     }
     headers = {"X-Riot-Token": API_KEY}
-    return await safe_get_json(session, url, params=params, headers=headers)
+    return await safe_get_json(
+        session, url, params=params, headers=headers, method="match-v5.getMatchIdsByPUUID"
+    )
 
 
-async def fetch_match_info(session, match_id):
-    url = f"https://{REGION_ROUTING}.api.riotgames.com/lol/match/v5/matches/{match_id}"
-    headers = {"X-Riot-Token": API_KEY}
-    return await safe_get_json(session, url, headers=headers)
+async def fetch_match_info(session, match_id, raw=False):
+    """raw=True → 응답 bytes 그대로 반환 (decode_match로 나중에 디코딩)"""
+
+    # 끝난 경기는 바뀌지 않음 → 디스크 캐시 우선 (원본 bytes 저장)
+    data = await MATCH_CACHE.get_bytes("match", match_id)
+
+    if data is None:
+        url = f"https://{REGION_ROUTING}.api.riotgames.com/lol/match/v5/matches/{match_id}"
+        headers = {"X-Riot-Token": API_KEY}
+        data = await safe_get_json(
+            session, url, headers=headers, method="match-v5.getMatch", raw=True
+        )
+        if data is None:
+            return None
+        await MATCH_CACHE.put_bytes("match", match_id, data)
+
+    return data if raw else decode_match(data)
@@ -1,4 +1,5 @@
 from .riot_async import safe_get_json, API_KEY
+from .cache import LEAGUE_CACHE
 
 REGION_PLATFORM = "kr"
 
@@ -14,8 +15,17 @@ async def fetch_players_by_tier(session, tier, division=None, page=1):
             "GRANDMASTER": "grandmasterleagues",
             "CHALLENGER": "challengerleagues",
         }
+        METHODS = {
+            "MASTER": "league-v4.getMasterLeague",
+            "GRANDMASTER": "league-v4.getGrandmasterLeague",
+            "CHALLENGER": "league-v4.getChallengerLeague",
+        }
         url = f"https://{REGION_PLATFORM}.api.riotgames.com/lol/league/v4/{ENDPOINTS[tier]}/by-queue/RANKED_SOLO_5x5"
-        data = await safe_get_json(session, url, headers=headers)
+        data = await LEAGUE_CACHE.get_json("league", tier)
+        if data is None:
+            data = await safe_get_json(session, url, headers=headers, method=METHODS[tier])
+            if data is not None:
+                await LEAGUE_CACHE.put_json("league", tier, data)
         return data.get("entries", []) if data else []
 
     # IRON~DIAMOND (division 필요)
@@ -24,5 +34,13 @@ async def fetch_players_by_tier(session, tier, division=None, page=1):
 
     url = f"https://{REGION_PLATFORM}.api.riotgames.com/lol/league/v4/entries/RANKED_SOLO_5x5/{tier}/{division}"
     params = {"page": page}
-    data = await safe_get_json(session, url, params=params, headers=headers)
+    # league 페이지는 시간에 따라 바뀜 → 짧은 TTL 캐시
+    cache_key = f"{tier}:{division}:{page}"
+    data = await LEAGUE_CACHE.get_json("entries", cache_key)
+    if data is None:
+        data = await safe_get_json(
+            session, url, params=params, headers=headers, method="league-v4.getLeagueEntries"
+        )
+        if data is not None:
+            await LEAGUE_CACHE.put_json("entries", cache_key, data)
     return data or []
@@ -0,0 +1,215 @@
+"""
+rate_limiter.py
+Riot 응답 헤더 기반 token bucket rate limiter
+
+- X-App-Rate-Limit / X-App-Rate-Limit-Count   → host(라우팅 값) 단위 bucket
+- X-Method-Rate-Limit / X-Method-Rate-Limit-Count → host + method 단위 bucket
+- 제한 window 하나당 bucket 하나 (예: "20:1,100:120" → bucket 2개)
+
+Riot은 window 시작 시점부터 고정 window로 카운트하므로,
+사용한 token은 정확히 window 길이만큼 지난 뒤에 bucket으로 돌아온다.
+→ 어떤 window 구간에서도 limit 이상 요청이 나가지 않음
+
+대기는 (host, method)별 lock 안에서만 → 한 method / 429 대기가 다른 host, method를 막지 않음.
+method limit 헤더를 받기 전에는 DEFAULT_METHOD_LIMITS (초당 1개)로 시작
+→ 첫 응답(probe)의 헤더가 오면 실제 limit으로 교체.
+
+acquire 는 token을 예약만 하고 (scheduler 슬롯 밖에서 대기),
+실제 발송 직전에 restamp 로 사용 시각을 발송 시각으로 옮김
+→ 슬롯 대기가 길어져도 window 계산은 서버 카운트와 같은 기준
+"""
+
+import asyncio
+import time
+from collections import deque
+
+# 헤더를 받기 전 기본값 (development key 기준)
+DEFAULT_APP_LIMITS = "20:1,100:120"
+
+# method limit 헤더를 받기 전 기본값 (첫 응답까지 사실상 probe 1개)
+DEFAULT_METHOD_LIMITS = "1:1"
+
+# 네트워크 지연으로 서버 카운트가 늦게 줄어드는 것 대비 (초)
+WINDOW_MARGIN = 0.05
+
+
+def parse_rate_limits(value):
+    """"20:1,100:120" → [(20, 1.0), (100, 120.0)]"""
+    limits = []
+    if not value:
+        return limits
+
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        count, window = part.split(":")
+        limits.append((int(count), float(window)))
+
+    return limits
+
+
+class TokenBucket:
+    """window 하나에 대한 token bucket (token은 사용 후 window 만큼 지나면 반환)"""
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.spent = deque()        # token 사용 시각
+        self.blocked_until = 0.0    # 429 Retry-After 대응
+
+    def _refill(self, now):
+        horizon = now - self.window - WINDOW_MARGIN
+        while self.spent and self.spent[0] <= horizon:
+            self.spent.popleft()
+
+    def wait_time(self, now):
+        """token 하나를 얻기까지 남은 시간 (0이면 즉시 가능)"""
+        self._refill(now)
+
+        wait = max(0.0, self.blocked_until - now)
+        if len(self.spent) >= self.limit:
+            # 가장 오래된 token이 돌아오는 시점
+            idx = len(self.spent) - self.limit
+            wait = max(wait, self.spent[idx] + self.window + WINDOW_MARGIN - now)
+
+        return wait
+
+    def consume(self, now):
+        self.spent.append(now)
+
+    def restamp(self, stamp, now):
+        """예약 시각(stamp)에 사용한 token → 실제 발송 시각(now)으로 이동"""
+        try:
+            self.spent.remove(stamp)
+        except ValueError:
+            pass    # 이미 window가 지나 반환된 token → 발송 시각으로 다시 사용
+        self.spent.append(now)
+
+    def sync(self, count, now):
+        """서버가 알려준 사용량(-Count 헤더)이 로컬보다 많으면 맞춰줌"""
+        self._refill(now)
+        missing = count - len(self.spent)
+        for _ in range(max(0, missing)):
+            self.spent.append(now)
+
+    def block(self, until):
+        self.blocked_until = max(self.blocked_until, until)
+
+
+class RateLimiter:
+    """App / Method rate limit을 함께 지키는 limiter"""
+
+    def __init__(self, default_app_limits=DEFAULT_APP_LIMITS, default_method_limits=DEFAULT_METHOD_LIMITS):
+        self.default_app_limits = parse_rate_limits(default_app_limits)
+        self.default_method_limits = parse_rate_limits(default_method_limits)
+        self.app_buckets = {}       # host → {(limit, window): TokenBucket}
+        self.method_buckets = {}    # (host, method) → {(limit, window): TokenBucket}
+        self._locks = {}            # (host, method) → asyncio.Lock (같은 method 안에서 FIFO)
+
+    def _buckets_for(self, host, method):
+        if host not in self.app_buckets:
+            self.app_buckets[host] = {
+                (limit, window): TokenBucket(limit, window)
+                for limit, window in self.default_app_limits
+            }
+
+        key = (host, method)
+        if key not in self.method_buckets:
+            self.method_buckets[key] = {
+                (limit, window): TokenBucket(limit, window)
+                for limit, window in self.default_method_limits
+            }
+
+        buckets = list(self.app_buckets[host].values())
+        buckets.extend(self.method_buckets.get(key, {}).values())
+        return buckets
+
+    async def acquire(self, host, method):
+        """
+        모든 관련 bucket에서 token을 얻을 때까지 대기 (같은 host + method 안에서 FIFO)
+        반환: 예약 (buckets, 사용 시각) → 발송 직전에 restamp()
+        """
+        lock = self._locks.get((host, method))
+        if lock is None:
+            lock = self._locks[(host, method)] = asyncio.Lock()
+
+        async with lock:
+            while True:
+                # 확인 → 사용 사이에 await 없음 → 다른 코루틴이 끼어들지 않음
+                now = time.monotonic()
+                buckets = self._buckets_for(host, method)
+                wait = max((b.wait_time(now) for b in buckets), default=0.0)
+
+                if wait <= 0:
+                    for b in buckets:
+                        b.consume(now)
+                    return buckets, now
+
+                # 잠자는 동안 다른 host / method는 계속 진행, 깨어나면 다시 확인
+                await asyncio.sleep(wait)
+
+    @staticmethod
+    def restamp(reservation):
+        """acquire() 예약 token의 사용 시각을 지금(실제 발송 시각)으로"""
+        buckets, stamp = reservation
+        now = time.monotonic()
+        for b in buckets:
+            b.restamp(stamp, now)
+
+    @staticmethod
+    def _update_group(group, limits_header, counts_header, now):
+        limits = parse_rate_limits(limits_header)
+        if not limits:
+            return group
+
+        counts = {window: count for count, window in parse_rate_limits(counts_header)}
+
+        new_group = {}
+        for limit, window in limits:
+            bucket = group.get((limit, window)) or TokenBucket(limit, window)
+            if window in counts:
+                bucket.sync(counts[window], now)
+            new_group[(limit, window)] = bucket
+
+        return new_group
+
+    def update(self, host, method, headers):
+        """응답 헤더로 bucket 구성 / 사용량 갱신"""
+        now = time.monotonic()
+
+        self._buckets_for(host, method)
+        self.app_buckets[host] = self._update_group(
+            self.app_buckets[host],
+            headers.get("X-App-Rate-Limit"),
+            headers.get("X-App-Rate-Limit-Count"),
+            now,
+        )
+
+        key = (host, method)
+        self.method_buckets[key] = self._update_group(
+            self.method_buckets.get(key, {}),
+            headers.get("X-Method-Rate-Limit"),
+            headers.get("X-Method-Rate-Limit-Count"),
+            now,
+        )
+
+    def penalize(self, host, method, retry_after, limit_type=None):
+        """429 수신 → 해당 범위 bucket을 Retry-After 동안 막음"""
+        until = time.monotonic() + retry_after
+
+        if limit_type == "method":
+            groups = [self.method_buckets.get((host, method), {})]
+        elif limit_type == "application":
+            groups = [self.app_buckets.get(host, {})]
+        else:
+            # service 429 등 → 전체 대기
+            groups = [self.app_buckets.get(host, {}), self.method_buckets.get((host, method), {})]
+
+        # method limit을 아직 모르는 경우 → app bucket으로 대신 막음
+        if not any(groups):
+            groups = [self.app_buckets.get(host, {})]
+
+        for group in groups:
+            for bucket in group.values():
+                bucket.block(until)
@@ -0,0 +1,95 @@
+"""
+retry.py
+재시도 정책 (지수 backoff + jitter) / host별 circuit breaker
+
+- 5xx(500/502/503/504), 네트워크 오류, timeout → 최대 max_attempts 회까지 재시도
+- 같은 host에서 연속 실패가 쌓이면 circuit open → cooldown 동안 요청 발송 중단
+- cooldown 이후 요청 1개만 시험 발송 (half-open) → 성공 시 close
+"""
+
+import asyncio
+import random
+import time
+
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts=5,
+        base_delay=0.5,
+        max_delay=30.0,
+        retry_statuses=RETRY_STATUSES,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = set(retry_statuses)
+
+    def should_retry(self, status):
+        return status in self.retry_statuses
+
+    def delay(self, attempt):
+        """attempt(1부터) 번째 실패 후 대기 시간 (full jitter)"""
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, cap)
+
+
+class CircuitBreaker:
+    """host 하나에 대한 circuit breaker"""
+
+    def __init__(self, failure_threshold=5, cooldown=30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    async def wait(self):
+        """circuit이 열려 있으면 cooldown이 끝날 때까지 대기 (half-open 시험은 1개만)"""
+        while self.opened_at is not None:
+            now = time.monotonic()
+            remaining = self.opened_at + self.cooldown - now
+
+            # 시험 요청이 결과 없이 사라진 경우(취소 등) 대비 → cooldown 후 다시 시험
+            probing = self._probe_started is not None and now - self._probe_started < self.cooldown
+
+            if remaining <= 0 and not probing:
+                self._probe_started = now
+                return
+
+            await asyncio.sleep(max(remaining, 0.5))
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._probe_started = None
+
+    def record_failure(self):
+        self.failures += 1
+
+        if self._probe_started is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                print(f"[circuit] 연속 실패 {self.failures}회 → {self.cooldown}s 동안 요청 중단")
+            self.opened_at = time.monotonic()
+            self._probe_started = None
+
+
+class CircuitBreakers:
+    """host → CircuitBreaker"""
+
+    def __init__(self, failure_threshold=5, cooldown=30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.breakers = {}
+
+    def get(self, host):
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(self.failure_threshold, self.cooldown)
+        return self.breakers[host]
@@ -1,38 +1,112 @@
 import os
+import time
 import asyncio
 import aiohttp
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
+from .rate_limiter import RateLimiter
+from .scheduler import RequestScheduler
+from .retry import RetryPolicy, CircuitBreakers
+from .singleflight import SingleFlight, request_key
+
 load_dotenv()
 API_KEY = os.getenv("RIOT_API_KEY")
 
-# 전체 요청에 대한 동시 처리 제한 (10~20 추천)
-# 너무 높으면 Riot 429 발생 → 10이 안전함
-API_SEMAPHORE = asyncio.Semaphore(10)
+# 전체 요청 동시 처리 scheduler (API_SEMAPHORE 대체)
+# endpoint class별 대기열 + 429 / 지연 기반 동시성 자동 조절
+SCHEDULER = RequestScheduler()
+
+# X-App-Rate-Limit / X-Method-Rate-Limit 헤더 기반 token bucket
+RATE_LIMITER = RateLimiter()
+
+# 5xx / 네트워크 오류 재시도 정책 + host별 circuit breaker
+RETRY_POLICY = RetryPolicy()
+CIRCUIT_BREAKERS = CircuitBreakers()
+
+# 동일 url + params 동시 요청 → API 호출 1회로 합침
+SINGLE_FLIGHT = SingleFlight()
+
+# 요청 1회 최대 시간 → 응답 없는 연결이 슬롯을 계속 잡고 있지 않도록
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+async def safe_get_json(session, url, params=None, headers=None, method=None, raw=False):
+    """Riot API용 안전 JSON fetch (동일 요청 합치기 → _fetch_json)
+
+    raw=True → 디코딩하지 않은 응답 bytes 반환 (캐시 저장 / 스키마 디코딩용)
+    """
+    return await SINGLE_FLIGHT.do(
+        (*request_key(url, params), raw), _fetch_json, session, url, params, headers, method, raw
+    )
+
 
+async def _fetch_json(session, url, params=None, headers=None, method=None, raw=False):
+    """scheduler 슬롯 + rate limit 대기 + 429/5xx 재시도"""
 
-async def safe_get_json(session, url, params=None, headers=None):
-    """Riot API용 안전 JSON fetch (429 자동 재시도 + 세마포어 보호)"""
+    host = urlsplit(url).netloc
+    method = method or urlsplit(url).path
+    breaker = CIRCUIT_BREAKERS.get(host)
+
+    attempt = 0
+    while True:
+        retry_after = None
+
+        # circuit open → 장애 동안 발송 중단
+        await breaker.wait()
+
+        # rate limit 대기는 슬롯 밖에서 (token 예약)
+        # → 429 / limit에 걸린 class가 슬롯을 잡고 자면서 다른 class를 막지 않음
+        reservation = await RATE_LIMITER.acquire(host, method)
+
+        # 슬롯은 HTTP 요청 1회 동안만 점유 → AIMD 지연도 요청 구간만 측정
+        async with SCHEDULER.slot(method):
+            RATE_LIMITER.restamp(reservation)
+            started = time.monotonic()
 
-    async with API_SEMAPHORE:
-        while True:
             try:
-                async with session.get(url, params=params, headers=headers) as res:
-                    # 429 요청 초과 → Retry-After 적용
+                async with session.get(
+                    url, params=params, headers=headers, timeout=REQUEST_TIMEOUT
+                ) as res:
+                    RATE_LIMITER.update(host, method, res.headers)
+                    SCHEDULER.record(res.status, time.monotonic() - started)
+
+                    # 429 요청 초과 → Retry-After 적용 (시도 횟수에 포함하지 않음)
                     if res.status == 429:
+                        breaker.record_success()
                         retry_after = float(res.headers.get("Retry-After", 1))
-                        print(f"[429] Too Many Requests → {retry_after}s 대기")
-                        await asyncio.sleep(retry_after)
-                        continue
+                        limit_type = res.headers.get("X-Rate-Limit-Type")
+                        print(f"[429] Too Many Requests ({limit_type}) → {retry_after}s 대기")
+                        RATE_LIMITER.penalize(host, method, retry_after, limit_type)
+
+                    # 일시적 서버 오류 → backoff 후 재시도
+                    elif RETRY_POLICY.should_retry(res.status):
+                        breaker.record_failure()
+                        attempt += 1
+                        print(f"[{res.status}] 서버 오류 ({attempt}/{RETRY_POLICY.max_attempts})")
 
-                    if res.status == 200:
+                    elif res.status == 200:
+                        breaker.record_success()
+                        if raw:
+                            return await res.read()
                         return await res.json()
 
-                    # 기타 오류
-                    text = await res.text()
-                    print(f"[오류] {res.status} : {text}")
-                    return None
+                    else:
+                        # 기타 오류 (404 등) → 재시도 의미 없음
+                        breaker.record_success()
+                        text = await res.text()
+                        print(f"[오류] {res.status} : {text}")
+                        return None
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                breaker.record_failure()
+                attempt += 1
+                print(f"[요청 오류] {e!r} ({attempt}/{RETRY_POLICY.max_attempts})")
+
+        if retry_after is None:
+            if attempt >= RETRY_POLICY.max_attempts:
+                print(f"[포기] 재시도 {attempt}회 실패 → {url}")
+                return None
+            retry_after = RETRY_POLICY.delay(attempt)
 
-            except Exception as e:
-                print(f"[요청 오류] {e}")
-                await asyncio.sleep(1)
+        await asyncio.sleep(retry_after)
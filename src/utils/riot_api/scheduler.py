@@ -0,0 +1,155 @@
+"""
+scheduler.py
+endpoint class별 우선순위 큐 + AIMD 동시성 조절 scheduler
+
+- endpoint class: league / matchlist / match / timeline
+- class마다 대기열을 따로 두고, weight 비율대로 슬롯을 배분 (weighted fair queue)
+  → 예: timeline weight를 높게 주면 이미 아는 matchId 처리를 새 PUUID 탐색보다 먼저 소화
+- 동시성 한도는 429 비율 / 응답 지연을 보고 스스로 조절
+  · 정상 응답: 한도 += 1 / 한도  (대략 한 바퀴에 +1, additive increase)
+  · 429 또는 지연 초과: 한도 *= 0.5 (multiplicative decrease)
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+# Riot method → endpoint class
+METHOD_CLASSES = {
+    "league-v4.getLeagueEntries": "league",
+    "league-v4.getMasterLeague": "league",
+    "league-v4.getGrandmasterLeague": "league",
+    "league-v4.getChallengerLeague": "league",
+    "match-v5.getMatchIdsByPUUID": "matchlist",
+    "match-v5.getMatch": "match",
+    "match-v5.getTimeline": "timeline",
+}
+
+# 높을수록 슬롯을 더 많이 받음 (뒤 단계일수록 우선)
+DEFAULT_WEIGHTS = {
+    "league": 1,
+    "matchlist": 2,
+    "match": 4,
+    "timeline": 4,
+}
+
+
+def endpoint_class(method):
+    return METHOD_CLASSES.get(method, "other")
+
+
+class RequestScheduler:
+    """API_SEMAPHORE 대체: class별 대기열 + 자동 동시성 조절"""
+
+    def __init__(
+        self,
+        weights=None,
+        initial_limit=10,
+        min_limit=1,
+        max_limit=40,
+        target_latency=2.0,
+        decrease_factor=0.5,
+        decrease_cooldown=1.0,
+    ):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        if weights:
+            self.weights.update(weights)
+
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self._last_decrease = 0.0
+
+        self.in_flight = 0
+        self.queues = {}        # class → deque[Future]
+        self.vtime = {}         # class → 가상 시간 (weight가 클수록 천천히 증가)
+        self.global_vtime = 0.0
+
+        # 모니터링용
+        self.stats = {"ok": 0, "throttled": 0, "slow": 0}
+
+    # ---------------------------------------------------
+    # 슬롯 배분
+    # ---------------------------------------------------
+    def _has_waiters(self):
+        return any(self.queues.values())
+
+    def _pick_class(self):
+        candidates = [cls for cls, q in self.queues.items() if q]
+        return min(candidates, key=lambda cls: self.vtime.get(cls, 0.0))
+
+    def _dispatch(self):
+        while self.in_flight < int(self.limit) and self._has_waiters():
+            cls = self._pick_class()
+            fut = self.queues[cls].popleft()
+            if fut.done():
+                continue
+
+            self.global_vtime = self.vtime.get(cls, 0.0)
+            self.vtime[cls] = self.global_vtime + 1.0 / self.weights.get(cls, 1)
+
+            self.in_flight += 1
+            fut.set_result(None)
+
+    async def acquire(self, cls):
+        if self.in_flight < int(self.limit) and not self._has_waiters():
+            self.in_flight += 1
+            return
+
+        # 쉬고 있던 class가 밀린 가상 시간으로 독점하지 않도록 현재 시점에 맞춤
+        if not self.queues.get(cls):
+            self.vtime[cls] = max(self.vtime.get(cls, 0.0), self.global_vtime)
+
+        fut = asyncio.get_running_loop().create_future()
+        self.queues.setdefault(cls, deque()).append(fut)
+
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소된 경우 → 반납
+            if fut.done() and not fut.cancelled():
+                self.in_flight -= 1
+                self._dispatch()
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._dispatch()
+
+    # ---------------------------------------------------
+    # AIMD 동시성 조절
+    # ---------------------------------------------------
+    def _decrease(self):
+        # 동시에 들어온 429 여러 개로 한도가 연속 반감되지 않도록 cooldown
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+
+    def record(self, status, latency):
+        """응답 하나의 결과 보고 (status, 초 단위 지연)"""
+        if status == 429:
+            self.stats["throttled"] += 1
+            self._decrease()
+        elif latency > self.target_latency:
+            self.stats["slow"] += 1
+            self._decrease()
+        else:
+            self.stats["ok"] += 1
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, method):
+        """async with SCHEDULER.slot(method): ... (method → endpoint class 대기열)"""
+        await self.acquire(endpoint_class(method))
+        try:
+            yield
+        finally:
+            self.release()
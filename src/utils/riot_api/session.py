@@ -0,0 +1,47 @@
+"""
+session.py
+전체 수집 동안 재사용하는 aiohttp ClientSession 생성
+
+- TCPConnector: host별 연결 수 제한 + keep-alive + DNS 캐시
+- Accept-Encoding: gzip / deflate (+ brotli 패키지가 있으면 br)
+  → timeline JSON은 압축률이 높아 전송량이 크게 줄어듦
+"""
+
+import aiohttp
+
+try:
+    import brotli  # noqa: F401  (aiohttp가 br 응답 해제에 사용)
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+# 연결 풀 설정
+CONNECTION_LIMIT = 100          # 전체 동시 연결
+CONNECTION_LIMIT_PER_HOST = 30  # host(asia / kr)별 동시 연결
+KEEPALIVE_TIMEOUT = 75          # 유휴 연결 유지 시간 (초)
+DNS_CACHE_TTL = 600             # DNS 캐시 (초)
+
+
+def accept_encoding():
+    return "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+
+
+def create_session():
+    """모든 티어 수집에서 공유할 ClientSession (async with create_session() as session)"""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        use_dns_cache=True,
+    )
+
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"Accept-Encoding": accept_encoding()},
+        auto_decompress=True,
+    )
@@ -0,0 +1,35 @@
+"""
+singleflight.py
+동일 요청 합치기 (in-flight coalescing)
+
+같은 url + params 요청이 이미 진행 중이면 새로 보내지 않고
+진행 중인 요청의 결과(future)를 같이 기다린다.
+→ 여러 PUUID가 같은 경기를 공유할 때 중복 match / timeline 호출 제거
+"""
+
+import asyncio
+
+
+def request_key(url, params=None):
+    if not params:
+        return (url, ())
+    return (url, tuple(sorted((str(k), str(v)) for k, v in params.items())))
+
+
+class SingleFlight:
+    def __init__(self):
+        self.in_flight = {}     # key → asyncio.Task
+        self.shared = 0         # 합쳐진 요청 수 (모니터링용)
+
+    async def do(self, key, func, *args, **kwargs):
+        task = self.in_flight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self.in_flight[key] = task
+            task.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        else:
+            self.shared += 1
+
+        # 기다리던 호출 하나가 취소돼도 공유 중인 요청은 계속 진행
+        return await asyncio.shield(task)
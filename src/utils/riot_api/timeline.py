@@ -1,9 +1,24 @@
 from .riot_async import safe_get_json, API_KEY
+from .cache import MATCH_CACHE
+from .decode import decode_timeline
 
 REGION_ROUTING = "asia"
 
 
-async def fetch_match_timeline(session, match_id):
-    url = f"https://{REGION_ROUTING}.api.riotgames.com/lol/match/v5/matches/{match_id}/timeline"
-    headers = {"X-Riot-Token": API_KEY}
-    return await safe_get_json(session, url, headers=headers)
+async def fetch_match_timeline(session, match_id, raw=False):
+    """raw=True → 응답 bytes 그대로 반환 (decode_timeline으로 나중에 디코딩)"""
+
+    # 끝난 경기는 바뀌지 않음 → 디스크 캐시 우선 (원본 bytes 저장)
+    data = await MATCH_CACHE.get_bytes("timeline", match_id)
+
+    if data is None:
+        url = f"https://{REGION_ROUTING}.api.riotgames.com/lol/match/v5/matches/{match_id}/timeline"
+        headers = {"X-Riot-Token": API_KEY}
+        data = await safe_get_json(
+            session, url, headers=headers, method="match-v5.getTimeline", raw=True
+        )
+        if data is None:
+            return None
+        await MATCH_CACHE.put_bytes("timeline", match_id, data)
+
+    return data if raw else decode_timeline(data)
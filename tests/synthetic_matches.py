@@ -0,0 +1,82 @@
+"""
+테스트용 가짜 match / timeline JSON (Riot match-v5 구조 중 추출기가 읽는 필드만)
+
+이벤트 종류 / 팀 값 / 필드 조합을 무작위로 섞어서 경계 경우를 포함:
+- killerTeamId 300 (중립), killerId 0, timestamp 없는 이벤트, 경기 종료 이후 이벤트
+- 레거시 grub (killType / predefinedTargetId, killerTeamId / teamId)
+- 알 수 없는 towerType / 무관한 이벤트
+"""
+
+import random
+
+MONSTERS = [
+    ("DRAGON", "FIRE_DRAGON"), ("DRAGON", "ELDER_DRAGON"), ("DRAGON", "AIR_DRAGON"),
+    ("RIFTHERALD", None), ("BARON_NASHOR", None), ("ATAKHAN", None), ("HORDE", None),
+]
+TOWERS = ["OUTER_TURRET", "INNER_TURRET", "BASE_TURRET", "NEXUS_TURRET", "UNKNOWN"]
+
+
+def random_event(rng, ts):
+    r = rng.random()
+
+    if r < 0.35:
+        return {"type": "CHAMPION_KILL", "timestamp": ts, "killerId": rng.randint(0, 10), "victimId": 3}
+
+    if r < 0.55:
+        monster_type, sub_type = rng.choice(MONSTERS)
+        ev = {"type": "ELITE_MONSTER_KILL", "timestamp": ts,
+              "killerTeamId": rng.choice([100, 200, 300]), "monsterType": monster_type}
+        if sub_type:
+            ev["monsterSubType"] = sub_type
+        return ev
+
+    if r < 0.65:
+        ev = {"type": "KILL_PREDEFINED_TARGET", "timestamp": ts}
+        if rng.random() < 0.5:
+            ev["killType"] = rng.choice(["VOID_GRUB", "VOID_LARVA", "OTHER"])
+        else:
+            ev["predefinedTargetId"] = rng.choice(["VOID_GRUB", "X"])
+        ev["killerTeamId" if rng.random() < 0.5 else "teamId"] = rng.choice([100, 200])
+        return ev
+
+    if r < 0.85:
+        ev = {"type": "BUILDING_KILL", "timestamp": ts, "teamId": rng.choice([100, 200])}
+        if rng.random() < 0.8:
+            ev.update(buildingType="TOWER_BUILDING", towerType=rng.choice(TOWERS))
+        else:
+            ev["buildingType"] = "INHIBITOR_BUILDING"
+        return ev
+
+    return {"type": "ITEM_PURCHASED", "timestamp": ts, "itemId": 1001}
+
+
+def make_match(i, minutes=None, interval=60000):
+    """경기 i → (match_json, timeline_json), 같은 i는 항상 같은 경기"""
+    rng = random.Random(i)
+    minutes = minutes if minutes is not None else rng.randint(15, 40)
+    duration = minutes * 60 + rng.randint(0, 59)
+    match_id = f"KR_{1000 + i}"
+
+    participants = [
+        {"participantId": pid, "teamId": 100 if pid <= 5 else 200, "puuid": f"p{i}_{pid}",
+         "win": (pid <= 5) == (i % 2 == 0), "championName": f"Champ{pid}"}
+        for pid in range(1, 11)
+    ]
+    match = {"metadata": {"matchId": match_id}, "info": {"gameDuration": duration, "participants": participants}}
+
+    frames = []
+    for f in range(duration * 1000 // interval + 2):
+        participant_frames = {
+            str(pid): {"totalGold": 500 + f * rng.randint(200, 500), "xp": f * 300, "level": min(18, 1 + f // 2)}
+            for pid in range(1, 11)
+        }
+        events = [
+            random_event(rng, max(0, f * interval - rng.randint(0, interval)) if f else 0)
+            for _ in range(rng.randint(0, 8))
+        ]
+        if rng.random() < 0.05:
+            events.append({"type": "ELITE_MONSTER_KILL", "killerTeamId": 100, "monsterType": "BARON_NASHOR"})
+        frames.append({"timestamp": f * interval, "participantFrames": participant_frames, "events": events})
+
+    timeline = {"metadata": {"matchId": match_id}, "info": {"frameInterval": interval, "frames": frames}}
+    return match, timeline
@@ -0,0 +1,50 @@
+import asyncio
+import contextlib
+
+import src.fetch.all_collector as all_collector
+
+
+def test_collect_all_tiers_passes_long_format(monkeypatch):
+    calls = []
+
+    async def fake_pipeline(session, tier, division, player_count, match_per_player, **kwargs):
+        calls.append((tier, division, kwargs))
+        return f"{tier}_matches.csv", f"{tier}_timeline.csv"
+
+    @contextlib.asynccontextmanager
+    async def fake_session():
+        yield object()
+
+    monkeypatch.setattr(all_collector, "collect_tier_pipeline", fake_pipeline)
+    monkeypatch.setattr(all_collector, "create_session", fake_session)
+
+    asyncio.run(all_collector.collect_all_tiers(
+        player_count=4, match_per_player=1, delay=0, long_format=True,
+    ))
+
+    # IRON~DIAMOND × I~IV + MASTER / GRANDMASTER / CHALLENGER = 31
+    assert len(calls) == 31
+    assert all(kwargs["long_format"] is True for _, _, kwargs in calls)
+    assert calls[-1][:2] == ("CHALLENGER", None)
+
+
+def test_collect_tier_all_creates_session(monkeypatch):
+    calls = []
+
+    async def fake_pipeline(session, tier, division, player_count, match_per_player, **kwargs):
+        calls.append((session, kwargs["long_format"]))
+        return None, None
+
+    sessions = []
+
+    @contextlib.asynccontextmanager
+    async def fake_session():
+        sessions.append(object())
+        yield sessions[-1]
+
+    monkeypatch.setattr(all_collector, "collect_tier_pipeline", fake_pipeline)
+    monkeypatch.setattr(all_collector, "create_session", fake_session)
+
+    asyncio.run(all_collector.collect_tier_all("gold", "i", long_format=True))
+
+    assert calls == [(sessions[0], True)]
@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from src.utils.riot_api.cache import BlobCache
+
+
+@pytest.mark.parametrize("blob", [
+    b"not gzip at all",                                     # 헤더 오류
+    b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\x03garbage!!",   # deflate 데이터 오류
+    b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\x03",            # 중간에 잘림
+])
+def test_corrupt_entry_is_removed_and_missed(tmp_path, blob):
+    cache = BlobCache(str(tmp_path), max_bytes=1024 ** 2)
+    cache.put("match", "KR_1", b'{"ok": true}')
+
+    path = cache._path("match", "KR_1")
+    with open(path, "wb") as f:
+        f.write(blob)
+
+    assert cache.get("match", "KR_1") is None
+    assert not os.path.exists(path)
+
+    cache.put("match", "KR_1", b'{"ok": true}')
+    assert cache.get("match", "KR_1") == b'{"ok": true}'
+
+
+def test_missing_entry_is_miss(tmp_path):
+    assert BlobCache(str(tmp_path)).get("match", "KR_2") is None
+
+
+def test_overwrite_does_not_inflate_tracked_size(tmp_path):
+    cache = BlobCache(str(tmp_path), max_bytes=1024 ** 2)
+    cache.put("league", "page1", b"a" * 100)
+
+    for i in range(5):
+        cache.put("league", "page1", bytes(range(256)) * (i + 1))
+        assert cache._total_bytes == cache._scan_size()
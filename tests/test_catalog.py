@@ -0,0 +1,22 @@
+from src.utils.catalog import CollectionCatalog
+
+
+def test_extracted_record_is_reused_by_other_tiers(tmp_path):
+    catalog = CollectionCatalog(str(tmp_path / "catalog.sqlite"))
+    record = {"finish": [{"matchId": "KR_1", "win": True}], "timeline": {"maxMinute": 30}}
+
+    catalog.add_match_ids("GOLD_I", "pu1", ["KR_1", "KR_2"])
+    catalog.mark_extracted("GOLD_I", ["KR_1"], [("KR_1", record)])
+
+    assert catalog.extracted_elsewhere("GOLD_II", ["KR_1", "KR_2"]) == {"KR_1"}
+    assert catalog.extracted_elsewhere("GOLD_I", ["KR_1"]) == set()
+
+    assert catalog.load_record("KR_1") == record
+    assert catalog.load_record("KR_2") is None
+
+    # 다른 티어에서 다시 기록해도 owner / record는 처음 것 유지
+    catalog.mark_extracted("GOLD_II", ["KR_1"], [("KR_1", {"finish": [], "timeline": {}})])
+    assert catalog.load_record("KR_1") == record
+    assert catalog.extracted_elsewhere("GOLD_II", ["KR_1"]) == {"KR_1"}
+
+    catalog.close()
@@ -0,0 +1,61 @@
+import numpy as np
+
+from src.utils.event_table import EventTable
+
+
+def events(timestamps, codes, teams, frames):
+    return {
+        "timestamp": timestamps,
+        "code": codes,
+        "team": teams,
+        "subtype": [None] * len(timestamps),
+        "frames": {
+            "timestamp": [t for t, _, _ in frames],
+            "gold100": [g for _, g, _ in frames],
+            "gold200": [g for _, _, g in frames],
+        },
+    }
+
+
+def make_table():
+    # KILL = code 0
+    return EventTable.build([
+        ("KR_1", events([60000, 120000], [0, 0], [100, 200], [(0, 500, 500), (60000, 1500, 1200)])),
+        ("KR_2", events([-5, 90000], [0, 0], [200, 100], [])),    # 음수 timestamp, 프레임 없음
+        ("KR_3", events([30000], [0, 0], [100], [(0, 500, 500), (60000, 1800, 1600)])),
+    ])
+
+
+def test_negative_timestamp_stays_in_its_own_match():
+    table = make_table()
+
+    k100, k200 = table.counts_at("kill", 10 ** 7)
+    np.testing.assert_array_equal(k100, [1, 1, 1])
+    np.testing.assert_array_equal(k200, [1, 1, 0])
+
+    k100, k200 = table.counts_at("kill", 0, ["KR_2"])
+    assert (k100[0], k200[0]) == (0, 1)
+
+    np.testing.assert_array_equal(table.first_time("kill"), [60000, -5, 30000])
+    np.testing.assert_array_equal(table.first_time("kill", team=100), [60000, 90000, 30000])
+    np.testing.assert_array_equal(table.first_time("kill", team=200), [120000, -5, -1])
+
+
+def test_gold_at_matches_without_frames():
+    table = make_table()
+
+    g100, g200 = table.gold_at([70000, 70000, 70000])
+    np.testing.assert_array_equal(g100, [1500, 0, 1800])
+    np.testing.assert_array_equal(g200, [1200, 0, 1600])
+
+    np.testing.assert_array_equal(table.diff_at("gold", 10, ["KR_3", "KR_1"]), [0, 0])
+
+
+def test_save_load_roundtrip(tmp_path):
+    table = make_table()
+    path = tmp_path / "events.npz"
+    table.save(path)
+
+    loaded = EventTable.load(path)
+    np.testing.assert_array_equal(loaded.first_time("kill"), table.first_time("kill"))
+    np.testing.assert_array_equal(loaded.diff_at("kill", 100000), table.diff_at("kill", 100000))
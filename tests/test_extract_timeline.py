@@ -0,0 +1,61 @@
+import copy
+
+import numpy as np
+import pytest
+
+import baseline_reference
+from synthetic_matches import make_match
+from src.utils.riot_api.extract_timeline import (
+    TIMELINE_METRICS, extract_timeline_batch, extract_timeline_features,
+)
+
+CASES = [(i, None, 60000) for i in range(40)] + [(100, 20, 30000), (101, 0, 60000), (102, 1, 90000)]
+
+
+@pytest.mark.parametrize("i, minutes, interval", CASES)
+def test_features_match_baseline(i, minutes, interval):
+    match, timeline = make_match(i, minutes, interval)
+
+    assert extract_timeline_features(match, timeline) == baseline_reference.extract_timeline_features(match, timeline)
+
+
+def test_broken_frame_interval_is_skipped():
+    match, timeline = make_match(7)
+    timeline = copy.deepcopy(timeline)
+    timeline["info"]["frameInterval"] = 0
+
+    assert extract_timeline_features(match, timeline) is None
+    assert baseline_reference.extract_timeline_features(match, timeline) is None
+
+
+def test_batch_matches_features():
+    pairs = [make_match(i) for i in range(12)]
+    broken = copy.deepcopy(pairs[3])
+    broken[1]["info"]["frameInterval"] = 0
+    pairs.append(broken)
+
+    batch = extract_timeline_batch(pairs)
+    expected = [extract_timeline_features(m, t) for m, t in pairs[:12]]
+
+    assert batch.match_ids == [row["matchId"] for row in expected]
+    assert batch.values.dtype == np.int32
+    assert batch.values.shape == (12, max(row["maxMinute"] for row in expected) + 1, len(TIMELINE_METRICS))
+
+    for i, row in enumerate(expected):
+        assert batch.game_duration[i] == row["gameDuration"]
+        assert batch.max_minute[i] == row["maxMinute"]
+
+        for minute in range(batch.values.shape[1]):
+            assert batch.mask[i, minute] == (minute <= row["maxMinute"])
+            for metric, k in batch.metric_index.items():
+                assert batch.values[i, minute, k] == row.get(f"{metric}_{minute}", 0)
+
+
+def test_batch_fixed_minute_axis():
+    pairs = [make_match(i, minutes=m) for i, m in enumerate([10, 30])]
+    batch = extract_timeline_batch(pairs, n_minutes=20)
+
+    full = extract_timeline_batch(pairs)
+    assert batch.values.shape[1] == 20
+    np.testing.assert_array_equal(batch.values, full.values[:, :20])
+    assert batch.mask[0].sum() == 11 and batch.mask[1].all()
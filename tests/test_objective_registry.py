@@ -0,0 +1,60 @@
+import pytest
+
+from src.utils.riot_api.extract_timeline import (
+    OBJECTIVE_DISPATCH, OBJECTIVES, TIMELINE_METRICS, ObjectiveCounter, _classify_objective, _compile_counters,
+)
+
+
+def slot(name, team):
+    return OBJECTIVES.index(name) * 2, team
+
+
+def test_objective_order_matches_csv_columns():
+    assert OBJECTIVES == [
+        "dragon", "elder", "herald", "baron", "atakhan", "grub",
+        "outerTower", "innerTower", "baseTower", "nexusTower", "inhibitor",
+    ]
+
+
+@pytest.mark.parametrize("event, expected", [
+    ({"type": "ELITE_MONSTER_KILL", "monsterType": "DRAGON", "monsterSubType": "FIRE_DRAGON", "killerTeamId": 100},
+     slot("dragon", 100)),
+    # elder는 monsterType=DRAGON이어도 elder로만 집계 (priority)
+    ({"type": "ELITE_MONSTER_KILL", "monsterType": "DRAGON", "monsterSubType": "ELDER_DRAGON", "killerTeamId": 200},
+     slot("elder", 200)),
+    ({"type": "ELITE_MONSTER_KILL", "monsterType": "HORDE", "killerTeamId": 300}, slot("grub", 300)),
+    ({"type": "KILL_PREDEFINED_TARGET", "predefinedTargetId": "VOID_LARVA", "teamId": 100}, slot("grub", 100)),
+    ({"type": "KILL_PREDEFINED_TARGET", "killType": "VOID_GRUB", "killerTeamId": 200, "teamId": 100},
+     slot("grub", 200)),
+    ({"type": "BUILDING_KILL", "buildingType": "TOWER_BUILDING", "towerType": "BASE_TURRET", "teamId": 200},
+     slot("baseTower", 200)),
+    ({"type": "BUILDING_KILL", "buildingType": "INHIBITOR_BUILDING", "teamId": 100}, slot("inhibitor", 100)),
+    ({"type": "BUILDING_KILL", "buildingType": "TOWER_BUILDING", "towerType": "UNKNOWN", "teamId": 100}, (None, None)),
+    ({"type": "KILL_PREDEFINED_TARGET", "killType": "OTHER", "teamId": 100}, (None, None)),
+    ({"type": "CHAMPION_KILL", "killerId": 3}, (None, None)),
+    ({"type": "ITEM_PURCHASED"}, (None, None)),
+])
+def test_classify_objective(event, expected):
+    assert _classify_objective(event) == expected
+
+
+def test_dispatch_checks_higher_priority_first():
+    probes = OBJECTIVE_DISPATCH["ELITE_MONSTER_KILL"]
+    assert probes[0][0] == ("monsterSubType",)
+
+
+def test_compile_custom_counters():
+    dispatch = _compile_counters([
+        ObjectiveCounter("ward", "WARD_KILL", {"wardType": ("CONTROL_WARD", "YELLOW_TRINKET")}, team=("killerId",)),
+        ObjectiveCounter("plate", "TURRET_PLATE_DESTROYED", {"laneType": "MID_LANE"}, team=("teamId",)),
+    ])
+
+    fields, table = dispatch["WARD_KILL"][0]
+    assert fields == ("wardType",)
+    assert table == {("CONTROL_WARD",): (0, ("killerId",)), ("YELLOW_TRINKET",): (0, ("killerId",))}
+    assert dispatch["TURRET_PLATE_DESTROYED"][0][1] == {("MID_LANE",): (2, ("teamId",))}
+
+
+def test_timeline_metric_layout():
+    assert TIMELINE_METRICS[:6] == ["gold100", "gold200", "goldDiff", "kill100", "kill200", "killDiff"]
+    assert TIMELINE_METRICS[6:] == [f"{name}{side}" for name in OBJECTIVES for side in ("100", "200", "Diff")]
@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.objective_score import ObjectiveScorer
+
+ARTIFACT = {
+    "features": ["goldDiff", "dragonDiff"],
+    "mean": [100.0, 0.5],
+    "scale": [2000.0, 1.5],
+    "coef": [1.2, 0.4],
+    "intercept": -0.1,
+    "flip": [],
+}
+
+
+def test_batch_and_single_row_agree_with_nan_as_zero():
+    scorer = ObjectiveScorer(ARTIFACT)
+    X = np.array([[1500.0, np.nan], [np.nan, 2.0], [-300.0, 1.0]])
+    zeroed = np.nan_to_num(X)
+
+    expected = zeroed @ scorer.weights + scorer.bias
+    df = pd.DataFrame(X, columns=ARTIFACT["features"])
+
+    np.testing.assert_allclose(scorer.score(X), expected)
+    np.testing.assert_allclose(scorer.score(df), expected)
+    assert np.isnan(X).sum() == 2       # 입력은 그대로
+
+    for row, score in zip(X, expected):
+        as_dict = dict(zip(ARTIFACT["features"], row))
+        assert math.isclose(scorer.score_one(as_dict), score)
+        assert math.isclose(scorer.score_one(list(row)), score)
+
+
+def test_winrate_matches_sigmoid():
+    scorer = ObjectiveScorer(ARTIFACT)
+    X = np.array([[50000.0, 5.0], [-50000.0, -5.0], [0.0, 0.0]])
+
+    s = scorer.score(X)
+    np.testing.assert_allclose(scorer.winrate(X), 1 / (1 + np.exp(-s)))
+    for row, p in zip(X, scorer.winrate(X)):
+        assert math.isclose(scorer.winrate_one(list(row)), p)
@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+import pytest
+
+import src.utils.riot_api.rate_limiter as rate_limiter
+from src.utils.riot_api.rate_limiter import (
+    WINDOW_MARGIN, RateLimiter, TokenBucket, parse_rate_limits,
+)
+
+HOST = "kr.api.riotgames.com"
+LEAGUE = "league-v4.getLeagueEntries"
+MATCHLIST = "match-v5.getMatchIdsByPUUID"
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+def wait_for(limiter, host, method, now):
+    return max(b.wait_time(now) for b in limiter._buckets_for(host, method))
+
+
+def test_parse_rate_limits():
+    assert parse_rate_limits("20:1,100:120") == [(20, 1.0), (100, 120.0)]
+    assert parse_rate_limits(" 500:10 , ") == [(500, 10.0)]
+    assert parse_rate_limits(None) == []
+
+
+def test_token_returns_after_window():
+    bucket = TokenBucket(limit=2, window=10)
+    bucket.consume(0.0)
+    bucket.consume(1.0)
+
+    assert bucket.wait_time(2.0) == pytest.approx(8.0 + WINDOW_MARGIN)
+    assert bucket.wait_time(10.0 + WINDOW_MARGIN) == 0.0     # 첫 token 반환
+    assert len(bucket.spent) == 1
+
+    bucket.consume(10.5)
+    assert bucket.wait_time(10.5) == pytest.approx(0.5 + WINDOW_MARGIN)
+
+
+def test_sync_only_raises_local_count():
+    bucket = TokenBucket(limit=5, window=10)
+    bucket.consume(0.0)
+
+    bucket.sync(4, now=1.0)
+    assert len(bucket.spent) == 4
+    assert bucket.wait_time(1.0) == 0.0
+
+    bucket.sync(2, now=1.0)     # 서버 카운트가 더 적으면 그대로
+    assert len(bucket.spent) == 4
+
+    bucket.sync(5, now=1.0)
+    assert bucket.wait_time(1.0) == pytest.approx(9.0 + WINDOW_MARGIN)
+
+
+def test_block_until_retry_after():
+    bucket = TokenBucket(limit=100, window=1)
+    bucket.block(5.0)
+    bucket.block(3.0)           # 더 짧은 block은 무시
+
+    assert bucket.wait_time(1.0) == pytest.approx(4.0)
+    assert bucket.wait_time(5.0) == 0.0
+
+
+def test_restamp_moves_reserved_token_to_send_time():
+    bucket = TokenBucket(limit=1, window=10)
+    bucket.consume(0.0)
+    bucket.restamp(0.0, 3.0)
+
+    assert list(bucket.spent) == [3.0]
+    assert bucket.wait_time(10.0 + WINDOW_MARGIN) == pytest.approx(3.0)
+
+
+def test_update_replaces_default_limits(clock):
+    limiter = RateLimiter(default_app_limits="20:1", default_method_limits="1:1")
+    limiter.update(HOST, LEAGUE, {
+        "X-App-Rate-Limit": "20:1,100:120",
+        "X-App-Rate-Limit-Count": "1:1,99:120",
+        "X-Method-Rate-Limit": "50:10",
+        "X-Method-Rate-Limit-Count": "1:10",
+    })
+
+    assert set(limiter.app_buckets[HOST]) == {(20, 1.0), (100, 120.0)}
+    assert set(limiter.method_buckets[(HOST, LEAGUE)]) == {(50, 10.0)}
+
+    # 120초 window에 99개 사용 → 1개 남음
+    now = clock.now
+    for b in limiter._buckets_for(HOST, LEAGUE):
+        b.consume(now)
+    assert wait_for(limiter, HOST, LEAGUE, now) == pytest.approx(120.0 + WINDOW_MARGIN)
+
+
+def test_penalize_scope(clock):
+    limiter = RateLimiter(default_app_limits="100:1", default_method_limits="100:1")
+    other_host = "asia.api.riotgames.com"
+    for host, method in [(HOST, LEAGUE), (HOST, MATCHLIST), (other_host, LEAGUE)]:
+        limiter._buckets_for(host, method)
+    now = clock.now
+
+    # method 429 → 해당 (host, method)만
+    limiter.penalize(HOST, LEAGUE, 5, "method")
+    assert wait_for(limiter, HOST, LEAGUE, now) == pytest.approx(5)
+    assert wait_for(limiter, HOST, MATCHLIST, now) == 0.0
+
+    # application 429 → 같은 host의 모든 method, 다른 host는 그대로
+    limiter.penalize(HOST, LEAGUE, 8, "application")
+    assert wait_for(limiter, HOST, MATCHLIST, now) == pytest.approx(8)
+    assert wait_for(limiter, other_host, LEAGUE, now) == 0.0
+
+    # 종류 모름 (service) → app + method 모두
+    limiter.penalize(other_host, LEAGUE, 3)
+    assert wait_for(limiter, other_host, LEAGUE, now) == pytest.approx(3)
+    assert all(b.blocked_until == now + 3 for b in limiter.method_buckets[(other_host, LEAGUE)].values())
+
+
+def test_acquire_waits_per_method():
+    limiter = RateLimiter(default_app_limits="100:1", default_method_limits="2:0.2")
+
+    async def run():
+        sent = {}
+
+        async def call(method, name):
+            await limiter.acquire(HOST, method)
+            sent[name] = time.monotonic()
+
+        start = time.monotonic()
+        await asyncio.gather(
+            call(LEAGUE, "l1"), call(LEAGUE, "l2"), call(LEAGUE, "l3"), call(MATCHLIST, "m1"),
+        )
+        return {name: t - start for name, t in sent.items()}
+
+    sent = asyncio.run(run())
+
+    assert sent["l1"] < 0.05 and sent["l2"] < 0.05
+    assert sent["l3"] >= 0.2                # 3번째 → window 만큼 대기
+    assert sent["m1"] < 0.05                # 다른 method는 기다리지 않음
@@ -0,0 +1,102 @@
+import asyncio
+import random
+import types
+
+import pytest
+
+import src.utils.riot_api.retry as retry
+from src.utils.riot_api.retry import CircuitBreaker, CircuitBreakers, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(retry, "time", clock)
+    monkeypatch.setattr(retry, "asyncio", types.SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def test_retry_statuses():
+    policy = RetryPolicy()
+    assert all(policy.should_retry(s) for s in (500, 502, 503, 504))
+    assert not any(policy.should_retry(s) for s in (200, 404, 429))
+
+
+def test_backoff_is_capped_full_jitter():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    random.seed(0)
+
+    for attempt in range(1, 10):
+        cap = min(4.0, 0.5 * 2 ** (attempt - 1))
+        delays = [policy.delay(attempt) for _ in range(50)]
+        assert all(0 <= d <= cap for d in delays)
+    assert max(policy.delay(10) for _ in range(200)) > 2.0
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=30)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert not breaker.is_open
+
+    breaker.record_success()        # 연속 실패만 집계
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.is_open
+    assert breaker.opened_at == clock.now
+
+
+def test_half_open_probe_then_close(clock):
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=30)
+    breaker.record_failure()
+    opened = clock.now
+
+    async def run():
+        # cooldown 동안 대기 → 끝나면 시험 요청 1개만 통과
+        await breaker.wait()
+        assert clock.now >= opened + 30
+
+        second = asyncio.ensure_future(breaker.wait())
+        await asyncio.sleep(0)
+        assert not second.done()
+
+        breaker.record_success()    # 시험 성공 → close, 대기 중이던 요청도 진행
+        await second
+
+    asyncio.run(run())
+    assert not breaker.is_open
+
+
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=5, cooldown=30)
+    for _ in range(5):
+        breaker.record_failure()
+
+    asyncio.run(breaker.wait())
+    probe_time = clock.now
+
+    breaker.record_failure()        # half-open 시험 실패 → 바로 다시 open
+    assert breaker.is_open
+    assert breaker.opened_at == probe_time
+
+
+def test_breakers_are_per_host():
+    breakers = CircuitBreakers(failure_threshold=1)
+    breakers.get("kr").record_failure()
+
+    assert breakers.get("kr").is_open
+    assert not breakers.get("asia").is_open
+    assert breakers.get("kr") is breakers.get("kr")
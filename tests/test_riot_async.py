@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+import src.utils.riot_api.riot_async as riot_async
+from src.utils.riot_api.rate_limiter import RateLimiter
+from src.utils.riot_api.retry import CircuitBreakers, RetryPolicy
+from src.utils.riot_api.scheduler import RequestScheduler
+from src.utils.riot_api.singleflight import SingleFlight
+
+HOST = "asia.api.riotgames.com"
+TIMELINE = "match-v5.getTimeline"
+LEAGUE = "league-v4.getLeagueEntries"
+
+
+class FakeResponse:
+    headers = {}
+
+    def __init__(self, status=200):
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return {"ok": True}
+
+    async def text(self):
+        return ""
+
+
+class FakeSession:
+    def __init__(self):
+        self.sent = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.sent.append((url, time.monotonic()))
+        return FakeResponse()
+
+
+def test_rate_limit_wait_does_not_hold_scheduler_slots(monkeypatch):
+    scheduler = RequestScheduler(initial_limit=2, target_latency=0.5)
+    limiter = RateLimiter(default_method_limits="10:1")
+    monkeypatch.setattr(riot_async, "SCHEDULER", scheduler)
+    monkeypatch.setattr(riot_async, "RATE_LIMITER", limiter)
+    monkeypatch.setattr(riot_async, "SINGLE_FLIGHT", SingleFlight())
+
+    session = FakeSession()
+
+    async def run():
+        # timeline method가 429로 막힌 상태 (limit 2개 슬롯보다 많은 요청 대기)
+        limiter._buckets_for(HOST, TIMELINE)
+        limiter.penalize(HOST, TIMELINE, 0.6, "method")
+
+        timelines = [
+            asyncio.create_task(riot_async.safe_get_json(session, f"https://{HOST}/t/{i}", method=TIMELINE))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.05)
+
+        start = time.monotonic()
+        league = await riot_async.safe_get_json(session, f"https://{HOST}/league", method=LEAGUE)
+        league_wait = time.monotonic() - start
+
+        await asyncio.gather(*timelines)
+        return league, league_wait
+
+    league, league_wait = asyncio.run(run())
+
+    assert league == {"ok": True}
+    assert league_wait < 0.3                    # 막힌 timeline이 슬롯을 잡고 있지 않음
+    assert scheduler.in_flight == 0
+    assert scheduler.stats["slow"] == 0         # rate limit 대기는 AIMD 지연에 포함 안 됨
+    assert scheduler.limit > 2
+
+
+class StatusSession:
+    """상태 코드 순서대로 응답"""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        return FakeResponse(self.statuses.pop(0))
+
+
+def patch_fetch(monkeypatch, max_attempts=3):
+    monkeypatch.setattr(riot_async, "SCHEDULER", RequestScheduler())
+    monkeypatch.setattr(riot_async, "RATE_LIMITER", RateLimiter(default_method_limits="100:1"))
+    monkeypatch.setattr(riot_async, "SINGLE_FLIGHT", SingleFlight())
+    monkeypatch.setattr(riot_async, "RETRY_POLICY", RetryPolicy(max_attempts=max_attempts, base_delay=0.01))
+    monkeypatch.setattr(riot_async, "CIRCUIT_BREAKERS", CircuitBreakers(failure_threshold=10))
+
+
+def test_server_errors_are_retried_until_success(monkeypatch):
+    patch_fetch(monkeypatch)
+    session = StatusSession([503, 500, 200])
+
+    result = asyncio.run(riot_async.safe_get_json(session, f"https://{HOST}/m/1", method=TIMELINE))
+
+    assert result == {"ok": True}
+    assert session.calls == 3
+    assert riot_async.CIRCUIT_BREAKERS.get(HOST).failures == 0
+
+
+def test_retries_are_bounded_and_client_errors_are_not_retried(monkeypatch):
+    patch_fetch(monkeypatch, max_attempts=2)
+
+    session = StatusSession([502, 502, 502])
+    assert asyncio.run(riot_async.safe_get_json(session, f"https://{HOST}/m/2", method=TIMELINE)) is None
+    assert session.calls == 2
+
+    session = StatusSession([404, 200])
+    assert asyncio.run(riot_async.safe_get_json(session, f"https://{HOST}/m/3", method=TIMELINE)) is None
+    assert session.calls == 1
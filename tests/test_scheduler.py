@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from src.utils.riot_api.scheduler import RequestScheduler, endpoint_class
+
+
+def test_endpoint_class():
+    assert endpoint_class("match-v5.getTimeline") == "timeline"
+    assert endpoint_class("league-v4.getChallengerLeague") == "league"
+    assert endpoint_class("/lol/unknown") == "other"
+
+
+def test_slots_follow_class_weights():
+    scheduler = RequestScheduler(weights={"league": 1, "match": 3}, initial_limit=1)
+
+    async def run():
+        order = []
+        await scheduler.acquire("league")      # 슬롯 1개 점유 → 나머지는 대기열
+
+        async def waiter(cls):
+            await scheduler.acquire(cls)
+            order.append(cls)
+
+        tasks = [asyncio.create_task(waiter("league")) for _ in range(4)]
+        tasks += [asyncio.create_task(waiter("match")) for _ in range(12)]
+        await asyncio.sleep(0)
+
+        for _ in range(len(tasks)):
+            scheduler.release()
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return order
+
+    order = asyncio.run(run())
+
+    # 앞 8개 슬롯 = league 2 : match 6 (weight 1 : 3)
+    assert order[:8].count("league") == 2
+    assert order[:8].count("match") == 6
+    assert scheduler.in_flight == 1
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    scheduler = RequestScheduler(initial_limit=1)
+
+    async def run():
+        await scheduler.acquire("match")
+        task = asyncio.create_task(scheduler.acquire("match"))
+        await asyncio.sleep(0)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        scheduler.release()
+        await asyncio.wait_for(scheduler.acquire("timeline"), 1)
+
+    asyncio.run(run())
+    assert scheduler.in_flight == 1
+
+
+def test_aimd_increase_and_decrease():
+    scheduler = RequestScheduler(initial_limit=4, min_limit=1, max_limit=5, decrease_cooldown=60)
+
+    scheduler.record(200, 0.1)
+    assert scheduler.limit == pytest.approx(4.25)     # + 1 / limit
+
+    scheduler.record(429, 0.1)
+    assert scheduler.limit == pytest.approx(2.125)    # × 0.5
+
+    scheduler.record(429, 0.1)                          # cooldown 안 → 한 번만 감소
+    assert scheduler.limit == pytest.approx(2.125)
+    assert scheduler.stats == {"ok": 1, "throttled": 2, "slow": 0}
+
+    for _ in range(100):
+        scheduler.record(200, 0.1)
+    assert scheduler.limit == 5                         # max_limit
+
+
+def test_slow_response_decreases_to_floor():
+    scheduler = RequestScheduler(initial_limit=2, min_limit=1, target_latency=1.0, decrease_cooldown=0)
+
+    for _ in range(3):
+        scheduler.record(200, 5.0)
+
+    assert scheduler.limit == 1
+    assert scheduler.stats["slow"] == 3
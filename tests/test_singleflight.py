@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.utils.riot_api.singleflight import SingleFlight, request_key
+
+
+def test_request_key_ignores_param_order():
+    assert request_key("u", {"a": 1, "b": 2}) == request_key("u", {"b": "2", "a": "1"})
+    assert request_key("u") == request_key("u", {}) == ("u", ())
+    assert request_key("u", {"a": 1}) != request_key("u", {"a": 2})
+
+
+def test_identical_calls_share_one_request():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return {"key": key}
+
+    async def run():
+        results = await asyncio.gather(
+            *[flight.do("a", fetch, "a") for _ in range(5)],
+            flight.do("b", fetch, "b"),
+        )
+        # 끝난 요청은 다시 보냄
+        again = await flight.do("a", fetch, "a")
+        return results, again
+
+    results, again = asyncio.run(run())
+
+    assert calls == ["a", "b", "a"]
+    assert results[:5] == [{"key": "a"}] * 5
+    assert results[0] is results[4]
+    assert again == {"key": "a"}
+    assert flight.shared == 4
+    assert flight.in_flight == {}
+
+
+def test_errors_are_shared_and_cleared():
+    flight = SingleFlight()
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run():
+        return await asyncio.gather(*[flight.do("k", fail) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.in_flight == {}
+
+
+def test_cancelling_one_waiter_keeps_shared_request():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def run():
+        first = asyncio.ensure_future(flight.do("k", fetch))
+        second = asyncio.ensure_future(flight.do("k", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(run()) == "done"
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import baseline_reference
+from src.analysis.machine_learning import timeline_to_timebins, timeline_wide_to_long
+
+METRICS = ["goldDiff", "killDiff", "dragonDiff"]
+
+
+def make_wide(seed, n_matches=30, max_minutes=40):
+    """경기마다 길이가 다른 wide 테이블 (끝난 뒤 분은 NaN), 일부 matchId는 다른 파일에 한 번 더"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n_matches):
+        length = int(rng.integers(12, max_minutes))
+        row = {"matchId": f"KR_{i:04d}", "tier": "GOLD"}
+        for metric in METRICS:
+            for minute in range(max_minutes + 1):
+                row[f"{metric}_{minute}"] = float(rng.integers(-3000, 3000)) if minute <= length else np.nan
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    # 중복 matchId: 앞쪽 분만 채워진 사본 → groupby first로 합쳐져야 함
+    dup = df.sample(5, random_state=seed).copy()
+    dup.loc[:, [c for c in df.columns if c.endswith(("_30", "_31", "_32"))]] = np.nan
+    dup.iloc[:, 2:] = dup.iloc[:, 2:] + 1
+    # 중간에 빠진 값 (NaN 제외 평균)
+    df.iloc[::4, 15] = np.nan
+    return pd.concat([df.iloc[::-1], dup], ignore_index=True)
+
+
+def _sorted(df, keys):
+    return df.sort_values(keys).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_wide_to_long_matches_baseline(seed):
+    df = make_wide(seed)
+
+    got = _sorted(timeline_wide_to_long(df), ["matchId", "time_min"])
+    expected = _sorted(baseline_reference.timeline_wide_to_long(df), ["matchId", "time_min"])
+
+    pd.testing.assert_frame_equal(got[expected.columns], expected, check_dtype=False)
+
+
+@pytest.mark.parametrize("seed, min_minute, max_minute, bin_size", [
+    (0, 10, 35, 5), (1, 10, 35, 5), (2, 0, 40, 5), (3, 7, 33, 4), (4, 20, 20, 5),
+])
+def test_timebins_match_baseline(seed, min_minute, max_minute, bin_size):
+    df = make_wide(seed)
+
+    got = timeline_to_timebins(df, METRICS, min_minute, max_minute, bin_size)
+    expected = baseline_reference.timeline_to_timebins(df, METRICS, min_minute, max_minute, bin_size)
+
+    pd.testing.assert_frame_equal(
+        _sorted(got, ["matchId", "time_bin"]),
+        _sorted(expected, ["matchId", "time_bin"]),
+        check_dtype=False,
+    )